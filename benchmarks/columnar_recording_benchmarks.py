@@ -0,0 +1,123 @@
+""" Benchmarks of the time taken and space used to save recorded spikes and\
+    membrane voltages as binary columns, against saving them in the PyNN 0.7\
+    format as pickles and as text, using synthetic data.
+
+Run with::
+
+    python -m benchmarks.columnar_recording_benchmarks
+"""
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import numpy
+from six.moves import cPickle as pickle
+from spynnaker.pyNN.models.recording_common import RecordingCommon
+from spynnaker.pyNN.utilities.columnar_recording import (
+    read_columnar_recording, write_columnar_recording)
+from .connector_benchmarks import measure
+
+_N_NEURONS = 1000
+_N_TIMESTEPS = 2000
+_SPIKE_PROBABILITY = 0.05
+_N_ROWS_PER_CHUNK = 100
+_SLICE_SIZE = 256
+
+
+def _spikes():
+    """ The neuron IDs and timesteps of the spikes of each slice of neurons
+    """
+    rng = numpy.random.RandomState(0)
+    columns = list()
+    for lo_atom in range(0, _N_NEURONS, _SLICE_SIZE):
+        n_atoms = min(_SLICE_SIZE, _N_NEURONS - lo_atom)
+        ids, ticks = numpy.nonzero(
+            rng.uniform(size=(n_atoms, _N_TIMESTEPS)) < _SPIKE_PROBABILITY)
+        columns.append((ids + lo_atom, ticks))
+    return columns
+
+
+def _voltages():
+    return numpy.random.RandomState(1).uniform(
+        -70.0, -50.0, (_N_TIMESTEPS, _N_NEURONS))
+
+
+def _write_columnar(directory, spikes, voltages):
+    chunks = (
+        voltages[row:row + _N_ROWS_PER_CHUNK]
+        for row in range(0, len(voltages), _N_ROWS_PER_CHUNK))
+    write_columnar_recording(
+        directory, "benchmark", 1000, spike_columns=iter(spikes),
+        signals={"v": (chunks, range(_N_NEURONS), 1.0)})
+
+
+def _read_columnar(directory):
+    recording = read_columnar_recording(directory)
+    return (
+        int(recording["spikes"]["tick"].sum()),
+        float(recording["signals"]["v"]["data"].sum()))
+
+
+def _pynn7(spikes, voltages):
+    ids = numpy.concatenate([vertex_ids for vertex_ids, _ in spikes])
+    ticks = numpy.concatenate([vertex_ticks for _, vertex_ticks in spikes])
+    return (
+        numpy.column_stack((ids, ticks.astype("float"))),
+        RecordingCommon.pynn7_format(voltages, range(_N_NEURONS), 1.0))
+
+
+def _write_pickle(directory, spikes, voltages):
+    with open(os.path.join(directory, "recording.pickle"), "wb") as f:
+        pickle.dump(_pynn7(spikes, voltages), f, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_pickle(directory):
+    with open(os.path.join(directory, "recording.pickle"), "rb") as f:
+        spikes, voltages = pickle.load(f)
+    return int(spikes[:, 1].sum()), float(voltages[:, 2].sum())
+
+
+def _write_text(directory, spikes, voltages):
+    spikes, voltages = _pynn7(spikes, voltages)
+    numpy.savetxt(os.path.join(directory, "spikes.txt"), spikes)
+    numpy.savetxt(os.path.join(directory, "v.txt"), voltages)
+
+
+def _read_text(directory):
+    spikes = numpy.loadtxt(os.path.join(directory, "spikes.txt"))
+    voltages = numpy.loadtxt(os.path.join(directory, "v.txt"))
+    return int(spikes[:, 1].sum()), float(voltages[:, 2].sum())
+
+
+def _size(directory):
+    return sum(
+        os.path.getsize(os.path.join(directory, filename))
+        for filename in os.listdir(directory))
+
+
+def run():
+    spikes = _spikes()
+    voltages = _voltages()
+    n_spikes = sum(len(ids) for ids, _ in spikes)
+    print("{} spikes and {} voltage samples".format(n_spikes, voltages.size))
+    print("{:<10} {:>10} {:>14} {:>10} {:>14} {:>12}".format(
+        "format", "write (s)", "write peak", "read (s)", "read peak",
+        "size (bytes)"))
+    for name, write, read in (
+            ("columnar", _write_columnar, _read_columnar),
+            ("pickle", _write_pickle, _read_pickle),
+            ("text", _write_text, _read_text)):
+        directory = tempfile.mkdtemp()
+        try:
+            _, write_time, write_peak = measure(
+                write, directory, spikes, voltages)
+            _, read_time, read_peak = measure(read, directory)
+            print("{:<10} {:>10.4f} {:>14} {:>10.4f} {:>14} {:>12}".format(
+                name, write_time, write_peak, read_time, read_peak,
+                _size(directory)))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    run()
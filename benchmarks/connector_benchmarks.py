@@ -0,0 +1,465 @@
+""" Benchmarks of the time and peak memory taken by connectors to create\
+    synaptic blocks, using mocks so that no machine is needed.
+
+Each case makes the first block of a projection between two populations of\
+the same size, split into slices of the same size, including any work done\
+for the whole projection before the blocks are made.  Cases that a\
+connector does not support, or that would need too much memory, are left\
+out; cases that fail are recorded with their error, and fail the run, so\
+that results with failed cases are not taken as a baseline unnoticed.
+
+Run with::
+
+    python -m benchmarks.connector_benchmarks [--quick] [--output FILE]
+
+and compare with the results of an earlier run, failing if any case has\
+become slower or used more memory by more than the tolerance, with::
+
+    python -m benchmarks.connector_benchmarks --compare FILE [--tolerance 1.5]
+"""
+from __future__ import print_function
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, ArrayConnector, CSAConnector,
+    DistanceDependentProbabilityConnector, FixedNumberPostConnector,
+    FixedNumberPreConnector, FixedProbabilityConnector, FromFileConnector,
+    FromListConnector, IndexBasedProbabilityConnector, MultapseConnector,
+    OneToOneConnector, SmallWorldConnector)
+from unittests.mocks import (
+    MockSimulator, MockPopulation, MockRandomDistribution, MockSpace)
+
+# tracemalloc is only available in Python 3
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+POPULATION_SIZES = [1000, 10000, 100000, 1000000]
+SLICE_SIZES = [64, 256, 1024]
+PROBABILITIES = [0.01, 0.1]
+VALUE_TYPES = ["scalar", "list", "random", "distance"]
+
+# The grid used by --quick
+QUICK_POPULATION_SIZES = [1000, 10000]
+QUICK_SLICE_SIZES = [256]
+
+# The most values to put in a list of weights or delays, or of connections
+_MAX_LIST_SIZE = 10 ** 7
+
+# The number of connections made to or from each neuron by the connectors
+# that make a fixed number
+_N_PER_NEURON = 10
+
+# The time step of the projections in microseconds
+_MACHINE_TIME_STEP = 1000
+
+
+def measure(function, *args):
+    """ Call a function, measuring the time and peak memory it takes.
+
+    :return: The result, the time taken in seconds, and the peak memory\
+        allocated in bytes (or None if memory can't be traced)
+    """
+    if tracemalloc is not None:
+        tracemalloc.start()
+    start = time.time()
+    result = function(*args)
+    elapsed = time.time() - start
+    peak = None
+    if tracemalloc is not None:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+class _NumpyFileConnector(FromFileConnector):
+    """ Reads its connections from a file saved by numpy
+    """
+    __slots__ = []
+
+    class _Reader(object):
+        def __init__(self, filename):
+            self._filename = filename
+
+        def read(self):
+            return numpy.load(self._filename)
+
+        def close(self):
+            pass
+
+    def get_reader(self, file):  # @ReservedAssignment
+        return self._Reader(file)
+
+
+class _MultinomialMultapseConnector(MultapseConnector):
+    """ Spreads its synapses over the blocks as the PyNN version does
+    """
+    __slots__ = []
+
+    def get_rng_next(self, num_synapses, prob_connect):
+        return numpy.random.RandomState(num_synapses).multinomial(
+            num_synapses, prob_connect)
+
+
+def _random_pairs(n_neurons):
+    """ Get _N_PER_NEURON random (pre, post) pairs for each neuron
+    """
+    rng = numpy.random.RandomState(n_neurons)
+    return rng.randint(
+        0, n_neurons, size=(n_neurons * _N_PER_NEURON, 2)).astype("float64")
+
+
+def _from_file(n_neurons, _probability, directory):
+    filename = os.path.join(directory, "connections_{}.npy".format(n_neurons))
+    numpy.save(filename, _random_pairs(n_neurons))
+    return _NumpyFileConnector(filename)
+
+
+def _csa(_n_neurons, probability, _directory):
+    import csa
+    return CSAConnector(csa.random(probability))
+
+
+class ConnectorBenchmark(object):
+    """ How to benchmark one type of connector
+    """
+
+    __slots__ = [
+        "_name", "_create", "_uses_probability", "_max_n_neurons",
+        "_n_list_values", "_allows_expressions", "_uses_space"]
+
+    def __init__(self, name, create, uses_probability=False,
+                 max_n_neurons=max(POPULATION_SIZES), n_list_values=None,
+                 allows_expressions=False, uses_space=False):
+        """
+        :param name: The name of the connector
+        :param create: \
+            A function of (number of neurons, probability, directory for\
+            files) that makes the connector
+        :param uses_probability: \
+            Whether the connector is made with each probability
+        :param max_n_neurons: \
+            The most neurons that the connector can connect with the memory\
+            it needs
+        :param n_list_values: \
+            A function of the number of neurons giving the number of values\
+            needed in a list of weights or delays, or None if the connector\
+            doesn't support lists
+        :param allows_expressions: \
+            Whether the connector supports weights and delays that are\
+            expressions of the distance between neurons
+        :param uses_space: Whether the connector needs a space
+        """
+        # pylint: disable=too-many-arguments
+        self._name = name
+        self._create = create
+        self._uses_probability = uses_probability
+        self._max_n_neurons = max_n_neurons
+        self._n_list_values = n_list_values
+        self._allows_expressions = allows_expressions
+        self._uses_space = uses_space
+
+    @property
+    def name(self):
+        return self._name
+
+    def get_cases(self, population_sizes, slice_sizes, probabilities,
+                  value_types):
+        """ Get the (number of neurons, slice size, probability, value type)\
+            of each case of the connector
+        """
+        for n_neurons in population_sizes:
+            if n_neurons > self._max_n_neurons:
+                continue
+            for slice_size in slice_sizes:
+                if slice_size > n_neurons:
+                    continue
+                for probability in (
+                        probabilities if self._uses_probability else [None]):
+                    for value_type in value_types:
+                        if self._supports(n_neurons, value_type):
+                            yield n_neurons, slice_size, probability, \
+                                value_type
+
+    def _supports(self, n_neurons, value_type):
+        if value_type == "distance":
+            return self._allows_expressions
+        if value_type == "list":
+            return (self._n_list_values is not None and
+                    self._n_list_values(n_neurons) <= _MAX_LIST_SIZE)
+        return True
+
+    def run(self, n_neurons, slice_size, probability, value_type, directory):
+        """ Measure the making of the first block of a projection.
+
+        :return: The number of connections, the time taken in seconds, and\
+            the peak memory allocated in bytes
+        """
+        # pylint: disable=too-many-arguments
+        connector = self._create(n_neurons, probability, directory)
+        pre_population = MockPopulation(n_neurons, "Pre")
+        post_population = MockPopulation(n_neurons, "Post")
+        if self._uses_space or value_type == "distance":
+            connector.set_space(MockSpace())
+        connector.set_projection_information(
+            pre_population=pre_population, post_population=post_population,
+            rng=None, machine_time_step=_MACHINE_TIME_STEP)
+        connector.set_weights_and_delays(*_get_weights_and_delays(
+            value_type, self._n_list_values, n_neurons))
+        slices = [
+            Slice(lo, min(lo + slice_size, n_neurons) - 1)
+            for lo in range(0, n_neurons, slice_size)]
+        return measure(_make_first_block, connector, slices)
+
+
+def _get_weights_and_delays(value_type, n_list_values, n_neurons):
+    if value_type == "scalar":
+        return 1.5, 2.0
+    if value_type == "list":
+        n_values = n_list_values(n_neurons)
+        return (numpy.linspace(0.5, 2.0, n_values),
+                numpy.linspace(1.0, 10.0, n_values))
+    if value_type == "random":
+        return (MockRandomDistribution(0.5, 2.0),
+                MockRandomDistribution(1.0, 10.0))
+    if value_type == "distance":
+        return "0.5 + (d * 0.01)", "1.0 + (d * 0.1)"
+    raise ValueError("Unknown value type {}".format(value_type))
+
+
+def _make_first_block(connector, slices):
+    connector.prepare_synaptic_blocks(slices, slices)
+    block = connector.create_synaptic_block(
+        slices, 0, slices, 0, slices[0], slices[0], 0)
+    return len(block)
+
+
+BENCHMARKS = [
+    ConnectorBenchmark(
+        "AllToAllConnector",
+        lambda n, p, d: AllToAllConnector(),
+        n_list_values=lambda n: n * n, allows_expressions=True),
+    ConnectorBenchmark(
+        "AllToAllConnector(allow_self_connections=False)",
+        lambda n, p, d: AllToAllConnector(allow_self_connections=False)),
+    ConnectorBenchmark(
+        "ArrayConnector",
+        lambda n, p, d: ArrayConnector(
+            numpy.random.RandomState(n).uniform(size=(n, n)) < p),
+        uses_probability=True, max_n_neurons=10000),
+    ConnectorBenchmark(
+        "CSAConnector(random)", _csa, uses_probability=True,
+        max_n_neurons=10000),
+    ConnectorBenchmark(
+        "DistanceDependentProbabilityConnector",
+        lambda n, p, d: DistanceDependentProbabilityConnector(
+            "exp(-d / 10.0)"),
+        max_n_neurons=10000, uses_space=True),
+    ConnectorBenchmark(
+        "FixedNumberPostConnector",
+        lambda n, p, d: FixedNumberPostConnector(_N_PER_NEURON)),
+    ConnectorBenchmark(
+        "FixedNumberPreConnector",
+        lambda n, p, d: FixedNumberPreConnector(_N_PER_NEURON)),
+    ConnectorBenchmark(
+        "FixedProbabilityConnector",
+        lambda n, p, d: FixedProbabilityConnector(p),
+        uses_probability=True),
+    ConnectorBenchmark(
+        "FromFileConnector", _from_file, max_n_neurons=100000),
+    ConnectorBenchmark(
+        "FromListConnector",
+        lambda n, p, d: FromListConnector(_random_pairs(n)),
+        max_n_neurons=100000, n_list_values=lambda n: n * _N_PER_NEURON),
+    ConnectorBenchmark(
+        "IndexBasedProbabilityConnector",
+        lambda n, p, d: IndexBasedProbabilityConnector(
+            "{} * exp(-abs(i - j) / 100.0)".format(p)),
+        uses_probability=True),
+    ConnectorBenchmark(
+        "MultapseConnector",
+        lambda n, p, d: _MultinomialMultapseConnector(n * _N_PER_NEURON)),
+    ConnectorBenchmark(
+        "OneToOneConnector",
+        lambda n, p, d: OneToOneConnector(None),
+        n_list_values=lambda n: n, allows_expressions=True),
+    ConnectorBenchmark(
+        "SmallWorldConnector",
+        lambda n, p, d: SmallWorldConnector(degree=2.0, rewiring=0.1),
+        max_n_neurons=10000, uses_space=True)]
+
+
+def case_id(name, n_neurons, slice_size, probability, value_type):
+    """ Get the identifier of a case, by which cases are compared
+    """
+    # pylint: disable=too-many-arguments
+    return "{}/n={}/slice={}/p={}/{}".format(
+        name, n_neurons, slice_size, probability, value_type)
+
+
+def run(population_sizes=POPULATION_SIZES, slice_sizes=SLICE_SIZES,
+        probabilities=PROBABILITIES, value_types=VALUE_TYPES,
+        connector_names=None):
+    """ Run the benchmarks, printing the results as they are made
+
+    :param connector_names: \
+        The names of the connectors to benchmark, or None for all of them
+    :return: The results of the cases
+    :rtype: list of dict
+    """
+    # pylint: disable=too-many-arguments
+    MockSimulator.setup()
+    results = list()
+    directory = tempfile.mkdtemp()
+    print("{:<50} {:>8} {:>6} {:>6} {:>9} {:>12} {:>10} {:>12}".format(
+        "connector", "neurons", "slice", "p", "values", "connections",
+        "time (s)", "peak (bytes)"))
+    try:
+        for benchmark in BENCHMARKS:
+            if (connector_names is not None and
+                    benchmark.name not in connector_names):
+                continue
+            for n_neurons, slice_size, probability, value_type in \
+                    benchmark.get_cases(
+                        population_sizes, slice_sizes, probabilities,
+                        value_types):
+                result = {
+                    "id": case_id(
+                        benchmark.name, n_neurons, slice_size, probability,
+                        value_type),
+                    "connector": benchmark.name, "n_neurons": n_neurons,
+                    "slice_size": slice_size, "probability": probability,
+                    "values": value_type, "n_connections": None,
+                    "time": None, "peak_memory": None, "error": None}
+                try:
+                    (result["n_connections"], result["time"],
+                     result["peak_memory"]) = benchmark.run(
+                        n_neurons, slice_size, probability, value_type,
+                        directory)
+                except Exception as e:  # pylint: disable=broad-except
+                    if tracemalloc is not None and tracemalloc.is_tracing():
+                        tracemalloc.stop()
+                    result["error"] = "{}: {}".format(type(e).__name__, e)
+                results.append(result)
+                _print_result(result)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def _print_result(result):
+    if result["error"] is not None:
+        outcome = "failed: {}".format(result["error"])
+    else:
+        outcome = "{:>12} {:>10.4f} {:>12}".format(
+            result["n_connections"], result["time"], result["peak_memory"])
+    print("{:<50} {:>8} {:>6} {:>6} {:>9} {}".format(
+        result["connector"], result["n_neurons"], result["slice_size"],
+        str(result["probability"]), result["values"], outcome))
+    sys.stdout.flush()
+
+
+def write_results(results, filename):
+    """ Write results to a JSON file, with details of where they were made
+    """
+    with open(filename, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "machine": platform.machine(),
+            "results": results}, f, indent=2)
+
+
+def read_results(filename):
+    """ Read the results from a JSON file written by :py:func:`write_results`
+    """
+    with open(filename) as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline, results, tolerance=1.5, min_time=0.01):
+    """ Find the cases that have got worse since the baseline.
+
+    :param baseline: The results of an earlier run
+    :param results: The results of this run
+    :param tolerance: \
+        The ratio of the new to the old time or peak memory above which a\
+        case has got worse
+    :param min_time: \
+        The time in seconds below which times are too noisy to compare
+    :return: A description of each case that has got worse
+    :rtype: list of str
+    """
+    old_results = {result["id"]: result for result in baseline}
+    regressions = list()
+    for result in results:
+        old = old_results.get(result["id"])
+        if old is None or old["error"] is not None:
+            continue
+        if result["error"] is not None:
+            regressions.append("{}: now fails with {}".format(
+                result["id"], result["error"]))
+            continue
+        if (max(old["time"], result["time"]) >= min_time and
+                result["time"] > old["time"] * tolerance):
+            regressions.append("{}: time {:.4f}s, was {:.4f}s".format(
+                result["id"], result["time"], old["time"]))
+        if (old["peak_memory"] and result["peak_memory"] and
+                result["peak_memory"] > old["peak_memory"] * tolerance):
+            regressions.append("{}: peak memory {} bytes, was {}".format(
+                result["id"], result["peak_memory"], old["peak_memory"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the creation of synaptic blocks")
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="only run the smaller populations and one slice size")
+    parser.add_argument(
+        "--connector", action="append", dest="connectors",
+        help="the name of a connector to benchmark; may be repeated")
+    parser.add_argument(
+        "--values", action="append", choices=VALUE_TYPES,
+        help="the type of weights and delays to use; may be repeated")
+    parser.add_argument(
+        "--output", help="the JSON file to write the results to")
+    parser.add_argument(
+        "--compare", help="the JSON file of results to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5,
+        help="the ratio of time or memory taken as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(
+        QUICK_POPULATION_SIZES if args.quick else POPULATION_SIZES,
+        QUICK_SLICE_SIZES if args.quick else SLICE_SIZES,
+        PROBABILITIES, args.values or VALUE_TYPES, args.connectors)
+    if args.output is not None:
+        write_results(results, args.output)
+    failures = [result for result in results if result["error"] is not None]
+    for result in failures:
+        print("Failed: {}: {}".format(result["id"], result["error"]))
+    if args.compare is not None:
+        regressions = compare_results(
+            read_results(args.compare), results, args.tolerance)
+        for regression in regressions:
+            print("Regression: {}".format(regression))
+        if regressions:
+            return 1
+        print("No regressions against {}".format(args.compare))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+""" Benchmarks of the conversion of neuron parameters to fixed point, value\
+    by value and as whole arrays, and of the packing of the parameters of a\
+    population with random values, using mocks so that no machine is needed.
+
+Run with::
+
+    python -m benchmarks.neuron_parameter_benchmarks
+"""
+from __future__ import print_function
+import numpy
+from data_specification.enums import DataType
+from spynnaker.pyNN.models.neuron.implementations import Struct
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_to_array)
+from unittests.mocks import MockSimulator, MockRandomDistribution
+from .connector_benchmarks import measure
+
+_N_NEURONS = [1000, 10000, 100000]
+_SLICE_SIZE = 256
+
+
+def _convert_each(values, data_type):
+    return [convert_to(value, data_type) for value in values]
+
+
+def _pack(n_neurons):
+    """ Set random parameters of a population and pack them for each of its\
+        vertex slices
+    """
+    struct = Struct([DataType.S1615, DataType.S1615, DataType.U032])
+    v_init = SpynnakerRangedList(
+        n_neurons, MockRandomDistribution(-70.0, -50.0))
+    tau_m = SpynnakerRangedList(n_neurons, MockRandomDistribution(10.0, 30.0))
+    decay = numpy.linspace(0.0, 0.99, n_neurons)
+    for lo_atom in range(0, n_neurons, _SLICE_SIZE):
+        struct.get_data(
+            [v_init, tau_m, decay], lo_atom,
+            min(_SLICE_SIZE, n_neurons - lo_atom))
+
+
+def run():
+    MockSimulator.setup()
+    print("{:<20} {:>8} {:>10} {:>12}".format(
+        "benchmark", "neurons", "time (s)", "peak (bytes)"))
+    for n_neurons in _N_NEURONS:
+        values = numpy.random.RandomState(n_neurons).uniform(
+            -70.0, -50.0, n_neurons)
+        for name, function, args in (
+                ("convert each", _convert_each, (values, DataType.S1615)),
+                ("convert array", convert_to_array,
+                 (values, DataType.S1615)),
+                ("pack random struct", _pack, (n_neurons, ))):
+            _, elapsed, peak = measure(function, *args)
+            print("{:<20} {:>8} {:>10.4f} {:>12}".format(
+                name, n_neurons, elapsed, peak))
+
+
+if __name__ == "__main__":
+    run()
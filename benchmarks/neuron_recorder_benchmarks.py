@@ -0,0 +1,90 @@
+""" Benchmarks of the time taken by the neuron recorder to set up the\
+    recording of half the neurons of populations of increasing size, and of\
+    the decoding of sparse spike recordings, using mocks so that no machine\
+    is needed.
+
+Run with::
+
+    python -m benchmarks.neuron_recorder_benchmarks
+"""
+from __future__ import print_function
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.common import NeuronRecorder, recording_utils
+from unittests.mocks import MockSimulator
+from .connector_benchmarks import measure
+
+_N_NEURONS = [1000, 10000, 100000, 1000000]
+_SLICE_SIZE = 256
+_N_TIMESTEPS = 1000
+_SPIKE_PROBABILITY = 0.001
+
+
+def _set_recording(n_neurons):
+    recorder = NeuronRecorder(["spikes", "v"], n_neurons)
+    recorder.set_recording("spikes", True, indexes=range(0, n_neurons, 2))
+    recorder.set_recording("v", True, indexes=range(0, n_neurons, 2))
+
+    # Turn some off again, leaving half recording
+    recorder.set_recording("v", True, indexes=range(1, n_neurons, 4))
+    recorder.set_recording("v", False, indexes=range(1, n_neurons, 4))
+    return recorder
+
+
+def _get_slice_data(recorder, slices):
+    for vertex_slice in slices:
+        recorder.get_buffered_sdram_per_timestep("spikes", vertex_slice)
+        recorder.get_buffered_sdram_per_timestep("v", vertex_slice)
+        recorder.get_data(vertex_slice)
+
+
+def _sparse_spikes(n_neurons):
+    """ Spike words of a vertex of n_neurons neurons over _N_TIMESTEPS\
+        timesteps where few neurons spike in each
+    """
+    n_words = (n_neurons + 31) // 32
+    words = numpy.zeros((_N_TIMESTEPS, n_words), dtype="uint32")
+    rng = numpy.random.RandomState(n_neurons)
+    n_spikes = int(n_neurons * _N_TIMESTEPS * _SPIKE_PROBABILITY)
+    rows = rng.randint(0, _N_TIMESTEPS, n_spikes)
+    neurons = rng.randint(0, n_neurons, n_spikes)
+    numpy.bitwise_or.at(
+        words, (rows, neurons // 32),
+        numpy.left_shift(1, neurons % 32).astype("uint32"))
+    return words
+
+
+def _unpack_spikes(words):
+    """ Find the spikes by unpacking every bit of every word
+    """
+    bits = numpy.fliplr(numpy.unpackbits(
+        words.astype(">u4").view("uint8")).reshape((-1, 32))).reshape(
+            (len(words), -1))
+    return numpy.nonzero(bits)
+
+
+def run():
+    MockSimulator.setup()
+    print("{:<20} {:>8} {:>10} {:>12}".format(
+        "benchmark", "neurons", "time (s)", "peak (bytes)"))
+    for n_neurons in _N_NEURONS:
+        slices = [
+            Slice(lo, min(lo + _SLICE_SIZE, n_neurons) - 1)
+            for lo in range(0, n_neurons, _SLICE_SIZE)]
+        recorder, elapsed, peak = measure(_set_recording, n_neurons)
+        print("{:<20} {:>8} {:>10.4f} {:>12}".format(
+            "set recording", n_neurons, elapsed, peak))
+        _, elapsed, peak = measure(_get_slice_data, recorder, slices)
+        print("{:<20} {:>8} {:>10.4f} {:>12}".format(
+            "get slice data", n_neurons, elapsed, peak))
+        words = _sparse_spikes(n_neurons)
+        for name, function in (
+                ("unpack spikes", _unpack_spikes),
+                ("find set bits", recording_utils.find_set_bits)):
+            _, elapsed, peak = measure(function, words)
+            print("{:<20} {:>8} {:>10.4f} {:>12}".format(
+                name, n_neurons, elapsed, peak))
+
+
+if __name__ == "__main__":
+    run()
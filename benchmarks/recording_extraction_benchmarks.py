@@ -0,0 +1,118 @@
+""" Benchmarks of the time taken to decode the spikes recorded by the cores\
+    of a population, with increasing numbers of worker processes, using\
+    synthetic recorded data so that no machine is needed.
+
+Run with::
+
+    python -m benchmarks.recording_extraction_benchmarks
+"""
+from __future__ import print_function
+import multiprocessing
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.common import (
+    NeuronRecorder, RecordingExtractionScheduler)
+from unittests.mocks import MockSimulator
+from .connector_benchmarks import measure
+
+_N_VERTICES = 32
+_SLICE_SIZE = 256
+_N_TIMESTEPS = 5000
+_SPIKE_PROBABILITY = 0.01
+_BYTES_IN_FLIGHT = 64 * 1024 * 1024
+
+
+class _Placement(object):
+    def __init__(self, vertex):
+        self.x = 0
+        self.y = 0
+        self.p = vertex
+
+
+class _Placements(object):
+    def get_placement_of_vertex(self, vertex):
+        return _Placement(vertex)
+
+
+class _GraphMapper(object):
+    def get_machine_vertices(self, application_vertex):
+        return range(_N_VERTICES)
+
+    def get_slice(self, vertex):
+        return Slice(vertex * _SLICE_SIZE, (vertex + 1) * _SLICE_SIZE - 1)
+
+
+class _Data(object):
+    def __init__(self, data):
+        self._data = data
+        self._offset = 0
+
+    def read_all(self):
+        return self._data
+
+    def seek_read(self, offset):
+        self._offset = offset
+
+    def read(self, n_bytes):
+        data = self._data[self._offset:self._offset + n_bytes]
+        self._offset += len(data)
+        return data
+
+
+class _BufferManager(object):
+    def __init__(self, data):
+        self._data = data
+
+    def get_data_for_vertex(self, placement, region):
+        return _Data(self._data[placement.p]), False
+
+
+def _records(values):
+    """ The bytes of records of the values of each timestep
+    """
+    return bytearray(numpy.column_stack((
+        numpy.arange(_N_TIMESTEPS, dtype="uint32"),
+        values.astype("uint32"))).astype("<u4").tobytes())
+
+
+def _recorded_spikes():
+    """ The spikes recorded by each vertex
+    """
+    rng = numpy.random.RandomState(0)
+    spikes = list()
+    for _ in range(_N_VERTICES):
+        bits = rng.uniform(size=(_N_TIMESTEPS, _SLICE_SIZE)) < (
+            _SPIKE_PROBABILITY)
+        words = numpy.packbits(
+            bits.reshape((-1, 32))[:, ::-1], axis=1).view(">u4").reshape(
+                (_N_TIMESTEPS, -1))
+        spikes.append(_records(words))
+    return _BufferManager(spikes)
+
+
+def _recorder(n_processes):
+    recorder = NeuronRecorder(
+        ["spikes"], _N_VERTICES * _SLICE_SIZE,
+        RecordingExtractionScheduler(n_processes, _BYTES_IN_FLIGHT))
+    recorder.set_recording("spikes", True)
+    return recorder
+
+
+def run():
+    MockSimulator.setup()
+    spikes = _recorded_spikes()
+    n_processes_list = sorted(set(
+        [1, 2, 4, multiprocessing.cpu_count()]))
+    print("{:<20} {:>9} {:>10} {:>12}".format(
+        "benchmark", "processes", "time (s)", "peak (bytes)"))
+    for n_processes in n_processes_list:
+        recorder = _recorder(n_processes)
+        _, elapsed, peak = measure(
+            recorder.get_spikes, "benchmark", spikes, 0, _Placements(),
+            _GraphMapper(), None, 1000)
+        print("{:<20} {:>9} {:>10.4f} {:>12}".format(
+            "get spikes", n_processes, elapsed, peak))
+
+
+if __name__ == "__main__":
+    run()
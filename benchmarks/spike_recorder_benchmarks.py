@@ -0,0 +1,216 @@
+""" Benchmarks of the time taken to decode the spikes recorded by spike\
+    sources, in the multi-spike and EIEIO formats, record by record and in\
+    bulk, of getting the spikes after each of a number of runs, and of\
+    sorting spikes as times and as timesteps, using synthetic recorded data.
+
+Run with::
+
+    python -m benchmarks.spike_recorder_benchmarks
+"""
+from __future__ import print_function
+import struct
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spinn_storage_handlers import BufferedBytearrayDataStorage
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
+from spynnaker.pyNN.models.common import (
+    EIEIOSpikeRecorder, MultiSpikeRecorder, recording_utils)
+from .connector_benchmarks import measure
+
+_N_RECORDS = [1000, 10000, 100000]
+_N_RUNS = 20
+_N_SORTED_SPIKES = [100000, 1000000, 10000000]
+_SLICE = Slice(0, 255)
+_N_WORDS = 8
+_BASE_KEY = 0x10000
+_TWO_WORDS = struct.Struct("<II")
+_ONE_WORD = struct.Struct("<I")
+
+
+def _multi_spike_data(n_records):
+    rng = numpy.random.RandomState(0)
+    n_blocks = rng.randint(1, 4, n_records)
+    data = bytearray()
+    for time, blocks in enumerate(n_blocks):
+        words = numpy.zeros(blocks * _N_WORDS, dtype="<u4")
+        spikes = rng.randint(0, _N_WORDS * 32, blocks * 4)
+        numpy.bitwise_or.at(
+            words, spikes // 32, numpy.left_shift(1, spikes % 32).astype(
+                "uint32"))
+        data += _TWO_WORDS.pack(time, blocks) + words.tobytes()
+    return data
+
+
+def _eieio_data(n_records):
+    rng = numpy.random.RandomState(0)
+    data = bytearray()
+    for time in range(n_records):
+        keys = _BASE_KEY + rng.randint(0, _SLICE.n_atoms, rng.randint(1, 20))
+        header = EIEIODataHeader(EIEIOType.KEY_32_BIT, count=len(keys))
+        key_bytes = keys.astype("<u4").tobytes()
+        data += _TWO_WORDS.pack(
+            len(header.bytestring) + len(key_bytes), time)
+        data += header.bytestring + key_bytes
+    return data
+
+
+def _multi_spike_per_record(raw_data, ms_per_tick):
+    """ Decode the multi-spike format a record at a time, unpacking every bit
+    """
+    spike_ids = list()
+    spike_times = list()
+    n_bytes_per_block = _N_WORDS * 4
+    offset = 0
+    while offset < len(raw_data):
+        time, n_blocks = _TWO_WORDS.unpack_from(raw_data, offset)
+        offset += _TWO_WORDS.size
+        spike_data = numpy.frombuffer(
+            raw_data, dtype="uint8",
+            count=n_bytes_per_block * n_blocks, offset=offset)
+        offset += n_bytes_per_block * n_blocks
+
+        spikes = spike_data.view("<i4").byteswap().view("uint8")
+        bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
+            (-1, 32))).reshape((-1, n_bytes_per_block * 8))
+        indices = numpy.nonzero(bits)[1]
+        times = numpy.repeat([time * ms_per_tick], len(indices))
+        spike_ids.append(indices + _SLICE.lo_atom)
+        spike_times.append(times)
+    return spike_ids, spike_times
+
+
+def _multi_spike_bulk(raw_data, ms_per_tick):
+    # pylint: disable=unused-argument
+    spike_ids = list()
+    spike_ticks = list()
+    MultiSpikeRecorder._process_spike_data(
+        _SLICE, _N_WORDS, raw_data, spike_ids, spike_ticks)
+    return spike_ids, spike_ticks
+
+
+def _eieio_per_record(spike_data, ms_per_tick):
+    """ Decode the EIEIO format a packet at a time, decoding each header
+    """
+    results = list()
+    offset = 0
+    while offset < len(spike_data):
+        length = _ONE_WORD.unpack_from(spike_data, offset)[0]
+        time = _ONE_WORD.unpack_from(spike_data, offset + 4)[0]
+        time *= ms_per_tick
+        data_offset = offset + 8
+        eieio_header = EIEIODataHeader.from_bytestring(
+            spike_data, data_offset)
+        data_offset += eieio_header.size
+        timestamps = numpy.repeat([time], eieio_header.count)
+        keys = numpy.frombuffer(
+            spike_data, dtype="<u{}".format(
+                eieio_header.eieio_type.key_bytes),
+            count=eieio_header.count, offset=data_offset)
+        neuron_ids = (keys - _BASE_KEY) + _SLICE.lo_atom
+        offset += length + 8
+        results.append(numpy.dstack((neuron_ids, timestamps))[0])
+    return results
+
+
+def _eieio_bulk(spike_data, ms_per_tick):
+    # pylint: disable=unused-argument
+    results = list()
+    EIEIOSpikeRecorder._process_spike_data(
+        _SLICE, spike_data, _BASE_KEY, results)
+    return results
+
+
+class _Placement(object):
+    x = 0
+    y = 0
+    p = 1
+
+
+class _Placements(object):
+    def get_placement_of_vertex(self, vertex):
+        return _Placement()
+
+
+class _GraphMapper(object):
+    def get_machine_vertices(self, application_vertex):
+        return [None]
+
+    def get_slice(self, vertex):
+        return _SLICE
+
+
+class _BufferManager(object):
+    def __init__(self):
+        self.storage = BufferedBytearrayDataStorage()
+
+    def get_data_for_vertex(self, placement, region):
+        return (self.storage, False)
+
+
+def _get_after_each_run(raw_data, decode_all):
+    """ Get the spikes after each of a number of runs that each add an equal\
+        part of the data, decoding all the data each time if decode_all
+    """
+    recorder = MultiSpikeRecorder()
+    buffer_manager = _BufferManager()
+    run_size = len(raw_data) // _N_RUNS
+    for i in range(_N_RUNS):
+        buffer_manager.storage.write(
+            raw_data[i * run_size:(i + 1) * run_size])
+        if decode_all:
+            recorder.reset_extraction_cursors()
+        recorder.get_spikes(
+            "bench", buffer_manager, 0, _Placements(), _GraphMapper(), None,
+            1000)
+
+
+def _random_spike_ticks(n_spikes):
+    rng = numpy.random.RandomState(n_spikes)
+    return (rng.randint(0, 100000, n_spikes).astype("uint32"),
+            rng.randint(0, 100000, n_spikes).astype("uint32"))
+
+
+def _sort_spike_times(spike_ids, spike_ticks):
+    """ Sort spikes as times in milliseconds, as a float array
+    """
+    spike_ids = spike_ids.astype("float")
+    spike_times = spike_ticks * 0.1
+    result = numpy.column_stack((spike_ids, spike_times))
+    return result[numpy.lexsort((spike_times, spike_ids))]
+
+
+def run():
+    print("{:<22} {:>8} {:>10} {:>12}".format(
+        "benchmark", "records", "time (s)", "peak (bytes)"))
+    for n_records in _N_RECORDS:
+        multi_spike_data = _multi_spike_data(n_records)
+        eieio_data = _eieio_data(n_records)
+        for name, function, data in (
+                ("multi-spike per record", _multi_spike_per_record,
+                 multi_spike_data),
+                ("multi-spike bulk", _multi_spike_bulk, multi_spike_data),
+                ("eieio per record", _eieio_per_record, eieio_data),
+                ("eieio bulk", _eieio_bulk, eieio_data)):
+            _, elapsed, peak = measure(function, data, 1.0)
+            print("{:<22} {:>8} {:>10.4f} {:>12}".format(
+                name, n_records, elapsed, peak))
+        for name, decode_all in (
+                ("runs decoding all", True), ("runs decoding new", False)):
+            _, elapsed, peak = measure(
+                _get_after_each_run, multi_spike_data, decode_all)
+            print("{:<22} {:>8} {:>10.4f} {:>12}".format(
+                name, n_records, elapsed, peak))
+
+    for n_spikes in _N_SORTED_SPIKES:
+        spike_ids, spike_ticks = _random_spike_ticks(n_spikes)
+        for name, function in (
+                ("sort spike times", _sort_spike_times),
+                ("sort spike ticks", recording_utils.sort_spike_ticks)):
+            _, elapsed, peak = measure(function, spike_ids, spike_ticks)
+            print("{:<22} {:>8} {:>10.4f} {:>12}".format(
+                name, n_spikes, elapsed, peak))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,88 @@
+""" Benchmarks of the time and memory taken to find the spike counts, the\
+    post-stimulus time histogram and the inter-spike interval histogram of a\
+    population, from all of its spikes and by counting the spikes of each\
+    core as they are decoded, using synthetic recorded data so that no\
+    machine is needed.
+
+Run with::
+
+    python -m benchmarks.spike_statistics_benchmarks
+"""
+from __future__ import print_function
+import numpy
+from spynnaker.pyNN.models.common import (
+    NeuronRecorder, RecordingExtractionScheduler)
+from spynnaker.pyNN.utilities.spike_statistics import SpikeStatistics
+from unittests.mocks import MockSimulator
+from .connector_benchmarks import measure
+from .recording_extraction_benchmarks import (
+    _GraphMapper, _Placements, _recorded_spikes, _N_TIMESTEPS, _N_VERTICES,
+    _SLICE_SIZE)
+
+_N_NEURONS = _N_VERTICES * _SLICE_SIZE
+_BIN_WIDTH = 10.0
+
+
+def _recorder():
+    recorder = NeuronRecorder(
+        ["spikes"], _N_NEURONS, RecordingExtractionScheduler(1))
+    recorder.set_recording("spikes", True)
+    return recorder
+
+
+def _statistics_of_all_spikes(recorder, buffer_manager):
+    """ Get all the spikes, then count them in a dictionary and histogram\
+        them, as was done before the statistics were counted while decoding
+    """
+    spikes = recorder.get_spikes(
+        "benchmark", buffer_manager, 0, _Placements(), _GraphMapper(), None,
+        1000)
+    counts = numpy.bincount(
+        spikes[:, 0].astype("int32"), minlength=_N_NEURONS)
+    n_spikes = {}
+    for i in range(_N_NEURONS):
+        n_spikes[i] = counts[i]
+    psth = numpy.histogram(
+        spikes[:, 1], bins=numpy.arange(0, _N_TIMESTEPS + 1, _BIN_WIDTH))
+    same_neuron = spikes[1:, 0] == spikes[:-1, 0]
+    isis = numpy.diff(spikes[:, 1])[same_neuron]
+    isi_histogram = numpy.histogram(
+        isis, bins=numpy.arange(0, _N_TIMESTEPS + 1))
+    return n_spikes, psth, isi_histogram
+
+
+def _streamed_statistics(recorder, buffer_manager):
+    statistics = SpikeStatistics(
+        _N_NEURONS, _N_TIMESTEPS, 1000, bin_width=_BIN_WIDTH)
+    for spike_ids, spike_ticks in recorder.iter_spike_columns(
+            "benchmark", buffer_manager, 0, _Placements(), _GraphMapper(),
+            None):
+        statistics.add_spikes(spike_ids, spike_ticks)
+    n_spikes = dict(zip(
+        range(_N_NEURONS), statistics.spike_counts.tolist()))
+    return n_spikes, statistics.psth, statistics.isi_histogram
+
+
+def run():
+    MockSimulator.setup()
+    buffer_manager = _recorded_spikes()
+    print("{:<22} {:>8} {:>10} {:>12}".format(
+        "benchmark", "neurons", "time (s)", "peak (bytes)"))
+    results = list()
+    for name, function in (
+            ("all spikes", _statistics_of_all_spikes),
+            ("streamed statistics", _streamed_statistics)):
+        result, elapsed, peak = measure(function, _recorder(), buffer_manager)
+        results.append(result)
+        print("{:<22} {:>8} {:>10.4f} {:>12}".format(
+            name, _N_NEURONS, elapsed, peak))
+
+    # Both ways count the same spikes
+    (counts, psth, isis), (new_counts, new_psth, new_isis) = results
+    assert counts == new_counts
+    assert list(psth[0]) == list(new_psth[1])
+    assert list(isis[0][1:]) == list(new_isis[1][1:len(isis[0])])
+
+
+if __name__ == "__main__":
+    run()
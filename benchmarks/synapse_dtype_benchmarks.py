@@ -0,0 +1,119 @@
+""" Benchmarks of the peak memory taken to generate synapses on host with\
+    the standard and the compact synaptic block types, both in creating the\
+    block of the connector and in the whole of getting the synapses, using\
+    mocks so that no machine is needed.
+
+Run with::
+
+    python -m benchmarks.synapse_dtype_benchmarks
+"""
+from __future__ import print_function
+import functools
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector, AllToAllConnector, FixedNumberPostConnector,
+    FixedProbabilityConnector)
+from spynnaker.pyNN.models.neural_projections.synapse_information \
+    import SynapseInformation
+from spynnaker.pyNN.models.neuron.master_pop_table_generators \
+    import MasterPopTableAsBinarySearch
+from spynnaker.pyNN.models.neuron.synapse_dynamics import \
+    SynapseDynamicsStatic
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from unittests.mocks import MockSimulator, MockPopulation
+from .connector_benchmarks import measure
+
+# The delay stages that the delays of the benchmarks need
+_N_DELAY_STAGES = 2
+
+# The number of atoms of the post-vertex, small enough that the rows fit
+_N_POST_ATOMS = 256
+
+
+def _connector(create_connector, n_pre_atoms):
+    connector = create_connector()
+    connector.set_projection_information(
+        pre_population=MockPopulation(n_pre_atoms, "Pre"),
+        post_population=MockPopulation(_N_POST_ATOMS, "Post"),
+        rng=None, machine_time_step=1000)
+    connector.set_weights_and_delays(1.5, 20.0)
+    return connector
+
+
+def benchmark_block(compact, create_connector, n_pre_atoms):
+    """ Measure the creation of the block of a connector.
+
+    :return: The time taken in seconds, and the peak memory allocated in\
+        bytes
+    """
+    connector = _connector(create_connector, n_pre_atoms)
+    pre_vertex_slice = Slice(0, n_pre_atoms - 1)
+    post_vertex_slice = Slice(0, _N_POST_ATOMS - 1)
+    args = [[pre_vertex_slice], 0, [post_vertex_slice], 0, pre_vertex_slice,
+            post_vertex_slice, 0]
+    if compact:
+        _, elapsed, peak = measure(
+            connector.create_compact_synaptic_block, *(args + [1000]))
+    else:
+        _, elapsed, peak = measure(connector.create_synaptic_block, *args)
+    return elapsed, peak
+
+
+def benchmark_synapses(compact, n_pre_atoms, probability):
+    """ Measure the generation of the synapses of a block on host.
+
+    :return: The time taken in seconds, and the peak memory allocated in\
+        bytes
+    """
+    connector = _connector(
+        functools.partial(FixedProbabilityConnector, probability),
+        n_pre_atoms)
+    synapse_info = SynapseInformation(connector, SynapseDynamicsStatic(), 0)
+    pre_vertex_slice = Slice(0, n_pre_atoms - 1)
+    post_vertex_slice = Slice(0, _N_POST_ATOMS - 1)
+    _, elapsed, peak = measure(
+        SynapseIORowBased(compact).get_synapses, synapse_info,
+        [pre_vertex_slice], 0, [post_vertex_slice], 0, pre_vertex_slice,
+        post_vertex_slice, _N_DELAY_STAGES, MasterPopTableAsBinarySearch(),
+        2, [256.0, 256.0], 1000, None, None)
+    return elapsed, peak
+
+
+def run():
+    MockSimulator.setup()
+    for name, dtype in (
+            ("standard", AbstractConnector.NUMPY_SYNAPSES_DTYPE),
+            ("compact", AbstractConnector.NUMPY_COMPACT_SYNAPSES_DTYPE)):
+        print("{} block: {} bytes per connection".format(
+            name, numpy.dtype(dtype).itemsize))
+    print("{:<10} {:<28} {:>9} {:>10} {:>12}".format(
+        "block", "connector", "pre atoms", "time (s)", "peak (bytes)"))
+    for name, create_connector in (
+            ("AllToAllConnector", AllToAllConnector),
+            ("FixedProbabilityConnector", functools.partial(
+                FixedProbabilityConnector, 0.5)),
+            ("FixedNumberPostConnector", functools.partial(
+                FixedNumberPostConnector, 128))):
+        for n_pre_atoms in (1024, 4096):
+            for compact in (False, True):
+                elapsed, peak = benchmark_block(
+                    compact, create_connector, n_pre_atoms)
+                print("{:<10} {:<28} {:>9} {:>10.4f} {:>12}".format(
+                    "compact" if compact else "standard", name,
+                    n_pre_atoms, elapsed, peak))
+    print()
+    print("{:<10} {:>9} {:>12} {:>10} {:>12}".format(
+        "synapses", "pre atoms", "probability", "time (s)", "peak (bytes)"))
+    for n_pre_atoms in (256, 1024, 4096):
+        for probability in (0.1, 0.5):
+            for compact in (False, True):
+                elapsed, peak = benchmark_synapses(
+                    compact, n_pre_atoms, probability)
+                print("{:<10} {:>9} {:>12} {:>10.4f} {:>12}".format(
+                    "compact" if compact else "standard", n_pre_atoms,
+                    probability, elapsed, peak))
+
+
+if __name__ == "__main__":
+    run()
@@ -1,26 +1,56 @@
 import os
+import numpy
 
 import spynnaker.pyNN.utilities.utility_calls as utility_calls
 
 
-def check_gsyn(gsyn1, gsyn2):
+def _time_ticks(gsyn, machine_time_step):
+    """ Get the times of gsyn data as timesteps; times that are already\
+        timesteps, as integers, are kept as they are
+    """
+    gsyn = numpy.asarray(gsyn)
+    if numpy.issubdtype(gsyn.dtype, numpy.integer):
+        return gsyn[:, 1]
+    return numpy.rint(gsyn[:, 1] * 1000.0 / machine_time_step).astype(
+        "int64")
+
+
+def check_gsyn(gsyn1, gsyn2, machine_time_step=None):
+    """ Check that gsyn data matches that expected, to one decimal place
+
+    :param machine_time_step: If given, the times are compared exactly as\
+        timesteps, in microseconds per timestep, so either can be\
+        milliseconds or timesteps
+    """
     if len(gsyn1) != len(gsyn2):
         raise Exception("Length of gsyn does not match expected {} but "
                         "found {}".format(len(gsyn1), len(gsyn2)))
+    columns = range(3)
+    if machine_time_step is not None:
+        ticks1 = _time_ticks(gsyn1, machine_time_step)
+        ticks2 = _time_ticks(gsyn2, machine_time_step)
+        different = numpy.flatnonzero(ticks1 != ticks2)
+        if len(different):
+            i = different[0]
+            raise Exception("Mismatch between gsyn found at position {}{}"
+                            "expected {} but found {}".
+                            format(i, 1, gsyn1[i][1], gsyn2[i][1]))
+        columns = (0, 2)
     for i in range(len(gsyn1)):  # pylint: disable=consider-using-enumerate
-        for j in range(3):
+        for j in columns:
             if round(gsyn1[i][j], 1) != round(gsyn2[i][j], 1):
                 raise Exception("Mismatch between gsyn found at position {}{}"
                                 "expected {} but found {}".
                                 format(i, j, gsyn1[i][j], gsyn2[i][j]))
 
 
-def check_path_gysn(path, n_neurons, runtime, gsyn):
+def check_path_gysn(path, n_neurons, runtime, gsyn, machine_time_step=None):
     gsyn2 = utility_calls.read_in_data_from_file(
         path, 0, n_neurons, 0, runtime, True)
-    check_gsyn(gsyn, gsyn2)
+    check_gsyn(gsyn, gsyn2, machine_time_step)
 
 
-def check_sister_gysn(sister, n_neurons, runtime, gsyn):
+def check_sister_gysn(sister, n_neurons, runtime, gsyn,
+                      machine_time_step=None):
     path = os.path.join(os.path.dirname(os.path.abspath(sister)), "gsyn.data")
-    check_path_gysn(path, n_neurons, runtime, gsyn)
+    check_path_gysn(path, n_neurons, runtime, gsyn, machine_time_step)
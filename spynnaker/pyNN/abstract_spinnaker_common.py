@@ -10,11 +10,15 @@ from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utility_models import CommandSender
 from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
 from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities import helpful_functions
 
 # local front end imports
 from spynnaker.pyNN import overridden_pacman_functions
 from spynnaker.pyNN import model_binaries
 from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.synapse_generation_policies import \
+    SynapseGenerationCosts
 from spynnaker.pyNN.spynnaker_simulator_interface \
     import SpynnakerSimulatorInterface
 from spynnaker import __version__ as version
@@ -316,6 +320,50 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
             projection._clear_cache()
         super(AbstractSpiNNakerCommon, self).run(run_time)
 
+    def reset(self):
+        """ Reset the simulation to time zero, discarding the recorded data
+        """
+        # pylint: disable=protected-access
+        for population in self._populations:
+            population._reset_extraction_cursors()
+        super(AbstractSpiNNakerCommon, self).reset()
+
+    def _do_load(self):
+        load_time = self._load_time
+        super(AbstractSpiNNakerCommon, self)._do_load()
+        self.__record_synapse_generation_timings(
+            (self._load_time - load_time) / 1000.0)
+
+    def __record_synapse_generation_timings(self, load_seconds):
+        """ Add the timings of loading and of the synapse expander to those\
+            calibrating the costs of generating synapses, if there is a file\
+            of them
+
+        :param load_seconds: The time taken to load, including the expander
+        """
+        costs_file = helpful_functions.read_config(
+            self._config, "Simulation", "synapse_generation_costs_file")
+        if costs_file is None or self._use_virtual_board:
+            return
+        n_synapses, n_cores, expander_seconds = self._load_outputs.get(
+            "SynapseExpanderTimings", (0, 0, 0.0))
+
+        # Loading is timed against the bytes of synaptic data written, as that
+        # is what the choice of where to generate synapses changes
+        n_bytes = 0
+        for vertex in self._application_graph.vertices:
+            if isinstance(vertex, AbstractPopulationVertex):
+                for machine_vertex in self._graph_mapper.get_machine_vertices(
+                        vertex):
+                    n_bytes += vertex.get_synapse_generation_totals(
+                        self._graph_mapper.get_slice(machine_vertex))[1]
+
+        # Other runs may have added timings to the file since it was read
+        costs = SynapseGenerationCosts.read(costs_file)
+        costs.add_load_timings(n_bytes, load_seconds - expander_seconds)
+        costs.add_expander_timings(n_synapses, n_cores, expander_seconds)
+        costs.write(costs_file)
+
     @property
     def time_scale_factor(self):
         """ The multiplicative scaling from application time to real\
@@ -1,14 +1,18 @@
 from .abstract_neuron_recordable import AbstractNeuronRecordable
 from .abstract_spike_recordable import AbstractSpikeRecordable
 from .eieio_spike_recorder import EIEIOSpikeRecorder
+from .extraction_cursors import ExtractionCursors
 from .neuron_recorder import NeuronRecorder
 from .multi_spike_recorder import MultiSpikeRecorder
+from .recording_extraction_scheduler import RecordingExtractionScheduler
 from .recording_utils import get_buffer_sizes, get_data, \
     get_recording_region_size_in_bytes, needs_buffering, pull_off_cached_lists
 from .simple_population_settable import SimplePopulationSettable
 
 __all__ = ["AbstractNeuronRecordable", "AbstractSpikeRecordable",
-           "EIEIOSpikeRecorder", "NeuronRecorder", "MultiSpikeRecorder",
-           "SimplePopulationSettable", "get_buffer_sizes", "get_data",
+           "EIEIOSpikeRecorder", "ExtractionCursors", "NeuronRecorder",
+           "MultiSpikeRecorder",
+           "RecordingExtractionScheduler", "SimplePopulationSettable",
+           "get_buffer_sizes", "get_data",
            "needs_buffering", "get_recording_region_size_in_bytes",
            "pull_off_cached_lists", ]
@@ -56,6 +56,24 @@ class AbstractNeuronRecordable(object):
         """
         # pylint: disable=too-many-arguments
 
+    def iter_data(self, variable, n_machine_time_steps, placements,
+                  graph_mapper, buffer_manager, machine_time_step,
+                  n_rows_per_chunk):
+        """ Get the recorded data as :py:meth:`get_data` does, but as\
+            consecutive chunks of rows; by default all the rows are in one\
+            chunk
+
+        :param n_rows_per_chunk: The most rows to read into each chunk
+        :return: An iterable of the chunks of data, the indexes of the\
+            neurons of the columns, and the sampling interval
+        """
+        # pylint: disable=too-many-arguments, unused-argument
+        data, indexes, sampling_interval = self.get_data(
+            variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step)
+        chunks = [] if data is None else [data]
+        return (chunks, indexes, sampling_interval)
+
     @abstractmethod
     def get_neuron_sampling_interval(self, variable):
         """ Returns the current sampling interval for this variable
@@ -1,6 +1,8 @@
+import numpy
 from six import add_metaclass
 
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from . import recording_utils
 
 
 @add_metaclass(AbstractBase)
@@ -56,6 +58,56 @@ class AbstractSpikeRecordable(object):
             ordered by time
         """
 
+    def get_spike_ticks(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        """ Get the recorded spikes as :py:meth:`get_spikes` does, but with\
+            the timestep of each spike rather than its time, so that the\
+            spikes are never held as floating point; by default the spikes\
+            are converted from those of :py:meth:`get_spikes`
+
+        :return: A numpy uint32 array of 2-element arrays of\
+            (neuron_id, timestep) ordered by neuron_id and then timestep
+        """
+        spikes = self.get_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        ids = spikes[:, 0].astype("uint32")
+        ticks = numpy.rint(
+            spikes[:, 1] * 1000.0 / machine_time_step).astype("uint32")
+        return recording_utils.sort_spike_ticks(ids, ticks)
+
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            n_timesteps_per_chunk):
+        """ Get the recorded spikes as :py:meth:`get_spikes` does, but as\
+            the spikes of consecutive windows of timesteps; by default all\
+            the spikes are in one window
+
+        :param n_timesteps_per_chunk: The number of timesteps in each window
+        :return: An iterable of numpy arrays of (neuron_id, time)
+        """
+        # pylint: disable=unused-argument
+        spikes = self.get_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        if len(spikes):
+            yield spikes
+
+    def iter_spike_columns(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        """ Get the recorded spikes as columns of neuron IDs and timesteps,\
+            in chunks that together are sorted by neuron ID and then\
+            timestep; by default all the spikes are in one chunk
+
+        :return: An iterable of (neuron IDs, timesteps) of numpy uint32 arrays
+        """
+        spikes = self.get_spike_ticks(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        yield (spikes[:, 0], spikes[:, 1])
+
+    def reset_extraction_cursors(self):
+        """ Forget the recorded spikes decoded so far, so that they are all\
+            decoded again when next got; by default nothing is kept
+        """
+
     @abstractmethod
     def get_spikes_sampling_interval(self):
         """ Return the current sampling interval for spikes
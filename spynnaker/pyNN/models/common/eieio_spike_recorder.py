@@ -2,23 +2,27 @@ from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
 from spinnman.messages.eieio.data_messages import EIEIODataHeader
 from spynnaker.pyNN.models.common import recording_utils
+from .extraction_cursors import ExtractionCursors
 
 import numpy
 import struct
 import logging
 
 logger = FormatAdapter(logging.getLogger(__name__))
-_ONE_WORD = struct.Struct("<I")
+_TWO_WORDS = struct.Struct("<II")
+_HEADER = struct.Struct("<BB")
 
 
 class EIEIOSpikeRecorder(object):
     """ Records spikes using EIEIO format
     """
     __slots__ = [
+        "_cursors",
         "_record"]
 
     def __init__(self):
         self._record = False
+        self._cursors = ExtractionCursors()
 
     @property
     def record(self):
@@ -35,6 +39,12 @@ class EIEIOSpikeRecorder(object):
                            "SpikeSourceArray so being ignored")
         self._record = new_state
 
+    def reset_extraction_cursors(self):
+        """ Forget the spikes decoded so far, so that they are all decoded\
+            again when next got
+        """
+        self._cursors.clear()
+
     def get_dtcm_usage_in_bytes(self):
         if not self._record:
             return 0
@@ -49,9 +59,23 @@ class EIEIOSpikeRecorder(object):
                    placements, graph_mapper, application_vertex,
                    base_key_function, machine_time_step):
         # pylint: disable=too-many-arguments
+        return recording_utils.spike_ticks_to_ms(
+            self.get_spike_ticks(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, base_key_function),
+            machine_time_step)
+
+    def get_spike_ticks(self, label, buffer_manager, region,
+                        placements, graph_mapper, application_vertex,
+                        base_key_function):
+        """ Get the spikes as the neuron ID and timestep of each, sorted by\
+            neuron ID and then timestep
+
+        :rtype: numpy.array(uint32)
+        """
+        # pylint: disable=too-many-arguments
         results = list()
         missing = []
-        ms_per_tick = machine_time_step / 1000.0
         vertices = graph_mapper.get_machine_vertices(application_vertex)
         progress = ProgressBar(vertices,
                                "Getting spikes for {}".format(label))
@@ -59,14 +83,20 @@ class EIEIOSpikeRecorder(object):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
 
-            # Read the spikes
+            # Read the spikes, decoding only those stored since the spikes
+            # were last got
             raw_spike_data, data_missing = \
                 buffer_manager.get_data_for_vertex(placement, region)
             if data_missing:
                 missing.append(placement)
-            self._process_spike_data(
-                vertex_slice, raw_spike_data.read_all(), ms_per_tick,
-                base_key_function(vertex), results)
+            cursor = self._cursors.get_cursor(
+                placement, region, raw_spike_data)
+            new_results = list()
+            n_bytes = self._process_spike_data(
+                vertex_slice, cursor.read_new(), base_key_function(vertex),
+                new_results)
+            cursor.advance(n_bytes, new_results)
+            results.extend(cursor.decoded)
 
         if missing:
             missing_str = recording_utils.make_missing_string(missing)
@@ -74,33 +104,67 @@ class EIEIOSpikeRecorder(object):
                 "Population {} is missing spike data in region {} from the"
                 " following cores: {}", label, region, missing_str)
         if not results:
-            return numpy.empty(shape=(0, 2))
+            return numpy.zeros((0, 2), dtype="uint32")
         result = numpy.vstack(results)
-        return result[numpy.lexsort((result[:, 1], result[:, 0]))]
+        return recording_utils.sort_spike_ticks(result[:, 0], result[:, 1])
 
     @staticmethod
     def _process_spike_data(
-            vertex_slice, spike_data, ms_per_tick, base_key, results):
+            vertex_slice, spike_data, base_key, results):
+        """ Decode the whole packets of spikes in spike data, adding an array\
+            of the IDs and timesteps of the spikes to the results
+
+        :return: The number of bytes of the whole packets
+        :rtype: int
+        """
+        # Each record is a length, a time and an EIEIO packet of keys, so
+        # only the header of each record is read to find where the next
+        # starts; the size of a header depends only on its flags, so each
+        # kind of header is decoded only once, and any record cut short is
+        # ignored
         number_of_bytes_written = len(spike_data)
+        headers = dict()
+        key_offsets = list()
+        times = list()
+        counts = list()
+        key_bytes = None
         offset = 0
-        while offset < number_of_bytes_written:
-            length = _ONE_WORD.unpack_from(spike_data, offset)[0]
-            time = _ONE_WORD.unpack_from(spike_data, offset + 4)[0]
-            time *= ms_per_tick
-            data_offset = offset + 8
-
-            eieio_header = EIEIODataHeader.from_bytestring(
-                spike_data, data_offset)
-            if eieio_header.eieio_type.payload_bytes > 0:
-                raise Exception("Can only read spikes as keys")
-
-            data_offset += eieio_header.size
-            timestamps = numpy.repeat([time], eieio_header.count)
-            key_bytes = eieio_header.eieio_type.key_bytes
-            keys = numpy.frombuffer(
-                spike_data, dtype="<u{}".format(key_bytes),
-                count=eieio_header.count, offset=data_offset)
-
-            neuron_ids = (keys - base_key) + vertex_slice.lo_atom
+        while offset + 10 <= number_of_bytes_written:
+            length, time = _TWO_WORDS.unpack_from(spike_data, offset)
+            count, flags = _HEADER.unpack_from(spike_data, offset + 8)
+            if flags not in headers:
+                eieio_header = EIEIODataHeader.from_bytestring(
+                    spike_data, offset + 8)
+                if eieio_header.eieio_type.payload_bytes > 0:
+                    raise Exception("Can only read spikes as keys")
+                headers[flags] = (
+                    eieio_header.size, eieio_header.eieio_type.key_bytes)
+            header_size, packet_key_bytes = headers[flags]
+            key_offset = offset + 8 + header_size
+            if max(key_offset + count * packet_key_bytes,
+                   offset + length + 8) > number_of_bytes_written:
+                break
+            if key_bytes is None:
+                key_bytes = packet_key_bytes
+            elif key_bytes != packet_key_bytes:
+                raise Exception("Can only read spikes of one size of key")
+            key_offsets.append(key_offset)
+            times.append(time)
+            counts.append(count)
             offset += length + 8
-            results.append(numpy.dstack((neuron_ids, timestamps))[0])
+        if not key_offsets:
+            return 0
+
+        # Gather the bytes of all the keys, then read them all at once
+        counts = numpy.array(counts, dtype="int64")
+        key_starts = numpy.repeat(key_offsets, counts) + (
+            recording_utils.offsets_in_groups(counts) * key_bytes)
+        data = numpy.frombuffer(spike_data, dtype="uint8")
+        keys = numpy.ascontiguousarray(
+            data[key_starts[:, None] + numpy.arange(key_bytes)]).view(
+                "<u{}".format(key_bytes))[:, 0]
+        neuron_ids = (keys.astype("int64") - base_key) + vertex_slice.lo_atom
+        timestamps = numpy.repeat(numpy.array(times, dtype="uint32"), counts)
+        results.append(numpy.column_stack((
+            neuron_ids.astype("uint32"), timestamps)))
+        return offset
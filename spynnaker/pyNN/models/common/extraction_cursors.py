@@ -0,0 +1,100 @@
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+class _ExtractionCursor(object):
+    """ The parts of the recorded data of a region of a core decoded so far,\
+        and how many bytes of the stored data they were decoded from
+    """
+
+    __slots__ = [
+        "_data_pointer",
+        "_decoded",
+        "_n_bytes_decoded"]
+
+    def __init__(self, data_pointer):
+        self._data_pointer = data_pointer
+        self._decoded = list()
+        self._n_bytes_decoded = 0
+
+    @property
+    def data_pointer(self):
+        return self._data_pointer
+
+    @property
+    def decoded(self):
+        """ The parts decoded so far, in the order of the data
+        """
+        return self._decoded
+
+    @property
+    def n_bytes_decoded(self):
+        return self._n_bytes_decoded
+
+    def read_new(self):
+        """ Read the bytes stored after those decoded so far
+
+        :rtype: bytearray
+        """
+        self._data_pointer.seek_read(self._n_bytes_decoded)
+        data = bytearray()
+        while True:
+            chunk = self._data_pointer.read(_READ_CHUNK_BYTES)
+            data += chunk
+            if len(chunk) < _READ_CHUNK_BYTES:
+                return data
+
+    def advance(self, n_bytes, parts):
+        """ Note that more of the stored bytes have been decoded
+
+        :param n_bytes: The number of bytes decoded, from the first not yet\
+            decoded; any bytes after these are decoded again next time
+        :param parts: The parts decoded from the bytes
+        :type parts: iterable
+        """
+        self._n_bytes_decoded += n_bytes
+        self._decoded.extend(parts)
+
+
+class ExtractionCursors(object):
+    """ Cursors into the recorded data stored by the buffer manager for each\
+        region of each core, with the data decoded up to each, so that\
+        repeatedly getting the recorded data of a simulation that is run\
+        again and again only decodes the data recorded since.
+
+    The cursors must be cleared whenever the stored data is cleared or\
+    replaced, as when the simulation is reset; a cursor is also started again\
+    if the buffer manager gives a different store for its region.
+    """
+
+    __slots__ = [
+        "_cursors"]
+
+    def __init__(self):
+        self._cursors = dict()
+
+    def get_cursor(self, placement, region, data_pointer):
+        """ Get the cursor of a region of a core
+
+        :param placement: The placement of the core
+        :param region: The recording region
+        :param data_pointer: The store of the data of the region, as given\
+            by the buffer manager
+        """
+        key = (placement.x, placement.y, placement.p, region)
+        cursor = self._cursors.get(key)
+        if cursor is None or cursor.data_pointer is not data_pointer:
+            cursor = _ExtractionCursor(data_pointer)
+            self._cursors[key] = cursor
+        return cursor
+
+    def clear(self, region=None):
+        """ Forget the data decoded so far
+
+        :param region: The recording region to forget the data of, or None\
+            for all regions
+        """
+        if region is None:
+            self._cursors.clear()
+            return
+        for key in [key for key in self._cursors if key[3] == region]:
+            del self._cursors[key]
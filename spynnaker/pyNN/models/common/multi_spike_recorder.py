@@ -2,6 +2,7 @@ from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
 
 from spynnaker.pyNN.models.common import recording_utils
+from .extraction_cursors import ExtractionCursors
 
 import math
 import numpy
@@ -14,10 +15,12 @@ _TWO_WORDS = struct.Struct("<II")
 
 class MultiSpikeRecorder(object):
     __slots__ = [
+        "_cursors",
         "_record"]
 
     def __init__(self):
         self._record = False
+        self._cursors = ExtractionCursors()
 
     @property
     def record(self):
@@ -27,6 +30,12 @@ class MultiSpikeRecorder(object):
     def record(self, record):
         self._record = record
 
+    def reset_extraction_cursors(self):
+        """ Forget the spikes decoded so far, so that they are all decoded\
+            again when next got
+        """
+        self._cursors.clear()
+
     def get_sdram_usage_in_bytes(
             self, n_neurons, spikes_per_timestep, n_machine_time_steps):
         if not self._record:
@@ -50,9 +59,23 @@ class MultiSpikeRecorder(object):
             self, label, buffer_manager, region,
             placements, graph_mapper, application_vertex, machine_time_step):
         # pylint: disable=too-many-arguments
-        spike_times = list()
+        return recording_utils.spike_ticks_to_ms(
+            self.get_spike_ticks(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex),
+            machine_time_step)
+
+    def get_spike_ticks(
+            self, label, buffer_manager, region,
+            placements, graph_mapper, application_vertex):
+        """ Get the spikes as the neuron ID and timestep of each, sorted by\
+            neuron ID and then timestep
+
+        :rtype: numpy.array(uint32)
+        """
+        # pylint: disable=too-many-arguments
+        spike_ticks = list()
         spike_ids = list()
-        ms_per_tick = machine_time_step / 1000.0
 
         vertices = graph_mapper.get_machine_vertices(application_vertex)
         missing = []
@@ -62,15 +85,23 @@ class MultiSpikeRecorder(object):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
 
-            # Read the spikes from the buffer manager
+            # Read the spikes from the buffer manager, decoding only those
+            # stored since the spikes were last got
             neuron_param_region, data_missing = \
                 buffer_manager.get_data_for_vertex(placement, region)
             if data_missing:
                 missing.append(placement)
-            self._process_spike_data(
-                vertex_slice, ms_per_tick,
-                int(math.ceil(vertex_slice.n_atoms / 32.0)),
-                neuron_param_region.read_all(), spike_ids, spike_times)
+            cursor = self._cursors.get_cursor(
+                placement, region, neuron_param_region)
+            new_ids = list()
+            new_ticks = list()
+            n_bytes = self._process_spike_data(
+                vertex_slice, int(math.ceil(vertex_slice.n_atoms / 32.0)),
+                cursor.read_new(), new_ids, new_ticks)
+            cursor.advance(n_bytes, zip(new_ids, new_ticks))
+            for ids, ticks in cursor.decoded:
+                spike_ids.append(ids)
+                spike_ticks.append(ticks)
 
         if missing:
             logger.warning(
@@ -79,33 +110,49 @@ class MultiSpikeRecorder(object):
                 recording_utils.make_missing_string(missing))
 
         if not spike_ids:
-            return numpy.zeros((0, 2))
-
-        spike_ids = numpy.hstack(spike_ids)
-        spike_times = numpy.hstack(spike_times)
-        result = numpy.dstack((spike_ids, spike_times))[0]
-        return result[numpy.lexsort((spike_times, spike_ids))]
+            return numpy.zeros((0, 2), dtype="uint32")
+        return recording_utils.sort_spike_ticks(
+            numpy.concatenate(spike_ids), numpy.concatenate(spike_ticks))
 
     @staticmethod
     def _process_spike_data(
-            vertex_slice, ms_per_tick, n_words, raw_data, spike_ids,
-            spike_times):
+            vertex_slice, n_words, raw_data, spike_ids, spike_ticks):
+        """ Decode the whole records of spikes in raw data, adding the IDs and\
+            timesteps of the spikes to the lists
+
+        :return: The number of bytes of the whole records
+        :rtype: int
+        """
         # pylint: disable=too-many-arguments
-        n_bytes_per_block = n_words * 4
+
+        # Each record is a time, a number of blocks and the blocks of words
+        # of spikes, so only the header of each record is read to find where
+        # the next starts; any record cut short is ignored
+        words = numpy.frombuffer(
+            raw_data, dtype="<u4", count=len(raw_data) // 4)
+        starts = list()
+        times = list()
+        block_counts = list()
         offset = 0
-        while offset < len(raw_data):
-            time, n_blocks = _TWO_WORDS.unpack_from(raw_data, offset)
-            offset += _TWO_WORDS.size
-            spike_data = numpy.frombuffer(
-                raw_data, dtype="uint8",
-                count=n_bytes_per_block * n_blocks, offset=offset)
-            offset += n_bytes_per_block * n_blocks
-
-            spikes = spike_data.view("<i4").byteswap().view("uint8")
-            bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                (-1, 32))).reshape((-1, n_bytes_per_block * 8))
-            indices = numpy.nonzero(bits)[1]
-            times = numpy.repeat([time * ms_per_tick], len(indices))
-            indices = indices + vertex_slice.lo_atom
-            spike_ids.append(indices)
-            spike_times.append(times)
+        while offset + 2 <= len(words):
+            time, n_blocks = _TWO_WORDS.unpack_from(raw_data, offset * 4)
+            if offset + 2 + n_blocks * n_words > len(words):
+                break
+            starts.append(offset + 2)
+            times.append(time)
+            block_counts.append(n_blocks)
+            offset += 2 + n_blocks * n_words
+        if not starts:
+            return 0
+
+        # Gather the blocks of all the records, then find the spikes in them
+        block_counts = numpy.array(block_counts, dtype="int64")
+        block_starts = numpy.repeat(starts, block_counts) + (
+            recording_utils.offsets_in_groups(block_counts) * n_words)
+        blocks = words[block_starts[:, None] + numpy.arange(n_words)]
+        block_indices, indices = recording_utils.find_set_bits(blocks)
+        block_ticks = numpy.repeat(
+            numpy.array(times, dtype="uint32"), block_counts)
+        spike_ids.append((indices + vertex_slice.lo_atom).astype("uint32"))
+        spike_ticks.append(block_ticks[block_indices])
+        return offset * 4
@@ -4,7 +4,7 @@ import logging
 import math
 import numpy
 from six import iteritems, raise_from
-from six.moves import range, xrange
+from six.moves import range
 
 from data_specification.enums import DataType
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
@@ -12,6 +12,9 @@ from spinn_front_end_common.utilities import globals_variables
 from spinn_utilities.index_is_value import IndexIsValue
 from spinn_utilities.progress_bar import ProgressBar
 from spynnaker.pyNN.models.neural_properties import NeuronParameter
+from . import recording_utils
+from .extraction_cursors import ExtractionCursors
+from .recording_extraction_scheduler import RecordingExtractionScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -29,33 +32,68 @@ class NeuronRecorder(object):
     N_BYTES_PER_POINTER = 4
     MAX_RATE = 2 ** 32 - 1  # To allow a unit32_t to be used to store the rate
 
-    def __init__(self, allowed_variables, n_neurons):
+    def __init__(self, allowed_variables, n_neurons,
+                 extraction_scheduler=None):
+        """
+        :param allowed_variables: The variables that can be recorded
+        :param n_neurons: The number of neurons that can record
+        :param extraction_scheduler: \
+            Runs the decoding of the spikes recorded by each vertex, or None\
+            to decode each in turn in this process
+        :type extraction_scheduler: RecordingExtractionScheduler or None
+        """
         self._sampling_rates = OrderedDict()
+        if extraction_scheduler is None:
+            extraction_scheduler = RecordingExtractionScheduler()
+        self._extraction_scheduler = extraction_scheduler
+
+        # The spikes decoded so far from the data of each core
+        self._cursors = ExtractionCursors()
+
+        # The sorted array of the indexes of the neurons recording each
+        # variable, or None if all the neurons are recording
         self._indexes = dict()
         self._n_neurons = n_neurons
         for variable in allowed_variables:
             self._sampling_rates[variable] = 0
             self._indexes[variable] = None
 
+    def _slice_positions(self, variable, vertex_slice):
+        """ Get the positions in the indexes of a variable of the first\
+            index in the slice, and of the first index after the slice
+        """
+        return numpy.searchsorted(
+            self._indexes[variable],
+            [vertex_slice.lo_atom, vertex_slice.hi_atom + 1])
+
     def _count_recording_per_slice(self, variable, vertex_slice):
         if self._sampling_rates[variable] == 0:
             return 0
         if self._indexes[variable] is None:
             return vertex_slice.n_atoms
-        return sum(vertex_slice.lo_atom <= index <= vertex_slice.hi_atom
-                   for index in self._indexes[variable])
+        start, stop = self._slice_positions(variable, vertex_slice)
+        return int(stop - start)
 
     def _neurons_recording(self, variable, vertex_slice):
         if self._sampling_rates[variable] == 0:
             return []
         if self._indexes[variable] is None:
             return range(vertex_slice.lo_atom, vertex_slice.hi_atom+1)
-        recording = []
+        start, stop = self._slice_positions(variable, vertex_slice)
+        return self._indexes[variable][start:stop]
+
+    def _local_indexes(self, variable, lo_atom, n_atoms, n_recording):
+        """ Get the index of each of a range of neurons among those\
+            recording, or n_recording for those that are not recording
+        """
         indexes = self._indexes[variable]
-        for index in xrange(vertex_slice.lo_atom, vertex_slice.hi_atom+1):
-            if index in indexes:
-                recording.append(index)
-        return recording
+        ids = numpy.arange(lo_atom, lo_atom + n_atoms)
+        positions = numpy.searchsorted(indexes, ids)
+        recording = numpy.zeros(n_atoms, dtype="bool")
+        found = positions < len(indexes)
+        recording[found] = indexes[positions[found]] == ids[found]
+        return numpy.where(
+            recording, numpy.cumsum(recording) - 1, n_recording)
 
     def get_neuron_sampling_interval(self, variable):
         """ Return the current sampling interval for this variable
@@ -66,6 +104,30 @@ class NeuronRecorder(object):
         step = globals_variables.get_simulator().machine_time_step / 1000
         return self._sampling_rates[variable] * step
 
+    def _matrix_neurons_by_vertex(self, graph_mapper, vertices, variable):
+        """ Get the neurons recording a variable on each vertex, and the\
+            indexes of the columns of all of them in matrix data
+        """
+        neurons_by_vertex = [
+            self._neurons_recording(variable, graph_mapper.get_slice(vertex))
+            for vertex in vertices]
+        indexes = [
+            index for neurons in neurons_by_vertex for index in neurons]
+        return neurons_by_vertex, indexes
+
+    @staticmethod
+    def _place_matrix_records(records, columns, first_row, sampling_rate):
+        """ Put the values of each record at the row of its timestep,\
+            leaving the rows of the timesteps without data unchanged
+        """
+        times = records[:, 0]
+        rows = times // sampling_rate - first_row
+        present = (
+            (times % sampling_rate == 0) & (rows >= 0) &
+            (rows < len(columns)))
+        columns[rows[present]] = (
+            records[present, 1:].view("<i4") / float(DataType.S1615.scale))
+
     def get_matrix_data(
             self, label, buffer_manager, region, placements, graph_mapper,
             application_vertex, variable, n_machine_time_steps):
@@ -93,57 +155,47 @@ class NeuronRecorder(object):
         sampling_rate = self._sampling_rates[variable]
         expected_rows = int(math.ceil(
             n_machine_time_steps / sampling_rate))
-        missing_str = ""
+
+        # Find the columns of the neurons of each vertex, so that the data
+        # can be made once and each vertex written into its own columns
+        neurons_by_vertex, indexes = self._matrix_neurons_by_vertex(
+            graph_mapper, vertices, variable)
         data = None
-        indexes = []
-        for vertex in progress.over(vertices):
-            placement = placements.get_placement_of_vertex(vertex)
-            vertex_slice = graph_mapper.get_slice(vertex)
-            neurons = self._neurons_recording(variable, vertex_slice)
+        if indexes:
+            data = numpy.empty((expected_rows, len(indexes)))
+        missing_str = ""
+        column = 0
+        for vertex, neurons in progress.over(
+                zip(vertices, neurons_by_vertex)):
             n_neurons = len(neurons)
             if n_neurons == 0:
                 continue
-            indexes.extend(neurons)
+            placement = placements.get_placement_of_vertex(vertex)
+            columns = data[:, column:column + n_neurons]
+            column += n_neurons
+
             # for buffering output info is taken form the buffer manager
             neuron_param_region_data_pointer, missing_data = \
                 buffer_manager.get_data_for_vertex(
                     placement, region)
-            record_raw = neuron_param_region_data_pointer.read_all()
-            record_length = len(record_raw)
-
-            row_length = self.N_BYTES_FOR_TIMESTAMP + \
-                n_neurons * self.N_BYTES_PER_VALUE
 
             # There is one column for time and one for each neuron recording
-            n_rows = record_length // row_length
-            # Converts bytes to ints and make a matrix
-            record = (numpy.asarray(record_raw, dtype="uint8").
-                      view(dtype="<i4")).reshape((n_rows, (n_neurons + 1)))
+            record = next(recording_utils.read_records(
+                neuron_param_region_data_pointer, n_neurons + 1), None)
+            if record is None:
+                record = numpy.zeros((0, n_neurons + 1), dtype="uint32")
             # Check if you have the expected data
-            if not missing_data and n_rows == expected_rows:
+            if not missing_data and len(record) == expected_rows:
                 # Just cut the timestamps off to get the fragment
-                fragment = (record[:, 1:] / float(DataType.S1615.scale))
+                columns[:] = (
+                    record[:, 1:].view("<i4") / float(DataType.S1615.scale))
             else:
                 missing_str += "({}, {}, {}); ".format(
                     placement.x, placement.y, placement.p)
-                # Start the fragment for this slice empty
-                fragment = numpy.empty((expected_rows, n_neurons))
-                for i in xrange(0, expected_rows):
-                    time = i * sampling_rate
-                    # Check if there is data for this timestep
-                    local_indexes = numpy.where(record[:, 0] == time)
-                    if len(local_indexes[0]) > 0:
-                        # Set row to data for that timestep
-                        fragment[i] = (record[local_indexes[0], 1:] /
-                                       float(DataType.S1615.scale))
-                    else:
-                        # Set row to nan
-                        fragment[i] = numpy.full(n_neurons, numpy.nan)
-            if data is None:
-                data = fragment
-            else:
-                # Add the slice fragment on axis 1 which is IDs/channel_index
-                data = numpy.append(data, fragment, axis=1)
+
+                # Leave the rows of the timesteps without data as nan
+                columns.fill(numpy.nan)
+                self._place_matrix_records(record, columns, 0, sampling_rate)
         if len(missing_str) > 0:
             logger.warn(
                 "Population {} is missing recorded data in region {} from the"
@@ -151,79 +203,320 @@ class NeuronRecorder(object):
         sampling_interval = self.get_neuron_sampling_interval(variable)
         return (data, indexes, sampling_interval)
 
+    def iter_matrix_data(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, n_machine_time_steps,
+            n_rows_per_chunk):
+        """ Read the data of a variable as :py:meth:`get_matrix_data` does,\
+            but a chunk of rows at a time, so that only the data of one chunk\
+            is held in memory.
+
+        :param n_rows_per_chunk: The most rows of data in each chunk
+        :type n_rows_per_chunk: int
+        :return: \
+            An iterable of the consecutive chunks of the data, each with the\
+            rows of up to n_rows_per_chunk samples; the indexes of the\
+            neurons of the columns; and the sampling interval
+        :rtype: tuple(iterable(numpy.array), list(int), float)
+        """
+        if variable == SPIKES:
+            msg = "Variable {} is not supported use iter_spikes".format(
+                SPIKES)
+            raise ConfigurationException(msg)
+        vertices = graph_mapper.get_machine_vertices(application_vertex)
+        neurons_by_vertex, indexes = self._matrix_neurons_by_vertex(
+            graph_mapper, vertices, variable)
+        chunks = self._iter_matrix_chunks(
+            label, buffer_manager, region, placements, variable,
+            n_machine_time_steps, n_rows_per_chunk,
+            zip(vertices, neurons_by_vertex), len(indexes))
+        return (chunks, indexes, self.get_neuron_sampling_interval(variable))
+
+    def _iter_matrix_chunks(
+            self, label, buffer_manager, region, placements, variable,
+            n_machine_time_steps, n_rows_per_chunk, neurons_by_vertex,
+            n_columns):
+        # pylint: disable=too-many-arguments, too-many-locals
+        sampling_rate = self._sampling_rates[variable]
+        expected_rows = int(math.ceil(
+            n_machine_time_steps / sampling_rate))
+        if n_columns == 0:
+            return
+
+        readers = list()
+        missing = list()
+        for vertex, neurons in neurons_by_vertex:
+            n_neurons = len(neurons)
+            if n_neurons == 0:
+                continue
+            placement = placements.get_placement_of_vertex(vertex)
+            data_pointer, missing_data = buffer_manager.get_data_for_vertex(
+                placement, region)
+            if missing_data:
+                missing.append(placement)
+            readers.append((placement, n_neurons, _RecordReader(
+                recording_utils.read_records(
+                    data_pointer, n_neurons + 1, n_rows_per_chunk),
+                n_neurons + 1)))
+
+        n_rows_read = [0] * len(readers)
+        for first_row in range(0, expected_rows, n_rows_per_chunk):
+            last_row = min(first_row + n_rows_per_chunk, expected_rows)
+            data = numpy.full((last_row - first_row, n_columns), numpy.nan)
+            column = 0
+            for i, (_, n_neurons, reader) in enumerate(readers):
+                records = reader.read_before(last_row * sampling_rate)
+                n_rows_read[i] += len(records)
+                self._place_matrix_records(
+                    records, data[:, column:column + n_neurons], first_row,
+                    sampling_rate)
+                column += n_neurons
+            yield data
+
+        for (placement, _, _), n_rows in zip(readers, n_rows_read):
+            if n_rows != expected_rows and placement not in missing:
+                missing.append(placement)
+        if missing:
+            logger.warn(
+                "Population {} is missing recorded data in region {} from the"
+                " following cores: {}".format(
+                    label, region,
+                    recording_utils.make_missing_string(missing)))
+
+    def _n_spike_words(self, vertex_slice):
+        """ Get the number of words of spikes in each record of a vertex,\
+            or 0 if none of its neurons are recording spikes
+        """
+        if self._indexes[SPIKES] is None:
+            neurons_recording = vertex_slice.n_atoms
+        else:
+            neurons_recording = self._count_recording_per_slice(
+                SPIKES, vertex_slice)
+            if neurons_recording == 0:
+                return 0
+            if neurons_recording < vertex_slice.n_atoms:
+                # For spikes the overflow position is also returned
+                neurons_recording += 1
+        return int(math.ceil(neurons_recording / 32.0))
+
+    def _decode_spikes(self, records, vertex_slice):
+        """ Get the neuron IDs and timesteps of the spikes in records of a\
+            vertex, in the order of the records
+        """
+        record_ticks = records[:, 0]
+
+        # Only the words with spikes in are expanded into neuron indexes
+        time_indices, local_indices = recording_utils.find_set_bits(
+            records[:, 1:])
+        if self._indexes[SPIKES] is None:
+            return (
+                (local_indices + vertex_slice.lo_atom).astype("uint32"),
+                record_ticks[time_indices])
+        neurons = self._neurons_recording(SPIKES, vertex_slice)
+
+        # The spikes of the overflow position are discarded
+        recording = local_indices < len(neurons)
+        return (
+            neurons[local_indices[recording]].astype("uint32"),
+            record_ticks[time_indices[recording]])
+
+    @staticmethod
+    def _sorted_spike_ticks(spike_ids, spike_ticks):
+        """ Make spikes sorted by neuron ID and then timestep from the parts\
+            of the IDs and timesteps that have been decoded
+        """
+        if not spike_ids:
+            return numpy.zeros((0, 2), dtype="uint32")
+        return recording_utils.sort_spike_ticks(
+            numpy.concatenate(spike_ids), numpy.concatenate(spike_ticks))
+
     def get_spikes(
             self, label, buffer_manager, region, placements, graph_mapper,
             application_vertex, machine_time_step):
+        """ Read the spikes as :py:meth:`get_spike_ticks` does, with the\
+            times of the spikes in milliseconds
+
+        :rtype: numpy.array(float)
+        """
+        return recording_utils.spike_ticks_to_ms(
+            self.get_spike_ticks(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex),
+            machine_time_step)
+
+    def get_spike_ticks(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex):
+        """ Read the spikes recorded by the vertices of an application\
+            vertex, as the neuron ID and timestep of each
 
-        spike_times = list()
+        :return: The spikes, sorted by neuron ID and then timestep
+        :rtype: numpy.array(uint32)
+        """
+        spike_ticks = list()
         spike_ids = list()
-        ms_per_tick = machine_time_step / 1000.0
 
         vertices = graph_mapper.get_machine_vertices(application_vertex)
-        missing_str = ""
+        missing = list()
         progress = ProgressBar(vertices,
                                "Getting spikes for {}".format(label))
-        for vertex in progress.over(vertices):
+
+        # Only the spikes stored since the spikes were last got are decoded,
+        # and are added to those decoded before
+        cursors = list()
+        jobs = self._spike_decode_jobs(
+            buffer_manager, region, placements, graph_mapper,
+            progress.over(vertices), missing, cursors)
+        for i, decoded in enumerate(self._extraction_scheduler.run(jobs)):
+            cursor, n_bytes = cursors[i]
+            cursor.advance(n_bytes, [decoded])
+        for cursor, _ in cursors:
+            for ids, ticks in cursor.decoded:
+                spike_ids.append(ids)
+                spike_ticks.append(ticks)
+
+        if missing:
+            logger.warn(
+                "Population {} is missing spike data in region {} from the"
+                " following cores: {}".format(
+                    label, region,
+                    recording_utils.make_missing_string(missing)))
+
+        return self._sorted_spike_ticks(spike_ids, spike_ticks)
+
+    def _spike_decode_jobs(
+            self, buffer_manager, region, placements, graph_mapper,
+            vertices, missing, cursors=None):
+        """ Read the spikes of each vertex with neurons recording spikes,\
+            making the job to decode them; the placements of vertices with\
+            missing data are added to missing.  If cursors is a list, only\
+            the spikes after the cursor of each vertex are read, and the\
+            cursor and the number of bytes of whole records read are added\
+            to it.
+        """
+        for vertex in vertices:
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
-
-            if self._indexes[SPIKES] is None:
-                neurons_recording = vertex_slice.n_atoms
-            else:
-                neurons_recording = sum(
-                    (index >= vertex_slice.lo_atom and
-                     index <= vertex_slice.hi_atom)
-                    for index in self._indexes[SPIKES])
-                if neurons_recording == 0:
-                    continue
-                if neurons_recording < vertex_slice.n_atoms:
-                    # For spikes the overflow position is also returned
-                    neurons_recording += 1
-            # Read the spikes
-            n_words = int(math.ceil(neurons_recording / 32.0))
-            n_bytes = n_words * self.N_BYTES_PER_WORD
-            n_words_with_timestamp = n_words + 1
+            n_words = self._n_spike_words(vertex_slice)
+            if n_words == 0:
+                continue
 
             # for buffering output info is taken form the buffer manager
             neuron_param_region_data_pointer, data_missing = \
                 buffer_manager.get_data_for_vertex(
                     placement, region)
             if data_missing:
-                missing_str += "({}, {}, {}); ".format(
-                    placement.x, placement.y, placement.p)
-            record_raw = neuron_param_region_data_pointer.read_all()
-            raw_data = (numpy.asarray(record_raw, dtype="uint8").
-                        view(dtype="<i4")).reshape(
-                [-1, n_words_with_timestamp])
-            if len(raw_data) > 0:
-                record_time = raw_data[:, 0] * float(ms_per_tick)
-                spikes = raw_data[:, 1:].byteswap().view("uint8")
-                bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                    (-1, 32))).reshape((-1, n_bytes * 8))
-                time_indices, local_indices = numpy.where(bits == 1)
-                if self._indexes[SPIKES] is None:
-                    indices = local_indices + vertex_slice.lo_atom
-                    times = record_time[time_indices].reshape((-1))
-                    spike_ids.extend(indices)
-                    spike_times.extend(times)
-                else:
-                    neurons = self._neurons_recording(SPIKES, vertex_slice)
-                    n_neurons = len(neurons)
-                    for time_indice, local in zip(time_indices, local_indices):
-                        if local < n_neurons:
-                            spike_ids.append(neurons[local])
-                            spike_times.append(record_time[time_indice])
+                missing.append(placement)
+            if cursors is None:
+                record_raw = neuron_param_region_data_pointer.read_all()
+            else:
+                cursor = self._cursors.get_cursor(
+                    placement, region, neuron_param_region_data_pointer)
+                record_raw = cursor.read_new()
+                record_size = (n_words + 1) * self.N_BYTES_PER_WORD
+                cursors.append((
+                    cursor, len(record_raw) // record_size * record_size))
+            yield (len(record_raw), self._decode_spike_data, (
+                record_raw, n_words, vertex_slice))
+
+    def _decode_spike_data(self, record_raw, n_words, vertex_slice):
+        """ Get the neuron IDs and timesteps of the spikes in the recorded\
+            data of a vertex
+        """
+        return self._decode_spikes(
+            recording_utils.records_from_bytes(record_raw, n_words + 1),
+            vertex_slice)
 
-        if len(missing_str) > 0:
+    def iter_spike_columns(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex):
+        """ Read the spikes of each vertex in turn, in the order of the\
+            neurons of the vertices, so that the spikes of all the vertices\
+            are sorted by neuron ID and then timestep without being held in\
+            memory at once.
+
+        :return: The neuron IDs and timesteps of the spikes of each vertex
+        :rtype: iterable(tuple(numpy.array(uint32), numpy.array(uint32)))
+        """
+        vertices = sorted(
+            graph_mapper.get_machine_vertices(application_vertex),
+            key=lambda vertex: graph_mapper.get_slice(vertex).lo_atom)
+        missing = list()
+        jobs = self._spike_decode_jobs(
+            buffer_manager, region, placements, graph_mapper, vertices,
+            missing)
+        for ids, ticks in self._extraction_scheduler.run(jobs):
+            spikes = recording_utils.sort_spike_ticks(ids, ticks)
+            yield (spikes[:, 0], spikes[:, 1])
+
+        if missing:
             logger.warn(
                 "Population {} is missing spike data in region {} from the"
-                " following cores: {}".format(label, region, missing_str))
+                " following cores: {}".format(
+                    label, region,
+                    recording_utils.make_missing_string(missing)))
 
-        if len(spike_ids) == 0:
-            return numpy.zeros((0, 2), dtype="float")
+    def iter_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, n_timesteps_per_chunk):
+        """ Read the spikes as :py:meth:`get_spikes` does, but a window of\
+            timesteps at a time, so that only the spikes of one window are\
+            held in memory.
+
+        :param n_timesteps_per_chunk: The number of timesteps in each window
+        :type n_timesteps_per_chunk: int
+        :return: \
+            The spikes of each window that has any, in time order of the\
+            windows, with each sorted by neuron ID and then time
+        :rtype: iterable(numpy.array(int, float))
+        """
+        readers = list()
+        missing = list()
+        for vertex in graph_mapper.get_machine_vertices(application_vertex):
+            vertex_slice = graph_mapper.get_slice(vertex)
+            n_words = self._n_spike_words(vertex_slice)
+            if n_words == 0:
+                continue
+            placement = placements.get_placement_of_vertex(vertex)
+            data_pointer, data_missing = buffer_manager.get_data_for_vertex(
+                placement, region)
+            if data_missing:
+                missing.append(placement)
+
+            # There is at most one record per timestep, so a window never
+            # needs more than a chunk of records at a time
+            readers.append((vertex_slice, _RecordReader(
+                recording_utils.read_records(
+                    data_pointer, n_words + 1, n_timesteps_per_chunk),
+                n_words + 1)))
+
+        end_time = 0
+        while not all(reader.is_finished for _, reader in readers):
+            end_time += n_timesteps_per_chunk
+            spike_ids = list()
+            spike_ticks = list()
+            for vertex_slice, reader in readers:
+                ids, ticks = self._decode_spikes(
+                    reader.read_before(end_time), vertex_slice)
+                spike_ids.append(ids)
+                spike_ticks.append(ticks)
+            spikes = self._sorted_spike_ticks(spike_ids, spike_ticks)
+            if len(spikes):
+                yield recording_utils.spike_ticks_to_ms(
+                    spikes, machine_time_step)
+
+        if missing:
+            logger.warn(
+                "Population {} is missing spike data in region {} from the"
+                " following cores: {}".format(
+                    label, region,
+                    recording_utils.make_missing_string(missing)))
 
-        result = numpy.column_stack((spike_ids, spike_times))
-        return result[numpy.lexsort((spike_times, spike_ids))]
+    def reset_extraction_cursors(self):
+        """ Forget the spikes decoded so far, so that they are all decoded\
+            again when next got
+        """
+        self._cursors.clear()
 
     def get_recordable_variables(self):
         return self._sampling_rates.keys()
@@ -273,21 +566,16 @@ class NeuronRecorder(object):
         if len(indexes) == 0:
             raise ConfigurationException("Empty indexes list")
 
-        found = False
-        warning = None
-        for index in indexes:
-            if index < 0:
-                raise ConfigurationException(
-                    "Negative indexes are not supported")
-            elif index >= self._n_neurons:
-                warning = "Ignoring indexes greater than population size."
-            else:
-                found = True
-            if warning is not None:
-                logger.warning(warning)
-        if not found:
+        indexes = numpy.asarray(indexes)
+        if numpy.any(indexes < 0):
+            raise ConfigurationException(
+                "Negative indexes are not supported")
+        too_large = indexes >= self._n_neurons
+        if numpy.all(too_large):
             raise ConfigurationException(
                 "All indexes larger than population size")
+        if numpy.any(too_large):
+            logger.warning("Ignoring indexes greater than population size.")
 
     def _turn_off_recording(self, variable, sampling_interval, remove_indexes):
         if self._sampling_rates[variable] == 0:
@@ -311,12 +599,12 @@ class NeuronRecorder(object):
 
         if self._indexes[variable] is None:
             # start with all indexes
-            self._indexes[variable] = range(self._n_neurons)
+            self._indexes[variable] = numpy.arange(self._n_neurons)
 
         # remove the indexes not recording
-        self._indexes[variable] = \
-            [index for index in self._indexes[variable]
-                if index not in remove_indexes]
+        self._indexes[variable] = numpy.setdiff1d(
+            self._indexes[variable], numpy.asarray(list(remove_indexes)),
+            assume_unique=True)
 
         # Check is at least one index still recording
         if len(self._indexes[variable]) == 0:
@@ -327,14 +615,12 @@ class NeuronRecorder(object):
         if indexes is None:
             # overwriting all OK!
             return
-        if self._indexes[variable] is None:
-            if set(set(range(self._n_neurons))).issubset(set(indexes)):
-                # overwriting all previous so OK!
-                return
-        else:
-            if set(self._indexes[variable]).issubset(set(indexes)):
-                # overwriting all previous so OK!
-                return
+        previous = self._indexes[variable]
+        if previous is None:
+            previous = numpy.arange(self._n_neurons)
+        if numpy.all(numpy.isin(previous, indexes)):
+            # overwriting all previous so OK!
+            return
         raise ConfigurationException(
             "Current implementation does not support multiple "
             "sampling_intervals for {} on one population.".format(
@@ -355,19 +641,22 @@ class NeuronRecorder(object):
             self._indexes[variable] = None
         else:
             # make sure indexes is not a generator like range
-            indexes = list(indexes)
+            indexes = numpy.asarray(list(indexes), dtype="int64")
             self.check_indexes(indexes)
+            indexes = numpy.unique(indexes[indexes < self._n_neurons])
             if self._indexes[variable] is None:
                 # just use the new indexes
                 self._indexes[variable] = indexes
             else:
                 # merge the two indexes
-                self._indexes[variable] = \
-                    list(set(self._indexes[variable] + indexes))
-                self._indexes[variable].sort()
+                self._indexes[variable] = numpy.union1d(
+                    self._indexes[variable], indexes)
 
     def set_recording(self, variable, new_state, sampling_interval=None,
                       indexes=None):
+        # The layout of the recorded data may change, so nothing decoded
+        # before can be added to
+        self._cursors.clear()
         if variable == "all":
             for key in self._sampling_rates.keys():
                 self.set_recording(key, new_state, sampling_interval, indexes)
@@ -509,18 +798,11 @@ class NeuronRecorder(object):
                 data.append(numpy.arange(
                     n_bytes_for_n_neurons, dtype="uint8").view("uint32"))
             else:
-                indexes = self._indexes[variable]
-                local_index = 0
-                local_indexes = list()
-                for index in xrange(n_bytes_for_n_neurons):
-                    if index + vertex_slice.lo_atom in indexes:
-                        local_indexes.append(local_index)
-                        local_index += 1
-                    else:
-                        # write to one beyond recording range
-                        local_indexes.append(n_recording)
-                data.append(
-                    numpy.array(local_indexes, dtype="uint8").view("uint32"))
+                # Neurons not recording write to one beyond recording range
+                local_indexes = self._local_indexes(
+                    variable, vertex_slice.lo_atom, n_bytes_for_n_neurons,
+                    n_recording)
+                data.append(local_indexes.astype("uint8").view("uint32"))
         return numpy.concatenate(data)
 
     def get_global_parameters(self, vertex_slice):
@@ -542,19 +824,63 @@ class NeuronRecorder(object):
             elif self._indexes[variable] is None:
                 local_indexes = IndexIsValue()
             else:
-                local_indexes = []
-                n_recording = sum(
-                    vertex_slice.lo_atom <= index <= vertex_slice.hi_atom
-                    for index in self._indexes[variable])
-                indexes = self._indexes[variable]
-                local_index = 0
-                for index in xrange(
-                        vertex_slice.lo_atom, vertex_slice.hi_atom+1):
-                    if index in indexes:
-                        local_indexes.append(local_index)
-                        local_index += 1
-                    else:
-                        # write to one beyond recording range
-                        local_indexes.append(n_recording)
+                # Neurons not recording write to one beyond recording range
+                n_recording = self._count_recording_per_slice(
+                    variable, vertex_slice)
+                local_indexes = list(self._local_indexes(
+                    variable, vertex_slice.lo_atom, vertex_slice.n_atoms,
+                    n_recording))
             params.append(NeuronParameter(local_indexes, DataType.UINT8))
         return params
+
+
+class _RecordReader(object):
+    """ Reads the records of a vertex, which are in time order, up to given\
+        times, reading the chunks of records only as they are needed
+    """
+
+    __slots__ = [
+        # The iterator of the chunks of records still to be read
+        "_chunks",
+
+        # The number of words in each record
+        "_n_words_per_record",
+
+        # The records read but not yet returned, or None if there are none
+        "_pending"]
+
+    def __init__(self, chunks, n_words_per_record):
+        """
+        :param chunks: The chunks of records, the first word of each the\
+            timestamp
+        :type chunks: iterable(2D numpy.array(dtype="uint32"))
+        :param n_words_per_record: The number of words in each record
+        """
+        self._chunks = iter(chunks)
+        self._n_words_per_record = n_words_per_record
+        self._pending = next(self._chunks, None)
+
+    @property
+    def is_finished(self):
+        """ Whether all the records have been returned
+        """
+        return self._pending is None
+
+    def read_before(self, time):
+        """ Get the records with timestamps before a time that have not yet\
+            been returned
+
+        :param time: The time to read up to, exclusive
+        :rtype: 2D numpy.array(dtype="uint32")
+        """
+        parts = [numpy.zeros((0, self._n_words_per_record), dtype="uint32")]
+        while self._pending is not None:
+            split = numpy.searchsorted(self._pending[:, 0], time)
+            parts.append(self._pending[:split])
+            if split < len(self._pending):
+                self._pending = self._pending[split:]
+                break
+            self._pending = next(self._chunks, None)
+        if len(parts) == 2:
+            return parts[1]
+        return numpy.concatenate(parts)
@@ -0,0 +1,70 @@
+import multiprocessing
+from spynnaker.pyNN.utilities.utility_calls import (
+    can_fork, run_in_forked_pool)
+
+
+class RecordingExtractionScheduler(object):
+    """ Runs the decoding of the recorded data of each vertex, optionally\
+        across a pool of worker processes, returning the results in the\
+        order of the vertices.  The data is read by the caller in this\
+        process, and only a limited amount is read ahead of being decoded.
+    """
+
+    __slots__ = [
+        "_max_bytes_in_flight",
+        "_n_processes"]
+
+    def __init__(self, n_processes=1, max_bytes_in_flight=None):
+        """
+        :param n_processes: \
+            The number of worker processes to use, 1 to decode in this\
+            process, or None to use one per CPU
+        :type n_processes: int or None
+        :param max_bytes_in_flight: \
+            The most bytes of recorded data to decode at once, or None for\
+            no limit; at least one vertex is always decoded, and the data of\
+            the next vertex is read before it is known not to fit
+        :type max_bytes_in_flight: int or None
+        """
+        if n_processes is None:
+            n_processes = multiprocessing.cpu_count()
+        self._n_processes = max(1, n_processes)
+        self._max_bytes_in_flight = max_bytes_in_flight
+
+    @property
+    def n_processes(self):
+        return self._n_processes
+
+    def run(self, jobs):
+        """ Run the given jobs, yielding the results in the order of the jobs.
+
+        :param jobs: An iterable of (n_bytes, function, args) tuples, where\
+            n_bytes is the size of the recorded data in args; the jobs are\
+            only taken from the iterable as the data can be decoded
+        :return: An iterator of function(*args) for each job
+        """
+        if self._n_processes <= 1 or not can_fork():
+            for _, function, args in jobs:
+                yield function(*args)
+            return
+
+        for batch in self._batches(jobs):
+            for result in run_in_forked_pool(
+                    batch, self._n_processes, "recording extraction"):
+                yield result
+
+    def _batches(self, jobs):
+        """ Group the jobs into batches with no more than the bytes in flight
+        """
+        batch = list()
+        n_bytes_in_batch = 0
+        for n_bytes, function, args in jobs:
+            if batch and self._max_bytes_in_flight is not None and (
+                    n_bytes_in_batch + n_bytes > self._max_bytes_in_flight):
+                yield batch
+                batch = list()
+                n_bytes_in_batch = 0
+            batch.append((function, args))
+            n_bytes_in_batch += n_bytes
+        if batch:
+            yield batch
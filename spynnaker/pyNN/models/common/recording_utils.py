@@ -99,3 +99,119 @@ def make_missing_string(missing):
             separator, placement.x, placement.y, placement.p)
         separator = "; "
     return missing_str
+
+
+# Whether each bit of each byte value is set, least significant bit first
+_BYTE_BITS = numpy.unpackbits(
+    numpy.arange(256, dtype="uint8").reshape((-1, 1)), axis=1)[:, ::-1]
+
+
+def find_set_bits(words):
+    """ Find the bits that are set in rows of 32-bit words, where bit b of\
+        word w of a row is item (32 * w) + b of the row.  Only the words and\
+        bytes that have bits set are expanded, so the memory used depends\
+        on the number of bits set rather than the number of words.
+
+    :param words: The words, one row per record
+    :type words: 2D numpy.array(dtype="uint32")
+    :return: The row and the item of each set bit, ordered by row and item
+    :rtype: (numpy.array(int), numpy.array(int))
+    """
+    words = numpy.asarray(words, dtype="<u4")
+    rows, columns = numpy.nonzero(words)
+    word_bytes = words[rows, columns].view("uint8").reshape((-1, 4))
+    byte_words, byte_numbers = numpy.nonzero(word_bytes)
+    set_bytes, bits = numpy.nonzero(
+        _BYTE_BITS[word_bytes[byte_words, byte_numbers]])
+    byte_words = byte_words[set_bytes]
+    items = (
+        (columns[byte_words] * 32) + (byte_numbers[set_bytes] * 8) + bits)
+    return rows[byte_words], items
+
+
+def records_from_bytes(data, n_words_per_record):
+    """ Get the whole records in bytes of recorded data, without copying;\
+        any bytes after the last whole record are ignored
+
+    :param data: The bytes of the records
+    :param n_words_per_record: The number of 32-bit words in each record
+    :return: The records, one row per record
+    :rtype: 2D numpy.array(dtype="uint32")
+    """
+    n_records = len(data) // (n_words_per_record * 4)
+    return numpy.frombuffer(
+        data, dtype="<u4", count=n_records * n_words_per_record).reshape(
+            (n_records, n_words_per_record))
+
+
+def read_records(data_pointer, n_words_per_record, n_records_per_chunk=None):
+    """ Read the whole records of recorded data, a chunk at a time; any\
+        bytes after the last whole record are ignored
+
+    :param data_pointer: The buffered data storage to read from
+    :param n_words_per_record: The number of 32-bit words in each record
+    :param n_records_per_chunk:\
+        The most records to read at a time, or None to read all at once
+    :return: The records of each chunk read, one row per record
+    :rtype: iterable(2D numpy.array(dtype="uint32"))
+    """
+    record_size = n_words_per_record * 4
+    if n_records_per_chunk is None:
+        data = data_pointer.read_all()
+    else:
+        data_pointer.seek_read(0)
+        data = data_pointer.read(record_size * n_records_per_chunk)
+    while True:
+        if len(data) >= record_size:
+            yield records_from_bytes(data, n_words_per_record)
+        if (n_records_per_chunk is None or
+                len(data) < record_size * n_records_per_chunk):
+            return
+        data = data_pointer.read(record_size * n_records_per_chunk)
+
+
+def offsets_in_groups(counts):
+    """ Get the offset of each item within its group, for groups of items\
+        one after the other; for example, groups of 2, 0 and 3 items give\
+        offsets 0, 1, 0, 1, 2
+
+    :param counts: The number of items in each group
+    :type counts: numpy.array(int)
+    :rtype: numpy.array(int)
+    """
+    counts = numpy.asarray(counts, dtype="int64")
+    ends = numpy.cumsum(counts)
+    n_items = int(ends[-1]) if len(ends) else 0
+    return numpy.arange(n_items) - numpy.repeat(ends - counts, counts)
+
+
+def sort_spike_ticks(spike_ids, spike_ticks):
+    """ Make spikes of neuron IDs and timesteps sorted by neuron ID and then\
+        timestep, sorting both at once as single 64-bit integers
+
+    :param spike_ids: The neuron IDs of the spikes
+    :param spike_ticks: The timesteps of the spikes
+    :return: The sorted spikes, one row of neuron ID and timestep each
+    :rtype: 2D numpy.array(dtype="uint32")
+    """
+    keys = numpy.left_shift(
+        numpy.asarray(spike_ids).astype("uint64"), numpy.uint64(32))
+    keys |= numpy.asarray(spike_ticks).astype("uint64")
+    keys.sort()
+    return numpy.column_stack((
+        numpy.right_shift(keys, numpy.uint64(32)).astype("uint32"),
+        keys.astype("uint32")))
+
+
+def spike_ticks_to_ms(spike_ticks, machine_time_step):
+    """ Convert spikes of neuron IDs and timesteps to spikes of neuron IDs\
+        and times in milliseconds
+
+    :param spike_ticks: The spikes, one row of neuron ID and timestep each
+    :param machine_time_step: The timestep of the simulation in microseconds
+    :return: The spikes, one row of neuron ID and time each
+    :rtype: 2D numpy.array(dtype="float")
+    """
+    spikes = numpy.asarray(spike_ticks).astype("float")
+    spikes[:, 1] *= machine_time_step / 1000.0
+    return spikes
@@ -5,6 +5,7 @@ from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.utilities import utility_calls
+from spynnaker.pyNN.utilities.keyed_rng import KeyedRNG, RNGStream
 import logging
 import numpy
 import math
@@ -19,6 +20,10 @@ _expr_context = SafeEval(
     numpy.power, numpy.sin, numpy.sinh, numpy.sqrt, numpy.tan, numpy.tanh,
     numpy.maximum, numpy.minimum, e=numpy.e, pi=numpy.pi)
 
+# The maximum number of random values drawn at once when choosing most of a
+# set of items without replacement
+_MAX_DRAW_SIZE = 1 << 22
+
 
 @add_metaclass(AbstractBase)
 class AbstractConnector(object):
@@ -29,11 +34,21 @@ class AbstractConnector(object):
                             ("weight", "float64"), ("delay", "float64"),
                             ("synapse_type", "uint8")]
 
+    # A smaller form of NUMPY_SYNAPSES_DTYPE, with the source relative to the
+    # pre-vertex slice and the delay in whole timesteps
+    NUMPY_COMPACT_SYNAPSES_DTYPE = [
+        ("source", "uint16"), ("target", "uint16"), ("weight", "float32"),
+        ("delay", "uint16"), ("synapse_type", "uint8")]
+
+    # The maximum number of atoms in a pre-vertex slice of a compact block
+    MAX_COMPACT_PRE_ATOMS = 1 << 16
+
     __slots__ = [
         "_delays",
         "_min_delay",
         "_pre_population",
         "_post_population",
+        "_projection_seed",
         "_n_clipped_delays",
         "_n_post_neurons",
         "_n_pre_neurons",
@@ -53,6 +68,7 @@ class AbstractConnector(object):
         self._n_pre_neurons = None
         self._n_post_neurons = None
         self._rng = None
+        self._projection_seed = None
 
         self._n_clipped_delays = 0
         self._min_delay = 0
@@ -108,6 +124,12 @@ class AbstractConnector(object):
             self._rng = get_simulator().get_pynn_NumpyRNG()
         self._min_delay = machine_time_step / 1000.0
 
+        # Draw the seed of all the random streams of the projection up front,
+        # so that the streams don't depend on the order blocks are made in
+        self._projection_seed = [
+            int(i * 0xFFFFFFFF) for i in numpy.asarray(
+                self._rng.next(2), dtype="float64").reshape(2)]
+
     def _check_parameter(self, values, name, allow_lists):
         """ Check that the types of the values is supported.
         """
@@ -274,43 +296,177 @@ class AbstractConnector(object):
         regexpr = re.compile(r'.*d\[\d*\].*')
         return regexpr.match(d_expression)
 
-    def _generate_values(self, values, n_connections, connection_slices):
+    def _get_rng(self, stream, pre_vertex_slice=None, post_vertex_slice=None):
+        """ Get the random number generator for a stream of a block of this\
+            projection, or of the whole projection if no slices are given.
+
+        :param stream: The stream of random numbers wanted
+        :type stream: :py:class:`RNGStream`
+        :rtype: :py:class:`KeyedRNG`
+        """
+        pre_lo_atom = 0 if pre_vertex_slice is None \
+            else pre_vertex_slice.lo_atom
+        post_lo_atom = 0 if post_vertex_slice is None \
+            else post_vertex_slice.lo_atom
+        return KeyedRNG(*(self._projection_seed + [
+            pre_lo_atom, post_lo_atom, stream.value]))
+
+    @staticmethod
+    def _next_int(rng, high, size):
+        """ Get an array of the given size of uniform random integers in\
+            [0, high).
+        """
+        values = (rng.next(int(numpy.prod(size))) * high).astype(
+            "int64").reshape(size)
+
+        # Guard against values just less than 1 rounding up to high
+        return numpy.minimum(values, numpy.asarray(high) - 1)
+
+    @classmethod
+    def _choose_sorted(
+            cls, rng, n_rows, n_items, n_choices, with_replacement):
+        """ Choose n_choices items from range(n_items) at random for each of\
+            n_rows rows at once.
+
+        :return: An (n_rows, n_choices) array with each row sorted
+        """
+        # pylint: disable=too-many-arguments
+        if with_replacement or n_choices <= 1:
+            choices = cls._next_int(rng, n_items, (n_rows, n_choices))
+            choices.sort(axis=1)
+            return choices
+
+        # When most of the items are chosen, take the smallest of a random
+        # key per item, a bounded number of rows at a time
+        if 2 * n_choices > n_items:
+            choices = numpy.empty((n_rows, n_choices), dtype="int64")
+            rows_per_chunk = max(1, _MAX_DRAW_SIZE // n_items)
+            for lo in range(0, n_rows, rows_per_chunk):
+                hi = min(lo + rows_per_chunk, n_rows)
+                keys = rng.next((hi - lo) * n_items).reshape(
+                    (hi - lo, n_items))
+                choices[lo:hi] = numpy.argpartition(
+                    keys, n_choices - 1, axis=1)[:, :n_choices]
+            choices.sort(axis=1)
+            return choices
+
+        # Otherwise draw with replacement and redraw any duplicates; as this
+        # treats all items alike, each set of items is equally likely
+        choices = cls._next_int(rng, n_items, (n_rows, n_choices))
+        choices.sort(axis=1)
+        rows = numpy.arange(n_rows)
+        redrawn = choices
+        duplicate = redrawn[:, 1:] == redrawn[:, :-1]
+        has_duplicate = duplicate.any(axis=1)
+        while has_duplicate.any():
+            rows = rows[has_duplicate]
+            redrawn = redrawn[has_duplicate]
+            duplicate = duplicate[has_duplicate]
+            redrawn[:, 1:][duplicate] = cls._next_int(
+                rng, n_items, numpy.count_nonzero(duplicate))
+            redrawn.sort(axis=1)
+            choices[rows] = redrawn
+            duplicate = redrawn[:, 1:] == redrawn[:, :-1]
+            has_duplicate = duplicate.any(axis=1)
+        return choices
+
+    @staticmethod
+    def _get_csr_block(keys, n_columns, row_lo, row_hi, column_lo, column_hi):
+        """ Get the entries of a block of a sparse matrix stored as a sorted\
+            array of keys, where each key is row * n_columns + column.
+
+        :return: The rows and columns of the entries in the block
+        :rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        # pylint: disable=too-many-arguments
+        row_keys = numpy.arange(row_lo, row_hi + 1, dtype="int64") * n_columns
+        starts = numpy.searchsorted(keys, row_keys + column_lo)
+        ends = numpy.searchsorted(keys, row_keys + column_hi + 1)
+
+        # Index each entry by the start of its run in the keys plus its
+        # position within the run
+        counts = ends - starts
+        offsets = numpy.repeat(
+            starts - (numpy.cumsum(counts) - counts), counts)
+        block_keys = keys[offsets + numpy.arange(offsets.size)]
+        return block_keys // n_columns, block_keys % n_columns
+
+    def _generate_values(
+            self, values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, stream, block):
+        """ Generate a value for each connection of a block, from a float, a\
+            RandomDistribution, a list, or an expression or function of the\
+            distance between the neurons.  The sources and targets of the\
+            block must be set first if the values depend on distance.
+        """
+        # pylint: disable=too-many-arguments
         if get_simulator().is_a_pynn_random(values):
-            if n_connections == 1:
-                return numpy.array([values.next(n_connections)],
-                                   dtype="float64")
-            return values.next(n_connections)
+            # Draw by inverse transform sampling of the block's own stream so
+            # that the values don't depend on what else has been drawn;
+            # probabilities of exactly 0 are avoided as these can map to an
+            # infinite value
+            probabilities = numpy.maximum(
+                self._get_rng(
+                    stream, pre_vertex_slice, post_vertex_slice).next(
+                    n_connections), numpy.finfo("float64").tiny)
+            return numpy.asarray(utility_calls.get_percent_point_values(
+                values, probabilities), dtype="float64").reshape(
+                    n_connections)
+        elif isinstance(values, string_types) or callable(values):
+            # Strings are checked before scalars, as numpy takes a string to
+            # be a scalar
+            return self._generate_distance_values(
+                values, pre_vertex_slice, post_vertex_slice, block)
         elif numpy.isscalar(values):
             return numpy.repeat([values], n_connections).astype("float64")
         elif hasattr(values, "__getitem__"):
             return numpy.concatenate([
                 values[connection_slice]
                 for connection_slice in connection_slices]).astype("float64")
-        elif isinstance(values, string_types) or callable(values):
-            if self._space is None:
-                raise Exception(
-                    "No space object specified in projection {}-{}".format(
-                        self._pre_population, self._post_population))
-
-            expand_distances = True
-            if isinstance(values, string_types):
-                expand_distances = self._expand_distances(values)
-
-            d = self._space.distances(
-                self._pre_population.positions,
-                self._post_population.positions,
-                expand_distances)
-
-            if isinstance(values, string_types):
-                return _expr_context.eval(values)
-            return values(d)
         raise Exception("what on earth are you giving me?")
 
-    def _generate_weights(self, values, n_connections, connection_slices):
+    def _generate_distance_values(
+            self, values, pre_vertex_slice, post_vertex_slice, block):
+        """ Generate the values of the connections of a block from an\
+            expression or function of the distance between the neurons,\
+            using the distances between the neurons of the slices only.
+        """
+        if self._space is None:
+            raise Exception(
+                "No space object specified in projection {}-{}".format(
+                    self._pre_population, self._post_population))
+
+        expand_distances = True
+        if isinstance(values, string_types):
+            expand_distances = self._expand_distances(values)
+
+        d = self._space.distances(
+            self._pre_population.positions[:, pre_vertex_slice.as_slice],
+            self._post_population.positions[:, post_vertex_slice.as_slice],
+            expand_distances)
+        if isinstance(values, string_types):
+            slice_values = _expr_context.eval(values, d=d)
+        else:
+            slice_values = values(d)
+
+        # Pick out the value of each connection of the block
+        rows = block["source"]
+        if not self.is_compact_synaptic_block(block):
+            rows = rows - pre_vertex_slice.lo_atom
+        slice_values = numpy.broadcast_to(slice_values, d.shape[-2:])
+        return slice_values[
+            rows, block["target"] - post_vertex_slice.lo_atom].astype(
+                "float64")
+
+    def _generate_weights(
+            self, values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, block):
         """ Generate weight values.
         """
+        # pylint: disable=too-many-arguments
         weights = self._generate_values(
-            values, n_connections, connection_slices)
+            values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, RNGStream.WEIGHTS, block)
         if self._safe:
             if not weights.size:
                 logger_utils.warn_once(logger,
@@ -329,7 +485,7 @@ class AbstractConnector(object):
         """
 
         # count values that could be clipped
-        self._n_clipped_delays = numpy.sum(delays < self._min_delay)
+        self._n_clipped_delays += int(numpy.sum(delays < self._min_delay))
 
         # clip values
         if numpy.isscalar(delays):
@@ -340,15 +496,44 @@ class AbstractConnector(object):
                 delays[delays < self._min_delay] = self._min_delay
         return delays
 
-    def _generate_delays(self, values, n_connections, connection_slices):
+    def _generate_delays(
+            self, values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, block):
         """ Generate valid delay values.
         """
-
+        # pylint: disable=too-many-arguments
         delays = self._generate_values(
-            values, n_connections, connection_slices)
+            values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, RNGStream.DELAYS, block)
 
         return self._clip_delays(delays)
 
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        """ Do any work shared between the synaptic blocks of the given\
+            slices before the blocks are created, as they might then be\
+            created in separate processes.
+        """
+
+    def get_generation_state(self):
+        """ Get the state that creating synaptic blocks adds to, such as the\
+            number of delays clipped, so that what creating blocks in a\
+            separate process adds can be found and added to the connector of\
+            this process.
+        """
+        return self._n_clipped_delays
+
+    def get_generation_state_added(self, state):
+        """ Get what has been added to the state since it was got with\
+            :py:meth:`get_generation_state`
+        """
+        return self._n_clipped_delays - state
+
+    def add_generation_state(self, added):
+        """ Add what was added to the state of a copy of this connector, as\
+            given by :py:meth:`get_generation_state_added`
+        """
+        self._n_clipped_delays += added
+
     @abstractmethod
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
@@ -358,6 +543,75 @@ class AbstractConnector(object):
         """
         # pylint: disable=too-many-arguments
 
+    def create_compact_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        """ Create a synaptic block with NUMPY_COMPACT_SYNAPSES_DTYPE.\
+            The pre-vertex slice must have no more than\
+            MAX_COMPACT_PRE_ATOMS atoms.
+        """
+        # pylint: disable=too-many-arguments
+        return self.compact_synaptic_block(
+            self.create_synaptic_block(
+                pre_slices, pre_slice_index, post_slices, post_slice_index,
+                pre_vertex_slice, post_vertex_slice, synapse_type),
+            pre_vertex_slice, machine_time_step)
+
+    @classmethod
+    def _new_block(cls, n_connections, machine_time_step):
+        """ Create a block for the given number of connections, with\
+            NUMPY_COMPACT_SYNAPSES_DTYPE if a machine time step to convert\
+            the delays with is given, or NUMPY_SYNAPSES_DTYPE if it is None
+        """
+        if machine_time_step is None:
+            return numpy.zeros(n_connections, dtype=cls.NUMPY_SYNAPSES_DTYPE)
+        return numpy.zeros(
+            n_connections, dtype=cls.NUMPY_COMPACT_SYNAPSES_DTYPE)
+
+    @classmethod
+    def _set_block_sources(cls, block, sources, pre_vertex_slice):
+        """ Set the sources of a block from the IDs of the pre-neurons,\
+            making them relative to the pre-vertex slice if it is compact
+        """
+        if cls.is_compact_synaptic_block(block):
+            block["source"] = sources - pre_vertex_slice.lo_atom
+        else:
+            block["source"] = sources
+
+    @staticmethod
+    def _set_block_delays(block, delays, machine_time_step):
+        """ Set the delays of a block from delays in milliseconds, converting\
+            them to whole timesteps if a machine time step is given
+        """
+        if machine_time_step is None:
+            block["delay"] = delays
+        else:
+            ticks = numpy.multiply(delays, 1000.0 / machine_time_step)
+            block["delay"] = numpy.rint(ticks, out=ticks)
+
+    @classmethod
+    def compact_synaptic_block(
+            cls, block, pre_vertex_slice, machine_time_step):
+        """ Convert a block with NUMPY_SYNAPSES_DTYPE to one with\
+            NUMPY_COMPACT_SYNAPSES_DTYPE
+        """
+        compact = numpy.empty(
+            len(block), dtype=cls.NUMPY_COMPACT_SYNAPSES_DTYPE)
+        compact["source"] = block["source"] - pre_vertex_slice.lo_atom
+        compact["target"] = block["target"]
+        compact["weight"] = block["weight"]
+        compact["delay"] = numpy.rint(
+            block["delay"] * (1000.0 / machine_time_step))
+        compact["synapse_type"] = block["synapse_type"]
+        return compact
+
+    @classmethod
+    def is_compact_synaptic_block(cls, block):
+        """ Determine if a block has NUMPY_COMPACT_SYNAPSES_DTYPE
+        """
+        return block.dtype == numpy.dtype(cls.NUMPY_COMPACT_SYNAPSES_DTYPE)
+
     def get_provenance_data(self):
         name = "{}_{}_{}".format(
             self._pre_population.label, self._post_population.label,
@@ -4,6 +4,7 @@ import numpy
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.neural_projections.connectors\
     import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from data_specification.enums.data_type import DataType
 from distutils.version import StrictVersion
 from enum import Enum
@@ -49,17 +50,10 @@ class AbstractGenerateConnectorOnMachine(AbstractConnector):
     """ Indicates that the connectivity can be generated on the machine
     """
 
-    __slots__ = [
-        "_delay_seed",
-        "_weight_seed",
-        "_connector_seed"
-    ]
+    __slots__ = []
 
     def __init__(self, safe=True, verbose=False):
         AbstractConnector.__init__(self, safe=safe, verbose=verbose)
-        self._delay_seed = dict()
-        self._weight_seed = dict()
-        self._connector_seed = dict()
 
     def _generate_lists_on_machine(self, values):
         """ Checks if the connector should generate lists on machine rather\
@@ -78,25 +72,26 @@ class AbstractGenerateConnectorOnMachine(AbstractConnector):
 
         return False
 
-    def _get_connector_seed(self, pre_vertex_slice, post_vertex_slice, rng):
+    def _get_seed(self, stream, pre_vertex_slice, post_vertex_slice):
+        """ Get a seed for the machine from a stream of a given pre-post\
+            pairing; the same pairing always gets the same seed
+        """
+        return [int(i * 0xFFFFFFFF) for i in self._get_rng(
+            stream, pre_vertex_slice, post_vertex_slice).next(4)]
+
+    def _get_connector_seed(self, pre_vertex_slice, post_vertex_slice):
         """ Get the seed of the connector for a given pre-post pairing
         """
-        key = (id(pre_vertex_slice), id(post_vertex_slice))
-        if key not in self._connector_seed:
-            self._connector_seed[key] = [
-                int(i * 0xFFFFFFFF) for i in rng.next(n=4)]
-        return self._connector_seed[key]
+        return self._get_seed(
+            RNGStream.CONNECTOR_SEED, pre_vertex_slice, post_vertex_slice)
 
     def _generate_param_seed(
-            self, pre_vertex_slice, post_vertex_slice, values, seeds):
+            self, pre_vertex_slice, post_vertex_slice, values, stream):
         """ Get the seed of a parameter generator for a given pre-post pairing
         """
         if not get_simulator().is_a_pynn_random(values):
             return None
-        key = (id(pre_vertex_slice), id(post_vertex_slice), id(values))
-        if key not in seeds:
-            seeds[key] = [int(i * 0xFFFFFFFF) for i in values.rng.next(n=4)]
-        return seeds[key]
+        return self._get_seed(stream, pre_vertex_slice, post_vertex_slice)
 
     def _param_generator_params(self, values, seed):
         """ Get the parameter generator parameters as a numpy array
@@ -174,7 +169,7 @@ class AbstractGenerateConnectorOnMachine(AbstractConnector):
         """
         seed = self._generate_param_seed(
             pre_vertex_slice, post_vertex_slice, self._weights,
-            self._weight_seed)
+            RNGStream.WEIGHT_SEED)
         return self._param_generator_params(self._weights, seed)
 
     @property
@@ -200,7 +195,7 @@ class AbstractGenerateConnectorOnMachine(AbstractConnector):
         """
         seed = self._generate_param_seed(
             pre_vertex_slice, post_vertex_slice, self._delays,
-            self._delay_seed)
+            RNGStream.DELAY_SEED)
         return self._param_generator_params(self._delays, seed)
 
     @property
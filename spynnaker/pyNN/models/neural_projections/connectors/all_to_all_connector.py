@@ -33,13 +33,21 @@ class AllToAllConnector(AbstractGenerateConnectorOnMachine):
         self._set_weights_and_delays(
             weights, delays, allow_lists=True)
 
+    def _excludes_self_connections(self, pre_vertex_slice, post_vertex_slice):
+        """ Determine if self-connections must be left out of the block\
+            between the given slices.
+        """
+        return (not self._allow_self_connections and
+                self._pre_population is self._post_population and
+                pre_vertex_slice == post_vertex_slice)
+
     def _connection_slices(self, pre_vertex_slice, post_vertex_slice):
         """ Get a slice of the overall set of connections.
         """
         n_post_neurons = self._n_post_neurons
         stop_atom = post_vertex_slice.hi_atom + 1
-        if (not self._allow_self_connections and
-                pre_vertex_slice is post_vertex_slice):
+        if self._excludes_self_connections(
+                pre_vertex_slice, post_vertex_slice):
             n_post_neurons -= 1
             stop_atom -= 1
         return [
@@ -82,36 +90,61 @@ class AllToAllConnector(AbstractGenerateConnectorOnMachine):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, None)
+
+    @overrides(AbstractConnector.create_compact_synaptic_block)
+    def create_compact_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type,
+            machine_time_step)
+
+    def _create_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        """ Create a synaptic block, with NUMPY_COMPACT_SYNAPSES_DTYPE if a\
+            machine time step to convert the delays with is given
+        """
+        # pylint: disable=too-many-arguments
         n_connections = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        if (not self._allow_self_connections and
-                pre_vertex_slice is post_vertex_slice):
+        exclude_self = self._excludes_self_connections(
+            pre_vertex_slice, post_vertex_slice)
+        if exclude_self:
             n_connections -= post_vertex_slice.n_atoms
         connection_slices = self._connection_slices(
             pre_vertex_slice, post_vertex_slice)
-        block = numpy.zeros(
-            n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+        block = self._new_block(n_connections, machine_time_step)
 
-        if (not self._allow_self_connections and
-                pre_vertex_slice is post_vertex_slice):
+        if exclude_self:
+            # Connect each source to the n_atoms - 1 other targets, skipping
+            # over the target with the same index as the source
             n_atoms = pre_vertex_slice.n_atoms
-            block["source"] = numpy.where(numpy.diag(
-                numpy.repeat(1, n_atoms)) == 0)[0]
-            block["target"] = [block["source"][
-                ((n_atoms * i) + (n_atoms - 1)) - j]
-                for j in range(n_atoms) for i in range(n_atoms - 1)]
-            block["source"] += pre_vertex_slice.lo_atom
-            block["target"] += post_vertex_slice.lo_atom
+            sources = numpy.repeat(numpy.arange(n_atoms), n_atoms - 1)
+            targets = numpy.tile(numpy.arange(n_atoms - 1), n_atoms)
+            targets += targets >= sources
+            self._set_block_sources(
+                block, sources + pre_vertex_slice.lo_atom, pre_vertex_slice)
+            block["target"] = targets + post_vertex_slice.lo_atom
         else:
-            block["source"] = numpy.repeat(numpy.arange(
+            self._set_block_sources(block, numpy.repeat(numpy.arange(
                 pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1),
-                post_vertex_slice.n_atoms)
+                post_vertex_slice.n_atoms), pre_vertex_slice)
             block["target"] = numpy.tile(numpy.arange(
                 post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1),
                 pre_vertex_slice.n_atoms)
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, connection_slices)
-        block["delay"] = self._generate_delays(
-            self._delays, n_connections, connection_slices)
+            self._weights, n_connections, connection_slices,
+            pre_vertex_slice, post_vertex_slice, block)
+        self._set_block_delays(block, self._generate_delays(
+            self._delays, n_connections, connection_slices,
+            pre_vertex_slice, post_vertex_slice, block), machine_time_step)
         block["synapse_type"] = synapse_type
         return block
 
@@ -24,19 +24,11 @@ class ArrayConnector(AbstractConnector):
             (see PyNN documentation)
         """
         super(ArrayConnector, self).__init__(safe, verbose)
-        self._array = array
+        self._array = numpy.asarray(array, dtype="bool")
         # we can get the total number of connections straight away
         # from the boolean matrix
-        n_total_connections = 0
-        # array shape
-        dims = array.shape
-        for i in range(dims[0]):
-            for j in range(dims[1]):
-                if array[i, j] == 1:
-                    n_total_connections += 1
-
-        self._n_total_connections = n_total_connections
-        self._array_dims = dims
+        self._n_total_connections = numpy.count_nonzero(self._array)
+        self._array_dims = self._array.shape
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
@@ -45,13 +37,8 @@ class ArrayConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
-        n_connections = 0
-        post_lo = post_vertex_slice.lo_atom
-        post_hi = post_vertex_slice.hi_atom
-        for i in range(self._array_dims[0]):
-            for j in range(post_lo, post_hi+1):
-                if self._array[i, j] == 1:
-                    n_connections += 1
+        n_connections = numpy.count_nonzero(
+            self._array[:, post_vertex_slice.as_slice])
 
         if min_delay is None and max_delay is None:
             return n_connections
@@ -72,29 +59,21 @@ class ArrayConnector(AbstractConnector):
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
-        pre_neurons = []
-        post_neurons = []
-        n_connections = 0
-        pre_lo = pre_vertex_slice.lo_atom
-        pre_hi = pre_vertex_slice.hi_atom
-        post_lo = post_vertex_slice.lo_atom
-        post_hi = post_vertex_slice.hi_atom
-        for i in range(pre_lo, pre_hi+1):
-            for j in range(post_lo, post_hi+1):
-                if self._array[i, j] == 1:
-                    pre_neurons.append(i)
-                    post_neurons.append(j)
-                    n_connections += 1
+        pre_neurons, post_neurons = numpy.nonzero(self._array[
+            pre_vertex_slice.as_slice, post_vertex_slice.as_slice])
+        n_connections = pre_neurons.size
 
         # Feed the arrays calculated above into the block structure
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = pre_neurons
-        block["target"] = post_neurons
+        block["source"] = pre_neurons + pre_vertex_slice.lo_atom
+        block["target"] = post_neurons + post_vertex_slice.lo_atom
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["synapse_type"] = synapse_type
         return block
 
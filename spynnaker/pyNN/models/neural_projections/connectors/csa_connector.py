@@ -1,6 +1,8 @@
 from spinn_utilities.overrides import overrides
+from spynnaker.pyNN.exceptions import SpynnakerException
 from .abstract_connector import AbstractConnector
 
+import itertools
 import logging
 import numpy
 import csa
@@ -14,23 +16,35 @@ class CSAConnector(AbstractConnector):
     """
 
     __slots = [
-        "_cset"]
+        "_cset",
+        "_full_connection_set",
+        "_post_slice_key",
+        "_post_slice_pairs",
+        "_retain_connection_set"]
 
     def __init__(
             self, cset,
-            safe=True, callback=None, verbose=False):
+            safe=True, callback=None, verbose=False,
+            retain_connection_set=False):
         """
 
         :param '?' cset:
             A description of the connection set between populations
+        :param bool retain_connection_set:
+            Whether to keep every connection generated so that it can be\
+            displayed with show_connection_set
         """
         super(CSAConnector, self).__init__(safe, verbose)
         self._cset = cset
         self._verbose = verbose
+        self._retain_connection_set = retain_connection_set
 
-        # Storage for full connection sets
+        # Storage for the full connection set, if retained
         self._full_connection_set = None
-        self._full_cset = None
+
+        # The connections to the most recently requested post-vertex slice
+        self._post_slice_key = None
+        self._post_slice_pairs = None
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
@@ -38,35 +52,54 @@ class CSAConnector(AbstractConnector):
         # we can probably look at the array and do better than this?
         return self._get_delay_maximum(n_connections_max)
 
-    def _get_n_connections(self, pre_vertex_slice, post_vertex_slice):
-        # do the work from self._cset in here
-        # get the values for this slice
-        pre_lo = pre_vertex_slice.lo_atom
-        pre_hi = pre_vertex_slice.hi_atom
-        post_lo = post_vertex_slice.lo_atom
-        post_hi = post_vertex_slice.hi_atom
-
-        # this is where the magic needs to happen somehow
-        if self._full_cset is None:
-            self._full_cset = [x for x in csa.cross(
-                range(self._n_pre_neurons),
-                range(self._n_post_neurons)) * self._cset]
+    def _get_post_slice_connections(self, post_vertex_slice):
+        """ Evaluate the connection set from all the pre-neurons to the\
+            post-neurons of a slice, keeping only the most recent result.
 
-        # use CSA to cross the range of this vertex's neurons with the cset
-        pair_list = csa.cross(
-            range(pre_lo, pre_hi+1),
-            range(post_lo, post_hi+1)) * self._full_cset
+        :return: The (pre, post) pairs, sorted by pre-neuron
+        :rtype: numpy.ndarray
+        """
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if self._post_slice_key != key:
+
+            # use CSA to cross the pre-neurons with this vertex's neurons;
+            # all the pre-neurons are included as masks such as
+            # "full - oneToOne" can lose connections when the region they
+            # are evaluated over misses one of the operands entirely
+            pair_list = csa.cross(
+                range(self._n_pre_neurons),
+                range(post_vertex_slice.lo_atom,
+                      post_vertex_slice.hi_atom + 1)) * self._cset
+
+            # Read the pairs straight into an array; any values in the
+            # connection set are ignored
+            pairs = numpy.fromiter(
+                itertools.chain.from_iterable(
+                    (pair[0], pair[1]) for pair in pair_list),
+                dtype="uint32").reshape((-1, 2))
+            self._post_slice_pairs = pairs[
+                numpy.lexsort((pairs[:, 1], pairs[:, 0]))]
+            self._post_slice_key = key
+        return self._post_slice_pairs
+
+    def _get_connections(self, pre_vertex_slice, post_vertex_slice):
+        """ Get the connections between the given slices.
+
+        :return: The pre- and post-neurons of each connection
+        :rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        pairs = self._get_post_slice_connections(post_vertex_slice)
+        start, end = numpy.searchsorted(
+            pairs[:, 0],
+            [pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1])
+        pre_neurons = pairs[start:end, 0]
+        post_neurons = pairs[start:end, 1]
 
         if self._verbose:
-            print('full cset: ', self._full_cset)
-            print('this vertex pair_list: ', pair_list)
-            print('this vertex pre_neurons: ',
-                  [x[0] for x in pair_list])
-            print('this vertex post_neurons: ',
-                  [x[1] for x in pair_list])
+            print('this vertex pre_neurons: ', pre_neurons)
+            print('this vertex post_neurons: ', post_neurons)
 
-        n_connections = len(pair_list)  # size of the array created
-        return n_connections, pair_list
+        return pre_neurons, post_neurons
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
@@ -92,34 +125,68 @@ class CSAConnector(AbstractConnector):
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
-        n_connections, pair_list = self._get_n_connections(
+        pre_neurons, post_neurons = self._get_connections(
             pre_vertex_slice, post_vertex_slice)
+        n_connections = len(pre_neurons)
 
-        # Use whatever has been set up in _get_n_connections here
-        # to send into the block structure
-
-        # Use the CSA implementation to show the connection structure?
-        if self._full_connection_set is None:
-            self._full_connection_set = [x for x in pair_list]
-        else:
-            self._full_connection_set += [x for x in pair_list]
+        # Keep the connections to show the connection structure if asked
+        if self._retain_connection_set:
+            pair_list = list(zip(pre_neurons.tolist(), post_neurons.tolist()))
+            if self._full_connection_set is None:
+                self._full_connection_set = pair_list
+            else:
+                self._full_connection_set += pair_list
 
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-        # source and target are the pre_neurons and post_neurons in pair_list
-        block["source"] = [x[0] for x in pair_list]
-        block["target"] = [x[1] for x in pair_list]
+        # source and target are the pre_neurons and post_neurons
+        block["source"] = pre_neurons
+        block["target"] = post_neurons
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["synapse_type"] = synapse_type
         return block
 
+    @overrides(AbstractConnector.get_generation_state)
+    def get_generation_state(self):
+        n_pairs = 0
+        if self._full_connection_set is not None:
+            n_pairs = len(self._full_connection_set)
+        return (
+            super(CSAConnector, self).get_generation_state(), n_pairs)
+
+    @overrides(AbstractConnector.get_generation_state_added)
+    def get_generation_state_added(self, state):
+        state, n_pairs = state
+        pairs = None
+        if self._full_connection_set is not None:
+            pairs = self._full_connection_set[n_pairs:]
+        return (
+            super(CSAConnector, self).get_generation_state_added(state),
+            pairs)
+
+    @overrides(AbstractConnector.add_generation_state)
+    def add_generation_state(self, added):
+        added, pairs = added
+        super(CSAConnector, self).add_generation_state(added)
+        if pairs is not None:
+            if self._full_connection_set is None:
+                self._full_connection_set = pairs
+            else:
+                self._full_connection_set += pairs
+
     def show_connection_set(self):
+        if self._full_connection_set is None:
+            raise SpynnakerException(
+                "The connection set has not been retained; create the "
+                "CSAConnector with retain_connection_set=True to show it")
         csa.show(self._full_connection_set,
                  self._n_pre_neurons, self._n_post_neurons)
 
     def __repr__(self):
         return "CSAConnector({})".format(
-            self._full_cset)
+            self._cset)
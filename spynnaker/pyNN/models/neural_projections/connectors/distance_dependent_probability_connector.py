@@ -1,5 +1,6 @@
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from spinn_utilities.overrides import overrides
 from spinn_utilities.safe_eval import SafeEval
 import logging
@@ -13,6 +14,10 @@ from numpy import log, log10, modf, power, sin, sinh, sqrt
 from numpy import tan, tanh, maximum, minimum, e, pi
 
 logger = logging.getLogger(__name__)
+
+# The maximum number of distances computed at once when finding probabilities
+_MAX_DISTANCES_SIZE = 1 << 20
+
 _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
                            cos, cosh, exp, fabs, floor, fmod, hypot, ldexp,
                            log, log10, modf, power, sin, sinh, sqrt, tan, tanh,
@@ -62,15 +67,33 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
                 "n_connections is not implemented for"
                 " DistanceDependentProbabilityConnector on this platform")
 
-        # Get the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
-        expand_distances = self._expand_distances(self._d_expression)
-        pre_positions = self._pre_population.positions
-        post_positions = self._post_population.positions
+        # The probabilities need the positions of the populations, so are
+        # found once the projection is known
+        self._probs = None
 
-        d = self._space.distances(
-            pre_positions, post_positions, expand_distances)
-        self._probs = _d_expr_context.eval(self._d_expression, d=d)
+    def _get_probs(self):
+        """ Get the probability of connection of each pair of pre- and\
+            post-neurons, from the distances between them
+        """
+        # note: this only needs to be done once
+        if self._probs is None:
+            # TODO: Work out how this can be done statistically
+            expand_distances = self._expand_distances(self._d_expression)
+            pre_positions = self._pre_population.positions
+            post_positions = self._post_population.positions
+
+            # Find the probabilities a bounded number of pre-neurons at a time
+            self._probs = numpy.empty(
+                (self._n_pre_neurons, self._n_post_neurons), dtype="float64")
+            rows_per_chunk = max(
+                1, _MAX_DISTANCES_SIZE // self._n_post_neurons)
+            for lo in range(0, self._n_pre_neurons, rows_per_chunk):
+                hi = min(lo + rows_per_chunk, self._n_pre_neurons)
+                d = self._space.distances(
+                    pre_positions[:, lo:hi], post_positions, expand_distances)
+                self._probs[lo:hi] = _d_expr_context.eval(
+                    self._d_expression, d=d)
+        return self._probs
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
@@ -78,14 +101,14 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 self._n_pre_neurons * self._n_post_neurons,
                 self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+                numpy.amax(self._get_probs())))
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
         max_prob = numpy.amax(
-            self._probs[0:self._n_pre_neurons, post_vertex_slice.as_slice])
+            self._get_probs()[:, post_vertex_slice.as_slice])
         n_connections = utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons, self._n_pre_neurons,
             max_prob)
@@ -102,7 +125,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         # pylint: disable=too-many-arguments
         return utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons, self._n_post_neurons,
-            numpy.amax(self._probs))
+            numpy.amax(self._get_probs()))
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self):
@@ -110,7 +133,11 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         return utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
             self._n_pre_neurons * self._n_post_neurons,
-            numpy.amax(self._probs))
+            numpy.amax(self._get_probs()))
+
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._get_probs()
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
@@ -118,10 +145,12 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        probs = self._probs[
-            pre_slice_index.to_slice, post_slice_index.to_slice]
+        probs = self._get_probs()[
+            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
+        items = self._get_rng(
+            RNGStream.CONNECTIONS, pre_vertex_slice, post_vertex_slice).next(
+            n_items)
 
         # If self connections are not allowed, remove possibility the self
         # connections by setting them to a value of infinity
@@ -139,9 +168,11 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["synapse_type"] = synapse_type
         return block
 
@@ -1,6 +1,7 @@
 from __future__ import print_function
 from spinn_utilities.overrides import overrides
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from spynnaker.pyNN.utilities import utility_calls
 from spynnaker.pyNN.exceptions import SpynnakerException
 import numpy
@@ -73,12 +74,32 @@ class FixedNumberPostConnector(AbstractConnector):
         return self._get_delay_maximum(n_connections)
 
     def _get_post_neurons(self):
+        """ Get the chosen post-neurons of every pre-neuron, as a sorted\
+            array of keys pre_neuron * n_post_neurons + post_neuron.
+        """
         # If we haven't set the array up yet, do it now
         if not self._post_neurons_set:
-            self._post_neurons = [None] * self._n_pre_neurons
             self._post_neurons_set = True
 
-            # if verbose open a file to output the connectivity
+            # If the pre and post populations are the same then deal with
+            # allow_self_connections=False by choosing from one fewer
+            # neuron and skipping over the pre-neuron itself
+            no_self = (self._pre_population is self._post_population and
+                       not self._allow_self_connections)
+            n_choices = self._n_post_neurons - 1 if no_self else \
+                self._n_post_neurons
+
+            # Choose the post-neurons of all the pre-neurons at once
+            post_neurons = self._choose_sorted(
+                self._get_rng(RNGStream.CONNECTIONS),
+                self._n_pre_neurons, n_choices, self._n_post,
+                self._with_replacement)
+            pre_neurons = numpy.arange(
+                self._n_pre_neurons, dtype="int64")[:, None]
+            if no_self:
+                post_neurons += post_neurons >= pre_neurons
+
+            # if verbose output the list connected to each pre-neuron
             if self._verbose:
                 filename = self._pre_population.label + '_to_' + \
                     self._post_population.label + '_fixednumberpost-conn.csv'
@@ -88,50 +109,15 @@ class FixedNumberPostConnector(AbstractConnector):
                                   [(self._n_pre_neurons, self._n_post_neurons,
                                     self._n_post)],
                                   fmt="%u,%u,%u")
+                    numpy.savetxt(file_handle, post_neurons,
+                                  fmt=("%u,"*(self._n_post-1)+"%u"))
 
-            # Loop over all the pre neurons
-            for m in range(0, self._n_pre_neurons):
-                if self._post_neurons[m] is None:
-
-                    # If the pre and post populations are the same
-                    # then deal with allow_self_connections=False
-                    if (self._pre_population is self._post_population and
-                            not self._allow_self_connections):
-
-                        # Create a list without the pre_neuron in it
-                        no_self_post_neurons = numpy.concatenate(
-                            [numpy.arange(0, m),
-                             numpy.arange(m + 1, self._n_post_neurons)])
-
-                        # Now use this list in the random choice
-                        self._post_neurons[m] = numpy.random.choice(
-                            no_self_post_neurons, self._n_post,
-                            self._with_replacement)
-                    else:
-                        self._post_neurons[m] = numpy.random.choice(
-                            self._n_post_neurons, self._n_post,
-                            self._with_replacement)
-
-                    # If verbose then output the list connected to this
-                    # pre-neuron
-                    if self._verbose:
-                        numpy.savetxt(file_handle,
-                                      self._post_neurons[m][None, :],
-                                      fmt=("%u,"*(self._n_post-1)+"%u"))
+            # Rows are sorted, so the keys are sorted
+            post_neurons += pre_neurons * self._n_post_neurons
+            self._post_neurons = post_neurons.reshape(-1)
 
         return self._post_neurons
 
-    def _post_neurons_in_slice(self, post_vertex_slice, n):
-        post_neurons = self._get_post_neurons()
-
-        # Get the nth array and get the bits we need for
-        # this post-vertex slice
-        this_post_neuron_array = post_neurons[n]
-
-        return this_post_neuron_array[
-            (this_post_neuron_array >= post_vertex_slice.lo_atom) &
-            (this_post_neuron_array <= post_vertex_slice.hi_atom)]
-
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
@@ -139,7 +125,7 @@ class FixedNumberPostConnector(AbstractConnector):
         prob_in_slice = (
             post_vertex_slice.n_atoms / float(self._n_post_neurons))
         n_connections = utility_calls.get_probable_maximum_selected(
-            self._n_pre_neurons * self._n_pre_neurons,
+            self._n_pre_neurons * self._n_post_neurons,
             self._n_post, prob_in_slice)
 
         if min_delay is None or max_delay is None:
@@ -164,44 +150,56 @@ class FixedNumberPostConnector(AbstractConnector):
         n_connections = self._n_pre_neurons * self._n_post
         return self._get_weight_maximum(n_connections)
 
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._get_post_neurons()
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        # Get lo and hi for the pre vertex
-        lo = pre_vertex_slice.lo_atom
-        hi = pre_vertex_slice.hi_atom
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, None)
+
+    @overrides(AbstractConnector.create_compact_synaptic_block)
+    def create_compact_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type,
+            machine_time_step)
 
-        # Get number of connections
-        n_connections = 0
-        for n in range(lo, hi + 1):
-            n_connections += len(
-                self._post_neurons_in_slice(post_vertex_slice, n))
+    def _create_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        """ Create a synaptic block, with NUMPY_COMPACT_SYNAPSES_DTYPE if a\
+            machine time step to convert the delays with is given
+        """
+        # pylint: disable=too-many-arguments
+        # Cut the block out of the chosen post-neurons of each pre-neuron
+        pre_neurons, post_neurons = self._get_csr_block(
+            self._get_post_neurons(), self._n_post_neurons,
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        n_connections = len(post_neurons)
 
         # Set up the block
-        block = numpy.zeros(
-            n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        pre_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            post_neurons = self._post_neurons_in_slice(
-                post_vertex_slice, n)
-            for m in range(0, len(post_neurons)):
-                post_neurons_in_slice.append(post_neurons[m])
-                pre_neurons_in_slice.append(pre_vertex_array[n-lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
-
+        block = self._new_block(n_connections, machine_time_step)
+        self._set_block_sources(block, pre_neurons, pre_vertex_slice)
+        block["target"] = post_neurons
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
-        block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
+        self._set_block_delays(block, self._generate_delays(
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block), machine_time_step)
         block["synapse_type"] = synapse_type
         return block
 
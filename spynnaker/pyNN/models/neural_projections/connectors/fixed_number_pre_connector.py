@@ -1,5 +1,6 @@
 from spinn_utilities.overrides import overrides
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from spynnaker.pyNN.utilities import utility_calls
 from spynnaker.pyNN.exceptions import SpynnakerException
 import numpy
@@ -75,12 +76,32 @@ class FixedNumberPreConnector(AbstractConnector):
         return self._get_delay_maximum(self._n_pre * self._n_post_neurons)
 
     def _get_pre_neurons(self):
+        """ Get the chosen pre-neurons of every post-neuron, as a sorted\
+            array of keys post_neuron * n_pre_neurons + pre_neuron.
+        """
         # If we haven't set the array up yet, do it now
         if not self._pre_neurons_set:
-            self._pre_neurons = [None] * self._n_post_neurons
             self._pre_neurons_set = True
 
-            # if verbose open a file to output the connectivity
+            # If the pre and post populations are the same then deal with
+            # allow_self_connections=False by choosing from one fewer
+            # neuron and skipping over the post-neuron itself
+            no_self = (self._pre_population is self._post_population and
+                       not self._allow_self_connections)
+            n_choices = self._n_pre_neurons - 1 if no_self else \
+                self._n_pre_neurons
+
+            # Choose the pre-neurons of all the post-neurons at once
+            pre_neurons = self._choose_sorted(
+                self._get_rng(RNGStream.CONNECTIONS),
+                self._n_post_neurons, n_choices, self._n_pre,
+                self._with_replacement)
+            post_neurons = numpy.arange(
+                self._n_post_neurons, dtype="int64")[:, None]
+            if no_self:
+                pre_neurons += pre_neurons >= post_neurons
+
+            # if verbose output the list connected to each post-neuron
             if self._verbose:
                 filename = self._pre_population.label + '_to_' + \
                     self._post_population.label + '_fixednumberpre-conn.csv'
@@ -89,49 +110,14 @@ class FixedNumberPreConnector(AbstractConnector):
                                   [(self._n_pre_neurons, self._n_post_neurons,
                                     self._n_pre)],
                                   fmt="%u,%u,%u")
-
-            # Loop over all the post neurons
-            for m in range(0, self._n_post_neurons):
-
-                # If the pre and post populations are the same
-                # then deal with allow_self_connections=False
-                if (self._pre_population is self._post_population and
-                        not self._allow_self_connections):
-                    # Exclude the current pre-neuron from the post-neuron
-                    # list
-                    no_self_pre_neurons = [
-                        n for n in range(self._n_pre_neurons) if n != m]
-
-                    # Now use this list in the random choice
-                    self._pre_neurons[m] = numpy.random.choice(
-                        no_self_pre_neurons, self._n_pre,
-                        self._with_replacement)
-                else:
-                    self._pre_neurons[m] = numpy.random.choice(
-                        self._n_pre_neurons, self._n_pre,
-                        self._with_replacement)
-
-                # Sort the neurons now that we have them
-                self._pre_neurons[m].sort()
-
-                # If verbose then output the list connected to this
-                # post-neuron
-                if self._verbose:
-                    numpy.savetxt(file_handle,
-                                  self._pre_neurons[m][None, :],
+                    numpy.savetxt(file_handle, pre_neurons,
                                   fmt=("%u,"*(self._n_pre-1)+"%u"))
 
-        return self._pre_neurons
-
-    def _pre_neurons_in_slice(self, pre_vertex_slice, n):
-        pre_neurons = self._get_pre_neurons()
+            # Rows are sorted, so the keys are sorted
+            pre_neurons += post_neurons * self._n_pre_neurons
+            self._pre_neurons = pre_neurons.reshape(-1)
 
-        # Take the nth array and get the bits from it we need
-        # for this pre-vertex slice
-        this_pre_neuron_array = pre_neurons[n]
-        return this_pre_neuron_array[
-            (this_pre_neuron_array >= pre_vertex_slice.lo_atom) &
-            (this_pre_neuron_array <= pre_vertex_slice.hi_atom)]
+        return self._pre_neurons
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
@@ -165,45 +151,57 @@ class FixedNumberPreConnector(AbstractConnector):
         # pylint: disable=too-many-arguments
         return self._get_weight_maximum(self._n_pre * self._n_post_neurons)
 
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._get_pre_neurons()
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, None)
+
+    @overrides(AbstractConnector.create_compact_synaptic_block)
+    def create_compact_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type,
+            machine_time_step)
 
-        # Get lo and hi for the post vertex
-        lo = post_vertex_slice.lo_atom
-        hi = post_vertex_slice.hi_atom
+    def _create_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        """ Create a synaptic block, with NUMPY_COMPACT_SYNAPSES_DTYPE if a\
+            machine time step to convert the delays with is given
+        """
+        # pylint: disable=too-many-arguments
 
-        # Get number of connections
-        n_connections = 0
-        for n in range(lo, hi + 1):
-            n_connections += len(self._pre_neurons_in_slice(
-                pre_vertex_slice, n))
+        # Cut the block out of the chosen pre-neurons of each post-neuron
+        post_neurons, pre_neurons = self._get_csr_block(
+            self._get_pre_neurons(), self._n_pre_neurons,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom,
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom)
+        n_connections = len(pre_neurons)
 
         # Set up the block
-        block = numpy.zeros(
-            n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        post_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            pre_neurons = self._pre_neurons_in_slice(
-                pre_vertex_slice, n)
-            for m in range(0, len(pre_neurons)):
-                pre_neurons_in_slice.append(pre_neurons[m])
-                post_neurons_in_slice.append(post_vertex_array[n-lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
-
+        block = self._new_block(n_connections, machine_time_step)
+        self._set_block_sources(block, pre_neurons, pre_vertex_slice)
+        block["target"] = post_neurons
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
-        block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
+        self._set_block_delays(block, self._generate_delays(
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block), machine_time_step)
         block["synapse_type"] = synapse_type
         return block
 
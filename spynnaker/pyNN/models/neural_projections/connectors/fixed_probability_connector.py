@@ -1,6 +1,7 @@
 from spinn_utilities.overrides import overrides
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 import decimal
 from .abstract_generate_connector_on_machine \
     import AbstractGenerateConnectorOnMachine, ConnectorIDs
@@ -92,8 +93,33 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, None)
+
+    @overrides(AbstractConnector.create_compact_synaptic_block)
+    def create_compact_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type,
+            machine_time_step)
+
+    def _create_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        """ Create a synaptic block, with NUMPY_COMPACT_SYNAPSES_DTYPE if a\
+            machine time step to convert the delays with is given
+        """
+        # pylint: disable=too-many-arguments
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
+        items = self._get_rng(
+            RNGStream.CONNECTIONS, pre_vertex_slice, post_vertex_slice).next(
+            n_items)
 
         # If self connections are not allowed, remove possibility the self
         # connections by setting them to a value of infinity
@@ -104,15 +130,19 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
         ids = numpy.where(present)[0]
         n_connections = numpy.sum(present)
 
-        block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = (
-            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
+        block = self._new_block(n_connections, machine_time_step)
+        self._set_block_sources(
+            block,
+            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom,
+            pre_vertex_slice)
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
-        block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
+        self._set_block_delays(block, self._generate_delays(
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block), machine_time_step)
         block["synapse_type"] = synapse_type
         return block
 
@@ -135,7 +165,7 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
             round(decimal.Decimal(
                 str(self._p_connect)) * DataType.U032.scale)]
         params.extend(self._get_connector_seed(
-            pre_vertex_slice, post_vertex_slice, self._rng))
+            pre_vertex_slice, post_vertex_slice))
         return numpy.array(params, dtype="uint32")
 
     @property
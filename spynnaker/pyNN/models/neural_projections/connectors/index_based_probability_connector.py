@@ -1,6 +1,7 @@
 from spinn_utilities.overrides import overrides
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from spinn_utilities.safe_eval import SafeEval
 import logging
 import numpy
@@ -19,6 +20,11 @@ _index_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2,
                                tan, tanh, maximum, minimum, e=e, pi=pi)
 
 
+# The maximum number of probabilities evaluated at once when scanning the
+# whole index space (e.g. to find the maximum probability)
+_MAX_TILE_SIZE = 1 << 20
+
+
 class IndexBasedProbabilityConnector(AbstractConnector):
     """ Make connections using a probability distribution which varies
         dependent upon the indices of the pre- and post-populations.
@@ -27,16 +33,19 @@ class IndexBasedProbabilityConnector(AbstractConnector):
     __slots = [
         "_allow_self_connections",
         "_index_expression",
-        "_probs"]
+        "_max_prob"]
 
     def __init__(
             self, index_expression, allow_self_connections=True, rng=None,
             safe=True, callback=None, verbose=False):
         """
-        :param `string` index_expression:
+        :param index_expression:
             the right-hand side of a valid python expression for
             probability, involving the indices of the pre and post populations,
             that can be parsed by eval(), that computes a probability dist.
+            Alternatively, a vectorised callable f(i, j) that is given arrays
+            of pre- and post-indices and returns an array of probabilities.
+        :type index_expression: str or callable
         :param `bool` allow_self_connections:
             if the connector is used to connect a
             Population to itself, this flag determines whether a neuron is
@@ -47,33 +56,58 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         self._index_expression = index_expression
         self._allow_self_connections = allow_self_connections
 
-        self._probs = None
+        self._max_prob = None
 
-    def _update_probs_from_index_expression(self):
+    def _get_probs(self, pre_lo, pre_hi, post_lo, post_hi):
+        """ Evaluate the index expression over a tile of the index space.
+
+        :param pre_lo: The first pre-index of the tile
+        :param pre_hi: The last pre-index of the tile (inclusive)
+        :param post_lo: The first post-index of the tile
+        :param post_hi: The last post-index of the tile (inclusive)
+        :return: A 2D array of probabilities, pre-indices by post-indices
+        """
+        # pylint: disable=too-many-arguments
+        i, j = numpy.mgrid[pre_lo:pre_hi + 1, post_lo:post_hi + 1].astype(
+            "float64")
+        if callable(self._index_expression):
+            probs = self._index_expression(i, j)
+        else:
+            probs = _index_expr_context.eval(self._index_expression, i=i, j=j)
+
+        # Expressions that don't depend on both indices may not broadcast
+        return numpy.broadcast_to(probs, i.shape)
+
+    def _get_max_prob(self):
+        """ Get the maximum probability over the whole index space,\
+            evaluating the expression a bounded number of rows at a time.
+        """
         # note: this only needs to be done once
-        if self._probs is None:
-            # numpy array of probabilities using the index_expression
-            self._probs = numpy.fromfunction(
-                lambda i, j: _index_expr_context.eval(
-                    self._index_expression, i=i, j=j),
-                (self._n_pre_neurons, self._n_post_neurons))
+        if self._max_prob is None:
+            rows_per_tile = max(1, _MAX_TILE_SIZE // self._n_post_neurons)
+            self._max_prob = max(
+                numpy.amax(self._get_probs(
+                    pre_lo, min(pre_lo + rows_per_tile,
+                                self._n_pre_neurons) - 1,
+                    0, self._n_post_neurons - 1))
+                for pre_lo in range(
+                    0, self._n_pre_neurons, rows_per_tile))
+        return self._max_prob
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
-        self._update_probs_from_index_expression()
         n_connections = utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
             self._n_pre_neurons * self._n_post_neurons,
-            numpy.amax(self._probs))
+            self._get_max_prob())
         return self._get_delay_maximum(n_connections)
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
-        self._update_probs_from_index_expression()
         n_connections = utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
-            post_vertex_slice.n_atoms, numpy.amax(self._probs))
+            post_vertex_slice.n_atoms, self._get_max_prob())
 
         if min_delay is None or max_delay is None:
             return int(math.ceil(n_connections))
@@ -84,18 +118,16 @@ class IndexBasedProbabilityConnector(AbstractConnector):
 
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self):
-        self._update_probs_from_index_expression()
         return utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
-            self._n_pre_neurons, numpy.amax(self._probs))
+            self._n_pre_neurons, self._get_max_prob())
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self):
-        self._update_probs_from_index_expression()
         n_connections = utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
             self._n_pre_neurons * self._n_post_neurons,
-            numpy.amax(self._probs))
+            self._get_max_prob())
         return self._get_weight_maximum(n_connections)
 
     @overrides(AbstractConnector.create_synaptic_block)
@@ -103,15 +135,15 @@ class IndexBasedProbabilityConnector(AbstractConnector):
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
-
-        # setup probs here
-        self._update_probs_from_index_expression()
-
-        probs = self._probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
+        # Only evaluate the probabilities of this block
+        probs = self._get_probs(
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom).reshape(-1)
 
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
+        items = self._get_rng(
+            RNGStream.CONNECTIONS, pre_vertex_slice, post_vertex_slice).next(
+            n_items)
 
         # If self connections are not allowed, remove the possibility of self
         # connections by setting the probability to a value of infinity
@@ -125,13 +157,15 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
         block["source"] = (
-            (ids / post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
+            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["synapse_type"] = synapse_type
         return block
 
@@ -154,3 +188,4 @@ class IndexBasedProbabilityConnector(AbstractConnector):
     @index_expression.setter
     def index_expression(self, new_value):
         self._index_expression = new_value
+        self._max_prob = None
@@ -1,14 +1,14 @@
 from spinn_utilities.overrides import overrides
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from .abstract_generate_connector_on_machine \
     import AbstractGenerateConnectorOnMachine, ConnectorIDs
 from spynnaker.pyNN.exceptions import SpynnakerException
 from spinn_utilities.abstract_base import abstractmethod
 
-import numpy.random
+import numpy
 import math
-from six import raise_from
 
 import logging
 logger = logging.getLogger(__name__)
@@ -111,54 +111,98 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
     def get_weight_maximum(self):
         return self._get_weight_maximum(self._num_synapses)
 
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._update_synapses_per_post_vertex(pre_slices, post_slices)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, None)
+
+    @overrides(AbstractConnector.create_compact_synaptic_block)
+    def create_compact_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        # pylint: disable=too-many-arguments
+        return self._create_block(
+            pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type,
+            machine_time_step)
+
+    def _create_block(
+            self, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type, machine_time_step):
+        """ Create a synaptic block, with NUMPY_COMPACT_SYNAPSES_DTYPE if a\
+            machine time step to convert the delays with is given
+        """
+        # pylint: disable=too-many-arguments
         # update the synapses as required, and get the number of connections
         self._update_synapses_per_post_vertex(pre_slices, post_slices)
         n_connections = self._get_n_connections(
             pre_slice_index, post_slice_index)
         if n_connections == 0:
-            return numpy.zeros(0, dtype=self.NUMPY_SYNAPSES_DTYPE)
+            return self._new_block(0, machine_time_step)
 
         # get connection slice
         connection_slice = self._get_connection_slice(
             pre_slice_index, post_slice_index)
 
         # set up array for synaptic block
-        block = numpy.zeros(
-            n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Create pairs between the pre- and post-vertex slices
-        pairs = numpy.mgrid[pre_vertex_slice.as_slice,
-                            post_vertex_slice.as_slice].T.reshape((-1, 2))
+        block = self._new_block(n_connections, machine_time_step)
 
-        # Deal with case where self-connections aren't allowed
+        # Work out which pairs of the block are self-connections; these lie
+        # on the diagonal where the pre- and post-vertex slices overlap
+        n_post_atoms = post_vertex_slice.n_atoms
+        n_pairs = pre_vertex_slice.n_atoms * n_post_atoms
+        self_atoms = numpy.zeros(0, dtype="int64")
         if not self._allow_self_connections and (self._pre_population is
                                                  self._post_population):
-            pairs = pairs[pairs[:, 0] != pairs[:, 1]]
-
-        # Now do the actual random choice from the available connections
-        try:
-            chosen = numpy.random.choice(
-                pairs.shape[0], size=n_connections,
-                replace=self._with_replacement)
-        except Exception as e:
-            raise_from(SpynnakerException(
+            self_atoms = numpy.arange(
+                max(pre_vertex_slice.lo_atom, post_vertex_slice.lo_atom),
+                min(pre_vertex_slice.hi_atom, post_vertex_slice.hi_atom) + 1,
+                dtype="int64")
+        n_pairs -= self_atoms.size
+
+        if not self._with_replacement and n_connections > n_pairs:
+            raise SpynnakerException(
                 "MultapseConnector: The number of connections is too large "
                 "for sampling without replacement; "
-                "reduce the value specified in the connector"), e)
+                "reduce the value specified in the connector")
+
+        # Now do the actual random choice from the available connections,
+        # as indices into the pairs with the self-connections removed
+        chosen = self._choose_sorted(
+            self._get_rng(
+                RNGStream.CONNECTIONS, pre_vertex_slice, post_vertex_slice),
+            1, n_pairs, n_connections, self._with_replacement)[0]
+
+        # Map the chosen indices to indices into all the pairs by skipping
+        # over the self-connections before each one
+        self_pairs = (
+            (self_atoms - pre_vertex_slice.lo_atom) * n_post_atoms +
+            (self_atoms - post_vertex_slice.lo_atom))
+        chosen += numpy.searchsorted(
+            self_pairs - numpy.arange(self_pairs.size), chosen, side="right")
 
         # Set up synaptic block
-        block["source"] = pairs[chosen, 0]
-        block["target"] = pairs[chosen, 1]
+        self._set_block_sources(
+            block, (chosen // n_post_atoms) + pre_vertex_slice.lo_atom,
+            pre_vertex_slice)
+        block["target"] = (chosen % n_post_atoms) + post_vertex_slice.lo_atom
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, [connection_slice])
-        block["delay"] = self._generate_delays(
-            self._delays, n_connections, [connection_slice])
+            self._weights, n_connections, [connection_slice],
+            pre_vertex_slice, post_vertex_slice, block)
+        self._set_block_delays(block, self._generate_delays(
+            self._delays, n_connections, [connection_slice],
+            pre_vertex_slice, post_vertex_slice, block), machine_time_step)
         block["synapse_type"] = synapse_type
         return block
 
@@ -185,7 +229,7 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
             n_connections,
             pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms]
         params.extend(self._get_connector_seed(
-            pre_vertex_slice, post_vertex_slice, self._rng))
+            pre_vertex_slice, post_vertex_slice))
         return numpy.array(params, dtype="uint32")
 
     @property
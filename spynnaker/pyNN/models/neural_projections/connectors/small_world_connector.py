@@ -1,13 +1,19 @@
 from .abstract_connector import AbstractConnector
+from spynnaker.pyNN.utilities.keyed_rng import RNGStream
 from spinn_utilities.overrides import overrides
 import numpy
 
+# The maximum number of distances computed at once when finding neighbours
+_MAX_DISTANCES_SIZE = 1 << 20
+
 
 class SmallWorldConnector(AbstractConnector):
     __slots__ = [
         "_degree",
         "_mask",
         "_n_connections",
+        "_n_connections_to_post_maximum",
+        "_post_neurons",
         "_rewiring"]
 
     def __init__(
@@ -22,31 +28,56 @@ class SmallWorldConnector(AbstractConnector):
                 "n_connections is not implemented for"
                 " SmallWorldConnector on this platform")
 
-        # Get the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
-        pre_positions = self._pre_population.positions
-        post_positions = self._post_population.positions
-        distances = self._space.distances(
-            pre_positions, post_positions, False)
         self._degree = degree
-        self._mask = (distances < degree).as_type(float)
-        self._n_connections = numpy.sum(self._mask)
+        self._mask = None
+        self._post_neurons = None
+        self._n_connections = None
+        self._n_connections_to_post_maximum = None
+
+    def _get_mask(self):
+        """ Get the neighbours of each pre-neuron as a sorted array of keys\
+            pre_neuron * n_post_neurons + post_neuron, i.e. the mask in\
+            compressed sparse row form.
+        """
+        # note: this only needs to be done once
+        if self._mask is None:
+            pre_positions = self._pre_population.positions
+            post_positions = self._post_population.positions
+
+            # Find the neighbours a bounded number of pre-neurons at a time
+            rows_per_chunk = max(
+                1, _MAX_DISTANCES_SIZE // self._n_post_neurons)
+            keys = list()
+            for lo in range(0, self._n_pre_neurons, rows_per_chunk):
+                hi = min(lo + rows_per_chunk, self._n_pre_neurons)
+                distances = self._space.distances(
+                    pre_positions[:, lo:hi], post_positions, False)
+                pre_neurons, post_neurons = numpy.nonzero(
+                    distances < self._degree)
+                keys.append(
+                    (pre_neurons.astype("int64") + lo) *
+                    self._n_post_neurons + post_neurons)
+            self._mask = numpy.concatenate(keys)
+            self._post_neurons = self._mask % self._n_post_neurons
+            self._n_connections = self._mask.size
+        return self._mask
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
+        self._get_mask()
         return self._get_delay_maximum(self._n_connections)
 
-    def _get_n_connections(self, pre_vertex_slice, post_vertex_slice):
-        return numpy.sum(
-            self._mask[pre_vertex_slice.as_slice, post_vertex_slice.as_slice])
-
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
-        n_connections = numpy.amax([
-            numpy.sum(self._mask[i, post_vertex_slice.as_slice])
-            for i in range(self._n_pre_neurons)])
+        mask = self._get_mask()
+        post_neurons = self._post_neurons
+        in_slice = ((post_neurons >= post_vertex_slice.lo_atom) &
+                    (post_neurons <= post_vertex_slice.hi_atom))
+        n_connections = numpy.amax(numpy.bincount(
+            mask[in_slice] // self._n_post_neurons,
+            minlength=self._n_pre_neurons))
 
         if min_delay is None or max_delay is None:
             return n_connections
@@ -57,12 +88,17 @@ class SmallWorldConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self):
         # pylint: disable=too-many-arguments
-        return numpy.amax([
-            numpy.sum(self._mask[:, i]) for i in range(self._n_post_neurons)])
+        if self._n_connections_to_post_maximum is None:
+            self._get_mask()
+            self._n_connections_to_post_maximum = numpy.amax(numpy.bincount(
+                self._post_neurons,
+                minlength=self._n_post_neurons))
+        return self._n_connections_to_post_maximum
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self):
         # pylint: disable=too-many-arguments
+        self._get_mask()
         return self._get_weight_maximum(self._n_connections)
 
     @overrides(AbstractConnector.create_synaptic_block)
@@ -71,26 +107,30 @@ class SmallWorldConnector(AbstractConnector):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        ids = numpy.where(self._mask[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice])[0]
-        n_connections = numpy.sum(ids)
+        sources, targets = self._get_csr_block(
+            self._get_mask(), self._n_post_neurons,
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        n_connections = sources.size
 
         block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = (
-            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
-        block["target"] = (
-            (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
+        block["source"] = sources
+        block["target"] = targets
         block["weight"] = self._generate_weights(
-            self._weights, n_connections, None)
+            self._weights, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["delay"] = self._generate_delays(
-            self._delays, n_connections, None)
+            self._delays, n_connections, None,
+            pre_vertex_slice, post_vertex_slice, block)
         block["synapse_type"] = synapse_type
 
         # Re-wire some connections
-        rewired = numpy.where(
-            self._rng.next(n_connections) < self._rewiring)[0]
+        rng = self._get_rng(
+            RNGStream.REWIRING, pre_vertex_slice, post_vertex_slice)
+        rewired = numpy.where(rng.next(n_connections) < self._rewiring)[0]
         block["target"][rewired] = (
-            (self._rng.next(rewired.size) * (post_vertex_slice.n_atoms - 1)) +
+            (rng.next(rewired.size) *
+             (post_vertex_slice.n_atoms - 1)) +
             post_vertex_slice.lo_atom)
 
         return block
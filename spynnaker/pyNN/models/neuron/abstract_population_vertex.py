@@ -35,6 +35,7 @@ from spynnaker.pyNN.models.neuron.synaptic_manager import SynapticManager
 from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from spynnaker.pyNN.models.common import AbstractNeuronRecordable
 from spynnaker.pyNN.models.common import NeuronRecorder
+from spynnaker.pyNN.models.common import RecordingExtractionScheduler
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.models.neuron.population_machine_vertex \
     import PopulationMachineVertex
@@ -141,7 +142,12 @@ class AbstractPopulationVertex(
         # Set up for recording
         recordables = ["spikes"]
         recordables.extend(self._neuron_impl.get_recordable_variables())
-        self._neuron_recorder = NeuronRecorder(recordables, n_neurons)
+        self._neuron_recorder = NeuronRecorder(
+            recordables, n_neurons, RecordingExtractionScheduler(
+                helpful_functions.read_config_int(
+                    config, "Recording", "n_extraction_processes"),
+                helpful_functions.read_config_int(
+                    config, "Recording", "extraction_bytes_in_flight")))
 
         self._time_between_requests = config.getint(
             "Buffers", "time_between_requests")
@@ -565,6 +571,29 @@ class AbstractPopulationVertex(
             self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
             placements, graph_mapper, self, machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.get_spike_ticks)
+    def get_spike_ticks(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._neuron_recorder.get_spike_ticks(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self)
+
+    @overrides(AbstractSpikeRecordable.iter_spikes)
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            n_timesteps_per_chunk):
+        return self._neuron_recorder.iter_spikes(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self, machine_time_step,
+            n_timesteps_per_chunk)
+
+    @overrides(AbstractSpikeRecordable.iter_spike_columns)
+    def iter_spike_columns(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._neuron_recorder.iter_spike_columns(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self)
+
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
         return self._neuron_recorder.get_recordable_variables()
@@ -592,6 +621,16 @@ class AbstractPopulationVertex(
             self.label, buffer_manager, index, placements, graph_mapper,
             self, variable, n_machine_time_steps)
 
+    @overrides(AbstractNeuronRecordable.iter_data)
+    def iter_data(self, variable, n_machine_time_steps, placements,
+                  graph_mapper, buffer_manager, machine_time_step,
+                  n_rows_per_chunk):
+        # pylint: disable=too-many-arguments
+        index = 1 + self._neuron_impl.get_recordable_variable_index(variable)
+        return self._neuron_recorder.iter_matrix_data(
+            self.label, buffer_manager, index, placements, graph_mapper,
+            self, variable, n_machine_time_steps, n_rows_per_chunk)
+
     @overrides(AbstractNeuronRecordable.get_neuron_sampling_interval)
     def get_neuron_sampling_interval(self, variable):
         return self._neuron_recorder.get_neuron_sampling_interval(variable)
@@ -607,6 +646,7 @@ class AbstractPopulationVertex(
                 "Vertex does not support initialisation of"
                 " parameter {}".format(variable))
         self._state_variables.set_value(variable, value)
+        self._neuron_impl.mark_values_changed(variable)
         self._change_requires_neuron_parameters_reload = True
 
     @property
@@ -651,6 +691,14 @@ class AbstractPopulationVertex(
 
         ranged_list = self._state_variables[parameter]
         ranged_list.set_value_by_selector(selector, value)
+        self.__mark_values_changed(parameter, ranged_list, selector)
+        self._change_requires_neuron_parameters_reload = True
+
+    def __mark_values_changed(self, variable, ranged_list, selector):
+        ids = ranged_list.selector_to_ids(selector)
+        if len(ids):
+            self._neuron_impl.mark_values_changed(
+                variable, min(ids), max(ids))
 
     @property
     def conductance_based(self):
@@ -675,6 +723,14 @@ class AbstractPopulationVertex(
                 "Population {} does not have parameter {}".format(
                     self._neuron_impl.model_name, key))
         self._parameters.set_value(key, value)
+        self._neuron_impl.mark_values_changed(key)
+        self._change_requires_neuron_parameters_reload = True
+
+    @overrides(AbstractPopulationSettable.set_value_by_selector)
+    def set_value_by_selector(self, selector, key, value):
+        super(AbstractPopulationVertex, self).set_value_by_selector(
+            selector, key, value)
+        self.__mark_values_changed(key, self._parameters[key], selector)
         self._change_requires_neuron_parameters_reload = True
 
     @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
@@ -798,15 +854,22 @@ class AbstractPopulationVertex(
         if variable != "spikes":
             index = 1 + self._neuron_impl.get_recordable_variable_index(
                 variable)
+        else:
+            self._neuron_recorder.reset_extraction_cursors()
         self._clear_recording_region(
             buffer_manager, placements, graph_mapper, index)
 
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        self._neuron_recorder.reset_extraction_cursors()
         self._clear_recording_region(
             buffer_manager, placements, graph_mapper,
             AbstractPopulationVertex.SPIKE_RECORDING_REGION)
 
+    @overrides(AbstractSpikeRecordable.reset_extraction_cursors)
+    def reset_extraction_cursors(self):
+        self._neuron_recorder.reset_extraction_cursors()
+
     def _clear_recording_region(
             self, buffer_manager, placements, graph_mapper,
             recording_region_id):
@@ -866,3 +929,12 @@ class AbstractPopulationVertex(
 
     def gen_on_machine(self, vertex_slice):
         return self._synapse_manager.gen_on_machine(vertex_slice)
+
+    def get_synapse_generation_totals(self, vertex_slice):
+        """ Get the estimated number of synapses chosen to be generated on\
+            the machine, and the number of bytes of synaptic data written to\
+            be loaded, for a slice of the vertex
+
+        :rtype: tuple(int, int)
+        """
+        return self._synapse_manager.get_generation_totals(vertex_slice)
@@ -148,6 +148,21 @@ class AbstractNeuronImpl(object):
         :rtype: numpy array of uint32
         """
 
+    @abstractmethod
+    def mark_values_changed(self, variable, lo_atom=0, hi_atom=None):
+        """ Indicate that the values of a parameter or state variable of some\
+            atoms have changed, so that the data of those atoms is generated\
+            again when next requested
+
+        :param variable: The name of the parameter or state variable
+        :type variable: str
+        :param lo_atom: The first atom that has changed
+        :type lo_atom: int
+        :param hi_atom: The last atom that has changed, or None for all atoms\
+            after the first
+        :type hi_atom: int or None
+        """
+
     @abstractmethod
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
@@ -9,7 +9,7 @@ class AbstractStandardNeuronComponent(object):
     """ Represents a component of a standard neural model
     """
 
-    __slots__ = ("_struct")
+    __slots__ = ("_struct", "_data_cache")
 
     def __init__(self, data_types):
         """
@@ -20,6 +20,10 @@ class AbstractStandardNeuronComponent(object):
         """
         self._struct = Struct(data_types)
 
+        # The structs packed for each vertex slice, by (lo_atom, hi_atom),
+        # with the ranges of atoms that have changed since they were packed
+        self._data_cache = dict()
+
     @property
     def struct(self):
         """ The structure of the component
@@ -100,11 +104,43 @@ class AbstractStandardNeuronComponent(object):
         :type state_variables:\
             :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
         :param vertex_slice: The slice of the vertex to generate parameters for
-        :rtype: numpy array of uint32
+        :rtype: numpy array of uint32, which must not be changed
+        """
+        key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
+        if key not in self._data_cache:
+            values = self.get_values(parameters, state_variables, vertex_slice)
+            self._data_cache[key] = (self.struct.get_array(
+                values, vertex_slice.lo_atom, vertex_slice.n_atoms), list())
+        data, changed = self._data_cache[key]
+
+        # Only pack again the atoms that have changed
+        if changed:
+            values = self.get_values(parameters, state_variables, vertex_slice)
+            for start, stop in changed:
+                data[start - vertex_slice.lo_atom:
+                     stop - vertex_slice.lo_atom] = self.struct.get_array(
+                        values, start, stop - start)
+            del changed[:]
+        return self.struct.to_words(data)
+
+    def mark_values_changed(self, lo_atom=0, hi_atom=None):
+        """ Indicate that the values of some atoms have changed, so that\
+            their data is packed again when next requested
+
+        :param lo_atom: The first atom that has changed
+        :type lo_atom: int
+        :param hi_atom: The last atom that has changed, or None for all atoms\
+            after the first
+        :type hi_atom: int or None
         """
-        values = self.get_values(parameters, state_variables, vertex_slice)
-        return self.struct.get_data(
-            values, vertex_slice.lo_atom, vertex_slice.n_atoms)
+        for (slice_lo_atom, slice_hi_atom), (_, changed) in \
+                self._data_cache.items():
+            start = max(lo_atom, slice_lo_atom)
+            stop = slice_hi_atom + 1
+            if hi_atom is not None:
+                stop = min(hi_atom + 1, stop)
+            if start < stop:
+                changed.append((start, stop))
 
     @abstractmethod
     def update_values(self, values, parameters, state_variables):
@@ -140,6 +176,7 @@ class AbstractStandardNeuronComponent(object):
         params = RangedDictVertexSlice(parameters, vertex_slice)
         variables = RangedDictVertexSlice(state_variables, vertex_slice)
         self.update_values(values, params, variables)
+        self.mark_values_changed(vertex_slice.lo_atom, vertex_slice.hi_atom)
         return new_offset
 
     @abstractmethod
@@ -135,6 +135,16 @@ class NeuronImplStandard(AbstractNeuronImpl):
             for component in self._components
         ])
 
+    @overrides(AbstractNeuronImpl.mark_values_changed)
+    def mark_values_changed(self, variable, lo_atom=0, hi_atom=None):
+        components = [
+            component for component in self._components
+            if component.has_variable(variable)]
+
+        # If no component claims the variable, any of them might use it
+        for component in components or self._components:
+            component.mark_values_changed(lo_atom, hi_atom)
+
     @overrides(AbstractNeuronImpl.read_data)
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
@@ -1,6 +1,7 @@
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.ranged.ranged_list import RangedList
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
+from spynnaker.pyNN.utilities.utility_calls import convert_to_array
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 import numpy
 
@@ -63,18 +64,38 @@ class Struct(object):
         :param array_size: The number of structs to generate
         :rtype: numpy.array(dtype="uint32")
         """
+        return self.to_words(self.get_array(values, offset, array_size))
+
+    def get_array(self, values, offset=0, array_size=1):
+        """ Get a numpy array of structs for the given values
+
+        :param values:\
+            A list of values with length the same size as the number of fields\
+            returned by field_types
+        :type values:\
+            list of (single value or list of values or RangedList of values)
+        :param offset: The offset into each of the values where to start
+        :param array_size: The number of structs to generate
+        :rtype: numpy.array(dtype=self.numpy_dtype)
+        """
         # Create an array to store values in
         data = numpy.zeros(array_size, dtype=self.numpy_dtype)
 
         # Go through and get the values and put them in the array
         for i, (values, data_type) in enumerate(zip(values, self.field_types)):
 
+            # All values saturate at the limits of the data type, whether
+            # single values, lists or ranges
             if is_singleton(values):
-                data_value = convert_to(values, data_type)
+                data_value = convert_to_array(values, data_type)
                 data["f" + str(i)] = data_value
+            elif isinstance(values, SpynnakerRangedList):
+                data["f" + str(i)] = convert_to_array(
+                    values.get_array_by_slice(offset, offset + array_size),
+                    data_type)
             elif not isinstance(values, RangedList):
-                data_value = [convert_to(v, data_type)
-                              for v in values[offset:(offset + array_size)]]
+                data_value = convert_to_array(
+                    values[offset:(offset + array_size)], data_type)
                 data["f" + str(i)] = data_value
             else:
                 for start, end, value in values.iter_ranges_by_slice(
@@ -83,14 +104,22 @@ class Struct(object):
                     # Get the values and get them into the correct data type
                     if get_simulator().is_a_pynn_random(value):
                         values = value.next(end - start)
-                        data_value = [convert_to(v, data_type) for v in values]
+                        data_value = convert_to_array(values, data_type)
                     else:
-                        data_value = convert_to(value, data_type)
+                        data_value = convert_to_array(value, data_type)
                     data["f" + str(i)][
                         start - offset:end - offset] = data_value
 
-        # Pad to whole number of uint32s
-        overflow = (array_size * self.numpy_dtype.itemsize) % 4
+        return data
+
+    def to_words(self, data):
+        """ Get an array of structs as a numpy array of uint32, padded to a\
+            whole number of words
+
+        :param data: The array of structs, as returned by get_array
+        :rtype: numpy.array(dtype="uint32")
+        """
+        overflow = data.nbytes % 4
         if overflow != 0:
             data = numpy.pad(data.view("uint8"), (0, 4 - overflow), "constant")
 
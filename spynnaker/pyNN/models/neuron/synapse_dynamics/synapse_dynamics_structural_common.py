@@ -5,6 +5,8 @@ import collections
 from data_specification.enums.data_type import DataType
 from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
 from spynnaker.pyNN.models.neural_projections import ProjectionMachineEdge
+from spynnaker.pyNN.models.neural_projections.connectors import \
+    AbstractConnector
 from .abstract_synapse_dynamics_structural import \
     AbstractSynapseDynamicsStructural
 from spynnaker.pyNN.utilities import constants
@@ -609,12 +611,15 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
                                     dtype=np.int32) * -1
         for row in self._connections[post_slice.lo_atom]:
             if row[0].size > 0 and row[1].post_vertex is app_vertex:
+                # Select pre vertex; compact blocks already have sources
+                # relative to its slice
+                pre_vertex_slice = graph_mapper._slice_by_machine_vertex[
+                    row[2].pre_vertex]
+                source_offset = pre_vertex_slice.lo_atom
+                if AbstractConnector.is_compact_synaptic_block(row[0]):
+                    source_offset = 0
                 for source, target, _weight, _delay, _syn_type in row[0]:
-
-                    # Select pre vertex
-                    pre_vertex_slice = graph_mapper._slice_by_machine_vertex[
-                        row[2].pre_vertex]
-                    pre_vertex_id = source - pre_vertex_slice.lo_atom
+                    pre_vertex_id = source - source_offset
                     masked_pre_vertex_id = pre_vertex_id & (2 ** 17 - 1)
 
                     # Select population index
@@ -0,0 +1,13 @@
+from .abstract_synapse_generation_policy import \
+    AbstractSynapseGenerationPolicy
+from .synapse_generation_costs import SynapseGenerationCosts
+from .synapse_generation_estimate import SynapseGenerationEstimate
+from .synapse_generation_policy_cost_model import \
+    SynapseGenerationPolicyCostModel
+from .synapse_generation_policy_on_host import SynapseGenerationPolicyOnHost
+from .synapse_generation_policy_on_machine import \
+    SynapseGenerationPolicyOnMachine
+
+__all__ = ["AbstractSynapseGenerationPolicy", "SynapseGenerationCosts",
+           "SynapseGenerationEstimate", "SynapseGenerationPolicyCostModel",
+           "SynapseGenerationPolicyOnHost", "SynapseGenerationPolicyOnMachine"]
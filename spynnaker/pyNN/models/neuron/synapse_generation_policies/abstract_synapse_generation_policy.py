@@ -0,0 +1,43 @@
+from six import add_metaclass
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+
+@add_metaclass(AbstractBase)
+class AbstractSynapseGenerationPolicy(object):
+    """ Chooses which of the synaptic blocks that could be generated on the\
+        machine are generated there, with the rest generated on host
+    """
+
+    __slots__ = []
+
+    @abstractmethod
+    def choose_on_machine(self, post_vertex_slice, estimates):
+        """ Choose where to generate the blocks of a post-vertex that could\
+            be generated on the machine
+
+        :param post_vertex_slice: The slice of the post-vertex
+        :param estimates: The estimated work of each block
+        :type estimates: list of SynapseGenerationEstimate
+        :return: Whether to generate each block on the machine
+        :rtype: list of bool
+        """
+
+    @property
+    def records_host_generation(self):
+        """ Whether the time taken to generate blocks on host is used, and so\
+            needs to be recorded with :py:meth:`record_host_generation`
+
+        :rtype: bool
+        """
+        return False
+
+    def record_host_generation(self, n_synapses, seconds):
+        """ Record the time taken to generate a block on host
+
+        :param n_synapses: The estimated number of synapses in the block
+        :param seconds: The time taken to generate the block
+        """
+
+    def save_timings(self):
+        """ Keep the timings recorded so far for future runs
+        """
@@ -0,0 +1,217 @@
+import json
+import os
+import numpy
+
+# The time to generate a synapse on host in seconds
+_HOST_SECONDS_PER_SYNAPSE = 2e-7
+
+# The time to load a byte onto the machine in seconds
+_LOAD_SECONDS_PER_BYTE = 2e-7
+
+# The time to generate a synapse on the machine in seconds, taking into
+# account that the expander runs on many cores in parallel
+_EXPANDER_SECONDS_PER_SYNAPSE = 1e-8
+
+# The extra time of running the expander on a core in seconds
+_EXPANDER_SECONDS_PER_CORE = 2e-3
+
+# The number of runs of the expander whose timings are kept
+_MAX_EXPANDER_TIMINGS = 100
+
+
+class SynapseGenerationCosts(object):
+    """ The coefficients of the costs of generating synapses on host and on\
+        the machine, with the timings of generation on host, of loading and\
+        of the synapse expander from which they are calibrated
+    """
+
+    __slots__ = [
+        "_host_seconds_per_synapse",
+        "_load_seconds_per_byte",
+        "_expander_seconds_per_synapse",
+        "_expander_seconds_per_core",
+        "_n_host_synapses_timed",
+        "_host_seconds_timed",
+        "_n_bytes_loaded_timed",
+        "_load_seconds_timed",
+        "_expander_timings"]
+
+    def __init__(
+            self, host_seconds_per_synapse=_HOST_SECONDS_PER_SYNAPSE,
+            load_seconds_per_byte=_LOAD_SECONDS_PER_BYTE,
+            expander_seconds_per_synapse=_EXPANDER_SECONDS_PER_SYNAPSE,
+            expander_seconds_per_core=_EXPANDER_SECONDS_PER_CORE,
+            n_host_synapses_timed=0, host_seconds_timed=0.0,
+            n_bytes_loaded_timed=0, load_seconds_timed=0.0,
+            expander_timings=None):
+        """
+        :param host_seconds_per_synapse: \
+            The time to generate a synapse on host, used until there are\
+            timings of host generation
+        :param load_seconds_per_byte: \
+            The time to load a byte, used until there are timings of loading
+        :param expander_seconds_per_synapse: \
+            The time to generate a synapse on the machine, used until there\
+            are timings of the expander
+        :param expander_seconds_per_core: \
+            The extra time of running the expander on a core, used until\
+            there are timings of the expander
+        :param n_host_synapses_timed: \
+            The number of synapses of the timings of host generation
+        :param host_seconds_timed: \
+            The time taken to generate the synapses timed on host
+        :param n_bytes_loaded_timed: \
+            The number of bytes of synaptic data of the timings of loading
+        :param load_seconds_timed: \
+            The time taken to load the bytes timed
+        :param expander_timings: \
+            The number of synapses, the number of cores and the time taken\
+            of each of the most recent runs of the expander
+        :type expander_timings: list(tuple(int, int, float)) or None
+        """
+        self._host_seconds_per_synapse = host_seconds_per_synapse
+        self._load_seconds_per_byte = load_seconds_per_byte
+        self._expander_seconds_per_synapse = expander_seconds_per_synapse
+        self._expander_seconds_per_core = expander_seconds_per_core
+        self._n_host_synapses_timed = n_host_synapses_timed
+        self._host_seconds_timed = host_seconds_timed
+        self._n_bytes_loaded_timed = n_bytes_loaded_timed
+        self._load_seconds_timed = load_seconds_timed
+        self._expander_timings = [
+            tuple(timing) for timing in (expander_timings or [])]
+
+    @property
+    def host_seconds_per_synapse(self):
+        """ The time to generate a synapse on host, from the timings if there\
+            are any
+        """
+        if self._n_host_synapses_timed:
+            return self._host_seconds_timed / self._n_host_synapses_timed
+        return self._host_seconds_per_synapse
+
+    @property
+    def load_seconds_per_byte(self):
+        """ The time to load a byte, from the timings if there are any
+        """
+        if self._n_bytes_loaded_timed:
+            return self._load_seconds_timed / self._n_bytes_loaded_timed
+        return self._load_seconds_per_byte
+
+    @property
+    def expander_seconds_per_synapse(self):
+        """ The time to generate a synapse on the machine, fitted to the\
+            timings if there are any
+        """
+        return self.__expander_coefficients()[0]
+
+    @property
+    def expander_seconds_per_core(self):
+        """ The extra time of running the expander on a core, fitted to the\
+            timings if there are any
+        """
+        return self.__expander_coefficients()[1]
+
+    def __expander_coefficients(self):
+        """ Fit the time of each run of the expander as the sum of a time\
+            per synapse and a time per core
+        """
+        defaults = numpy.array([
+            self._expander_seconds_per_synapse,
+            self._expander_seconds_per_core])
+        if not self._expander_timings:
+            return tuple(defaults)
+        timings = numpy.array(self._expander_timings, dtype="float64")
+        counts = timings[:, :2]
+        seconds = timings[:, 2]
+        fitted, _, rank, _ = numpy.linalg.lstsq(counts, seconds, rcond=None)
+        if rank == 2 and numpy.all(fitted >= 0):
+            return tuple(fitted)
+
+        # The timings can't tell the two apart, e.g. when there is only one,
+        # so scale the defaults to fit the timings instead
+        predicted = counts.dot(defaults)
+        return tuple(
+            defaults * predicted.dot(seconds) / predicted.dot(predicted))
+
+    @property
+    def n_host_synapses_timed(self):
+        return self._n_host_synapses_timed
+
+    @property
+    def host_seconds_timed(self):
+        return self._host_seconds_timed
+
+    @property
+    def n_bytes_loaded_timed(self):
+        return self._n_bytes_loaded_timed
+
+    @property
+    def load_seconds_timed(self):
+        return self._load_seconds_timed
+
+    @property
+    def expander_timings(self):
+        return list(self._expander_timings)
+
+    def add_host_timings(self, n_synapses, seconds):
+        """ Add timings of generation on host to those calibrating the costs
+
+        :param n_synapses: The estimated number of synapses generated
+        :param seconds: The time taken to generate them
+        """
+        self._n_host_synapses_timed += n_synapses
+        self._host_seconds_timed += seconds
+
+    def add_load_timings(self, n_bytes, seconds):
+        """ Add timings of loading to those calibrating the costs
+
+        :param n_bytes: The number of bytes of synaptic data loaded
+        :param seconds: The time taken to load them
+        """
+        if n_bytes:
+            self._n_bytes_loaded_timed += n_bytes
+            self._load_seconds_timed += max(seconds, 0.0)
+
+    def add_expander_timings(self, n_synapses, n_cores, seconds):
+        """ Add the timings of a run of the expander to those calibrating the\
+            costs, forgetting the oldest if there are too many
+
+        :param n_synapses: \
+            The estimated number of synapses generated on the machine
+        :param n_cores: The number of cores the expander ran on
+        :param seconds: The time taken by the expander
+        """
+        if n_cores:
+            self._expander_timings.append((n_synapses, n_cores, seconds))
+            del self._expander_timings[:-_MAX_EXPANDER_TIMINGS]
+
+    @classmethod
+    def read(cls, filename):
+        """ Read costs from a file written by :py:meth:`write`, or get the\
+            default costs if there is no such file
+
+        :param filename: The name of the file
+        :rtype: SynapseGenerationCosts
+        """
+        if not os.path.exists(filename):
+            return cls()
+        with open(filename) as f:
+            return cls(**json.load(f))
+
+    def write(self, filename):
+        """ Write the costs to a file
+
+        :param filename: The name of the file
+        """
+        with open(filename, "w") as f:
+            json.dump({
+                "host_seconds_per_synapse": self._host_seconds_per_synapse,
+                "load_seconds_per_byte": self._load_seconds_per_byte,
+                "expander_seconds_per_synapse":
+                    self._expander_seconds_per_synapse,
+                "expander_seconds_per_core": self._expander_seconds_per_core,
+                "n_host_synapses_timed": self._n_host_synapses_timed,
+                "host_seconds_timed": self._host_seconds_timed,
+                "n_bytes_loaded_timed": self._n_bytes_loaded_timed,
+                "load_seconds_timed": self._load_seconds_timed,
+                "expander_timings": self._expander_timings}, f, indent=4)
@@ -0,0 +1,40 @@
+class SynapseGenerationEstimate(object):
+    """ The size of the work of generating the synapses of one block, which\
+        could be generated either on host or on the machine
+    """
+
+    __slots__ = [
+        "_label",
+        "_n_synapses",
+        "_n_host_bytes",
+        "_n_machine_bytes"]
+
+    def __init__(self, label, n_synapses, n_host_bytes, n_machine_bytes):
+        """
+        :param label: A label of the block, used when logging decisions
+        :param n_synapses: The maximum number of synapses in the block
+        :param n_host_bytes: \
+            The number of bytes to load if generated on host
+        :param n_machine_bytes: \
+            The number of bytes to load if generated on the machine
+        """
+        self._label = label
+        self._n_synapses = n_synapses
+        self._n_host_bytes = n_host_bytes
+        self._n_machine_bytes = n_machine_bytes
+
+    @property
+    def label(self):
+        return self._label
+
+    @property
+    def n_synapses(self):
+        return self._n_synapses
+
+    @property
+    def n_host_bytes(self):
+        return self._n_host_bytes
+
+    @property
+    def n_machine_bytes(self):
+        return self._n_machine_bytes
@@ -0,0 +1,121 @@
+import logging
+from .abstract_synapse_generation_policy import \
+    AbstractSynapseGenerationPolicy
+from .synapse_generation_costs import SynapseGenerationCosts
+
+logger = logging.getLogger(__name__)
+
+
+class SynapseGenerationPolicyCostModel(AbstractSynapseGenerationPolicy):
+    """ Generates blocks wherever they are estimated to take the least time,\
+        taking into account the time to generate the synapses on host, to\
+        load the data onto the machine and to run the synapse expander
+    """
+
+    __slots__ = [
+        "_costs",
+        "_costs_file",
+        "_per_vertex",
+        "_n_host_processes",
+        "_n_synapses_to_save",
+        "_seconds_to_save"]
+
+    def __init__(self, costs=None, costs_file=None, per_vertex=False,
+                 n_host_processes=1):
+        """
+        :param costs: \
+            The costs to use, or None to read them from the costs file
+        :type costs: SynapseGenerationCosts or None
+        :param costs_file: \
+            A file of costs calibrated by previous runs, to which the\
+            timings of this run are added, or None to not keep timings
+        :type costs_file: str or None
+        :param per_vertex: \
+            True to choose for all the blocks of a post-vertex together, or\
+            False to choose for each block separately
+        :param n_host_processes: \
+            The number of processes that generate synapses on host
+        """
+        self._costs = costs
+        if costs is None:
+            self._costs = (
+                SynapseGenerationCosts() if costs_file is None
+                else SynapseGenerationCosts.read(costs_file))
+        self._costs_file = costs_file
+        self._per_vertex = per_vertex
+        self._n_host_processes = max(1, n_host_processes)
+        self._n_synapses_to_save = 0
+        self._seconds_to_save = 0.0
+
+    @property
+    def costs(self):
+        return self._costs
+
+    def host_seconds(self, estimate):
+        """ The estimated time to generate a block on host and load it
+        """
+        costs = self._costs
+        return (
+            (estimate.n_synapses * costs.host_seconds_per_synapse /
+             self._n_host_processes) +
+            (estimate.n_host_bytes * costs.load_seconds_per_byte))
+
+    def machine_seconds(self, estimate):
+        """ The estimated time to load the generator data of a block and\
+            to generate it on the machine, without the cost of the core
+        """
+        costs = self._costs
+        return (
+            (estimate.n_synapses * costs.expander_seconds_per_synapse) +
+            (estimate.n_machine_bytes * costs.load_seconds_per_byte))
+
+    def choose_on_machine(self, post_vertex_slice, estimates):
+        host_seconds = [self.host_seconds(estimate) for estimate in estimates]
+        machine_seconds = [
+            self.machine_seconds(estimate) for estimate in estimates]
+        savings = [
+            host - machine
+            for host, machine in zip(host_seconds, machine_seconds)]
+
+        # Running the expander on the core must save more than it costs
+        if self._per_vertex:
+            on_machine = [sum(savings) > 0] * len(estimates)
+        else:
+            on_machine = [saving > 0 for saving in savings]
+        saved = sum(
+            saving for saving, chosen in zip(savings, on_machine) if chosen)
+        if saved <= self._costs.expander_seconds_per_core:
+            on_machine = [False] * len(estimates)
+
+        for estimate, host, machine, chosen in zip(
+                estimates, host_seconds, machine_seconds, on_machine):
+            logger.debug(
+                "Generating synapses of %s on %s; estimated %fs on host, "
+                "%fs on the machine", estimate.label,
+                "machine" if chosen else "host", host, machine)
+        logger.info(
+            "Generating %d of %d blocks of atoms %d to %d on the machine",
+            sum(on_machine), len(estimates), post_vertex_slice.lo_atom,
+            post_vertex_slice.hi_atom)
+        return on_machine
+
+    @property
+    def records_host_generation(self):
+        return True
+
+    def record_host_generation(self, n_synapses, seconds):
+        self._costs.add_host_timings(n_synapses, seconds)
+        self._n_synapses_to_save += n_synapses
+        self._seconds_to_save += seconds
+
+    def save_timings(self):
+        if self._costs_file is None or not self._n_synapses_to_save:
+            return
+
+        # Other runs may have added timings to the file since it was read
+        costs = SynapseGenerationCosts.read(self._costs_file)
+        costs.add_host_timings(
+            self._n_synapses_to_save, self._seconds_to_save)
+        costs.write(self._costs_file)
+        self._n_synapses_to_save = 0
+        self._seconds_to_save = 0.0
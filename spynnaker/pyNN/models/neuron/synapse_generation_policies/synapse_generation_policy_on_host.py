@@ -0,0 +1,12 @@
+from .abstract_synapse_generation_policy import \
+    AbstractSynapseGenerationPolicy
+
+
+class SynapseGenerationPolicyOnHost(AbstractSynapseGenerationPolicy):
+    """ Generates every block on host
+    """
+
+    __slots__ = []
+
+    def choose_on_machine(self, post_vertex_slice, estimates):
+        return [False] * len(estimates)
@@ -0,0 +1,12 @@
+from .abstract_synapse_generation_policy import \
+    AbstractSynapseGenerationPolicy
+
+
+class SynapseGenerationPolicyOnMachine(AbstractSynapseGenerationPolicy):
+    """ Generates every block that can be generated on the machine there
+    """
+
+    __slots__ = []
+
+    def choose_on_machine(self, post_vertex_slice, estimates):
+        return [True] * len(estimates)
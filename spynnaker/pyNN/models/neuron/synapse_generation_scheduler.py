@@ -0,0 +1,36 @@
+import multiprocessing
+from spynnaker.pyNN.utilities.utility_calls import run_in_forked_pool
+
+
+class SynapseGenerationScheduler(object):
+    """ Runs the host-side generation of synaptic blocks, optionally across\
+        a pool of worker processes, returning the results in the order of\
+        the jobs
+    """
+
+    __slots__ = [
+        "_n_processes"]
+
+    def __init__(self, n_processes=1):
+        """
+        :param n_processes: \
+            The number of worker processes to use, 1 to run the jobs in this\
+            process, or None to use one per CPU
+        :type n_processes: int or None
+        """
+        if n_processes is None:
+            n_processes = multiprocessing.cpu_count()
+        self._n_processes = max(1, n_processes)
+
+    @property
+    def n_processes(self):
+        return self._n_processes
+
+    def run(self, jobs):
+        """ Run the given jobs, yielding the results in the order of the jobs.
+
+        :param jobs: A list of (function, args) tuples
+        :return: An iterator of function(*args) for each job
+        """
+        return run_in_forked_pool(
+            jobs, self._n_processes, "synapse generation")
@@ -27,7 +27,16 @@ class SynapseIORowBased(AbstractSynapseIO):
         actually change).  The plastic region structure is determined by the\
         synapse dynamics of the connector.
     """
-    __slots__ = []
+    __slots__ = [
+        "_compact_synapses"]
+
+    def __init__(self, compact_synapses=False):
+        """
+        :param compact_synapses: \
+            True to generate the synapses of blocks with\
+            AbstractConnector.NUMPY_COMPACT_SYNAPSES_DTYPE, using less memory
+        """
+        self._compact_synapses = compact_synapses
 
     @overrides(AbstractSynapseIO.get_maximum_delay_supported_in_ms)
     def get_maximum_delay_supported_in_ms(self, machine_time_step):
@@ -196,15 +205,24 @@ class SynapseIORowBased(AbstractSynapseIO):
         if max_delay is not None:
             max_delay *= (1000.0 / machine_time_step)
 
-        # Get the actual connections
-        connections = synapse_info.connector.create_synaptic_block(
-            pre_slices, pre_slice_index, post_slices,
-            post_slice_index, pre_vertex_slice, post_vertex_slice,
-            synapse_info.synapse_type)
-
-        # Convert delays to timesteps
-        connections["delay"] = numpy.rint(
-            connections["delay"] * (1000.0 / machine_time_step))
+        # Get the actual connections, with delays in timesteps
+        compact = (
+            self._compact_synapses and pre_vertex_slice.n_atoms <=
+            AbstractConnector.MAX_COMPACT_PRE_ATOMS)
+        if compact:
+            connections = synapse_info.connector.create_compact_synaptic_block(
+                pre_slices, pre_slice_index, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                synapse_info.synapse_type, machine_time_step)
+            source_offset = 0
+        else:
+            connections = synapse_info.connector.create_synaptic_block(
+                pre_slices, pre_slice_index, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                synapse_info.synapse_type)
+            connections["delay"] = numpy.rint(
+                connections["delay"] * (1000.0 / machine_time_step))
+            source_offset = pre_vertex_slice.lo_atom
 
         # Scale weights
         connections["weight"] = (connections["weight"] * weight_scales[
@@ -219,8 +237,7 @@ class SynapseIORowBased(AbstractSynapseIO):
                 numpy.where(~plastic_delay_mask)]
         else:
             undelayed_connections = connections
-            delayed_connections = numpy.zeros(
-                0, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+            delayed_connections = numpy.zeros(0, dtype=connections.dtype)
         del connections
 
         # Get the data for the connections
@@ -231,7 +248,7 @@ class SynapseIORowBased(AbstractSynapseIO):
                            AbstractSynapseDynamicsStructural):
             # Get which row each connection will go into
             undelayed_row_indices = (
-                    undelayed_connections["source"] - pre_vertex_slice.lo_atom)
+                    undelayed_connections["source"] - source_offset)
             max_row_length, row_data = self._get_max_row_length_and_row_data(
                 undelayed_connections, undelayed_row_indices,
                 pre_vertex_slice.n_atoms, post_vertex_slice, n_synapse_types,
@@ -252,13 +269,13 @@ class SynapseIORowBased(AbstractSynapseIO):
             stages = numpy.floor((numpy.round(
                 delayed_connections["delay"] - 1.0)) / max_delay).astype(
                 "uint32")
+            delayed_source_ids = (
+                    delayed_connections["source"] - source_offset)
             delayed_row_indices = (
-                    (delayed_connections[
-                         "source"] - pre_vertex_slice.lo_atom) +
+                    delayed_source_ids +
                     ((stages - 1) * pre_vertex_slice.n_atoms))
-            delayed_connections["delay"] -= max_delay * stages
-            delayed_source_ids = (
-                    delayed_connections["source"] - pre_vertex_slice.lo_atom)
+            delayed_connections["delay"] = (
+                delayed_connections["delay"] - max_delay * stages)
 
             # Get the data
             max_delayed_row_length, delayed_row_data = \
@@ -1,7 +1,9 @@
 import math
+import os
 import scipy.stats  # @UnresolvedImport
 import struct
 import sys
+import time
 from collections import defaultdict
 from scipy import special  # @UnresolvedImport
 import numpy
@@ -12,11 +14,14 @@ from pacman.model.abstract_classes import AbstractHasGlobalMaxAtoms
 # spinn utilities
 from spinn_utilities.helpful_functions import get_valid_components
 from spynnaker.pyNN.models.neuron.generator_data import GeneratorData
+from spynnaker.pyNN.models.neuron.synapse_generation_scheduler \
+    import SynapseGenerationScheduler
 
 # front-end common
 from spinn_front_end_common.utilities.helpful_functions \
     import locate_memory_region_for_placement
 from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spinn_front_end_common.utilities import helpful_functions
 
 # dsg
 from data_specification.enums import DataType
@@ -27,6 +32,9 @@ from spynnaker.pyNN.models.neural_projections.connectors \
     import OneToOneConnector, AbstractGenerateConnectorOnMachine
 from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
 from spynnaker.pyNN.models.neuron import master_pop_table_generators
+from spynnaker.pyNN.models.neuron import synapse_generation_policies
+from spynnaker.pyNN.models.neuron.synapse_generation_policies import \
+    SynapseGenerationEstimate, SynapseGenerationPolicyCostModel
 from spynnaker.pyNN.models.neuron.synapse_dynamics \
     import SynapseDynamicsStatic, AbstractSynapseDynamicsStructural, \
     AbstractGenerateOnMachine
@@ -62,6 +70,21 @@ _SYNAPSE_SDRAM_OVERSCALE = 1.1
 _ONE_WORD = struct.Struct("<I")
 
 
+def _generate_synapses(get_synapses, args):
+    """ Generate the synapses of a block, getting them, the time it took in\
+        seconds, the process they were generated in, and what generating\
+        them added to the state of the connector, which is lost with the\
+        process if it is not this one
+    """
+    connector = args[0].connector
+    state = connector.get_generation_state()
+    start = time.time()
+    synapses = get_synapses(*args)
+    seconds = time.time() - start
+    return (synapses, seconds, os.getpid(),
+            connector.get_generation_state_added(state))
+
+
 class SynapticManager(object):
     """ Deals with synapses
     """
@@ -80,7 +103,10 @@ class SynapticManager(object):
         "_weight_scales",
         "_ring_buffer_shifts",
         "_gen_on_machine",
-        "_max_row_info"]
+        "_generation_totals",
+        "_max_row_info",
+        "_generation_scheduler",
+        "_generation_policy"]
 
     def __init__(self, n_synapse_types, ring_buffer_sigma, spikes_per_second,
                  config, population_table_type=None, synapse_io=None):
@@ -100,7 +126,8 @@ class SynapticManager(object):
         # Get the synapse IO
         self._synapse_io = synapse_io
         if synapse_io is None:
-            self._synapse_io = SynapseIORowBased()
+            self._synapse_io = SynapseIORowBased(config.getboolean(
+                "Simulation", "compact_synaptic_blocks"))
 
         if self._ring_buffer_sigma is None:
             self._ring_buffer_sigma = config.getfloat(
@@ -131,10 +158,39 @@ class SynapticManager(object):
         # Whether to generate on machine or not for a given vertex slice
         self._gen_on_machine = dict()
 
+        # The synapses chosen to be generated on the machine and the bytes of
+        # synaptic data to load for a given vertex slice
+        self._generation_totals = dict()
+
         # A map of synapse information to maximum row / delayed row length and
         # size in bytes
         self._max_row_info = dict()
 
+        # Runs the generation of synapses on host
+        self._generation_scheduler = SynapseGenerationScheduler(
+            helpful_functions.read_config_int(
+                config, "Simulation", "n_synapse_generation_processes"))
+
+        # Chooses where to generate synapses that can be generated on the
+        # machine
+        self._generation_policy = self.__create_generation_policy(
+            config, self._generation_scheduler.n_processes)
+
+    @staticmethod
+    def __create_generation_policy(config, n_host_processes):
+        policy_type = "SynapseGenerationPolicy" + config.get(
+            "Simulation", "synapse_generation_policy")
+        policies = get_valid_components(
+            synapse_generation_policies, "synapse_generation_policy")
+        if policies[policy_type] is SynapseGenerationPolicyCostModel:
+            return SynapseGenerationPolicyCostModel(
+                costs_file=helpful_functions.read_config(
+                    config, "Simulation", "synapse_generation_costs_file"),
+                per_vertex=config.getboolean(
+                    "Simulation", "synapse_generation_policy_per_vertex"),
+                n_host_processes=n_host_processes)
+        return policies[policy_type]()
+
     @property
     def synapse_dynamics(self):
         return self._synapse_dynamics
@@ -586,6 +642,29 @@ class SynapticManager(object):
         # Store a list of synapse info to be generated on the machine
         generate_on_machine = list()
 
+        # Choose which of the blocks that could be generated on the machine
+        # will be
+        on_machine = self.__choose_on_machine(
+            in_edges, post_vertex_slice, machine_time_step, graph_mapper)
+
+        # Start generating the blocks that can be generated away from the
+        # rest of the data; the results come back in the order of the edges
+        jobs = list()
+        for machine_edge, app_edge, synapse_info in self.__synapse_infos(
+                in_edges, graph_mapper):
+            if self.__is_generated_separately(
+                    synapse_info, machine_edge, on_machine):
+                args = self.__get_synapses_args(
+                    synapse_info, machine_edge, app_edge, post_slices,
+                    post_slice_index, post_vertex_slice, weight_scales,
+                    machine_time_step, graph_mapper)
+                synapse_info.connector.prepare_synaptic_blocks(
+                    args[1], post_slices)
+                jobs.append(
+                    (_generate_synapses,
+                     (self._synapse_io.get_synapses, args)))
+        generated = self._generation_scheduler.run(jobs)
+
         # For each machine edge in the vertex, create a synaptic list
         for machine_edge in in_edges:
             app_edge = graph_mapper.get_application_edge(machine_edge)
@@ -605,20 +684,26 @@ class SynapticManager(object):
 
                     # If connector is being built on SpiNNaker,
                     # compute matrix sizes only
-                    connector = synapse_info.connector
-                    dynamics = synapse_info.synapse_dynamics
-                    if (isinstance(
-                            connector, AbstractGenerateConnectorOnMachine) and
-                            connector.generate_on_machine and
-                            isinstance(dynamics, AbstractGenerateOnMachine) and
-                            dynamics.generate_on_machine and
+                    if ((machine_edge, synapse_info) in on_machine and
                             not self.__is_direct(
-                                single_addr, connector, pre_vertex_slice,
-                                post_vertex_slice, app_edge)):
+                                single_addr, synapse_info.connector,
+                                pre_vertex_slice, post_vertex_slice,
+                                app_edge)):
                         generate_on_machine.append((
                             synapse_info, pre_slices, pre_vertex_slice,
                             pre_slice_idx, app_edge, rinfo))
                     else:
+                        synapses = None
+                        if self.__is_generated_separately(
+                                synapse_info, machine_edge, on_machine):
+                            synapses, seconds, pid, added = next(generated)
+                            if pid != os.getpid():
+                                synapse_info.connector.add_generation_state(
+                                    added)
+                            self.__record_host_generation(
+                                synapse_info, app_edge, pre_vertex_slice,
+                                post_vertex_slice, machine_time_step,
+                                seconds)
                         block_addr, single_addr = self.__write_block(
                             spec, synaptic_matrix_region, synapse_info,
                             pre_slices, pre_slice_idx, post_slices,
@@ -627,7 +712,7 @@ class SynapticManager(object):
                             single_synapses, master_pop_table_region,
                             weight_scales, machine_time_step, rinfo,
                             all_syn_block_sz, block_addr, single_addr,
-                            machine_edge=machine_edge)
+                            machine_edge=machine_edge, synapses=synapses)
 
         # Skip blocks that will be written on the machine, but add them
         # to the master population table
@@ -665,6 +750,126 @@ class SynapticManager(object):
 
         return generator_data
 
+    @staticmethod
+    def __synapse_infos(in_edges, graph_mapper):
+        """ Get the (machine edge, application edge, synapse information)\
+            of each projection coming in over the given edges, in order
+        """
+        for machine_edge in in_edges:
+            app_edge = graph_mapper.get_application_edge(machine_edge)
+            if isinstance(app_edge, ProjectionApplicationEdge):
+                for synapse_info in app_edge.synapse_information:
+                    yield machine_edge, app_edge, synapse_info
+
+    @staticmethod
+    def __may_generate_on_machine(synapse_info):
+        """ Determine if the synapses could be generated on the machine;\
+            if not, they will definitely be generated on host
+        """
+        connector = synapse_info.connector
+        dynamics = synapse_info.synapse_dynamics
+        return (
+            isinstance(connector, AbstractGenerateConnectorOnMachine) and
+            connector.generate_on_machine and
+            isinstance(dynamics, AbstractGenerateOnMachine) and
+            dynamics.generate_on_machine)
+
+    @staticmethod
+    def __is_generated_separately(synapse_info, machine_edge, on_machine):
+        """ Determine if the synapses will definitely be generated on host,\
+            and without needing to update any state of the synapse dynamics,\
+            so can be generated separately from writing them
+        """
+        return not (
+            (machine_edge, synapse_info) in on_machine or
+            isinstance(synapse_info.synapse_dynamics,
+                       AbstractSynapseDynamicsStructural))
+
+    def __get_generation_estimate(
+            self, synapse_info, app_edge, pre_vertex_slice,
+            post_vertex_slice, machine_time_step):
+        """ Estimate the work of generating a block on host or on the machine
+        """
+        max_row_info = self._get_max_row_info(
+            synapse_info, post_vertex_slice, app_edge, machine_time_step)
+        n_delay_stages = app_edge.n_delay_stages
+        connector = synapse_info.connector
+        dynamics = synapse_info.synapse_dynamics
+        return SynapseGenerationEstimate(
+            "{} from atoms {} to {}".format(
+                app_edge.label, pre_vertex_slice.lo_atom,
+                pre_vertex_slice.hi_atom),
+            pre_vertex_slice.n_atoms * (
+                max_row_info.undelayed_max_n_synapses +
+                max_row_info.delayed_max_n_synapses * n_delay_stages),
+            pre_vertex_slice.n_atoms * (
+                max_row_info.undelayed_max_bytes +
+                max_row_info.delayed_max_bytes * n_delay_stages),
+            sum((GeneratorData.BASE_SIZE,
+                 dynamics.gen_matrix_params_size_in_bytes,
+                 connector.gen_connector_params_size_in_bytes,
+                 connector.gen_weight_params_size_in_bytes,
+                 connector.gen_delay_params_size_in_bytes)))
+
+    def __choose_on_machine(
+            self, in_edges, post_vertex_slice, machine_time_step,
+            graph_mapper):
+        """ Get the (machine edge, synapse information) of the blocks that\
+            the generation policy chooses to generate on the machine
+        """
+        candidates = list()
+        estimates = list()
+        for machine_edge, app_edge, synapse_info in self.__synapse_infos(
+                in_edges, graph_mapper):
+            if self.__may_generate_on_machine(synapse_info):
+                candidates.append((machine_edge, synapse_info))
+                estimates.append(self.__get_generation_estimate(
+                    synapse_info, app_edge,
+                    graph_mapper.get_slice(machine_edge.pre_vertex),
+                    post_vertex_slice, machine_time_step))
+        if not candidates:
+            return set()
+        chosen = self._generation_policy.choose_on_machine(
+            post_vertex_slice, estimates)
+        self.__add_generation_totals(post_vertex_slice, n_synapses=sum(
+            estimate.n_synapses
+            for estimate, on_machine in zip(estimates, chosen)
+            if on_machine))
+        return set(
+            candidate for candidate, on_machine in zip(candidates, chosen)
+            if on_machine)
+
+    def __record_host_generation(
+            self, synapse_info, app_edge, pre_vertex_slice, post_vertex_slice,
+            machine_time_step, seconds):
+        """ Tell the generation policy how long a block took on host, if it\
+            wants to know and the block could have been generated on the\
+            machine
+        """
+        if not (self._generation_policy.records_host_generation and
+                self.__may_generate_on_machine(synapse_info)):
+            return
+        estimate = self.__get_generation_estimate(
+            synapse_info, app_edge, pre_vertex_slice, post_vertex_slice,
+            machine_time_step)
+        self._generation_policy.record_host_generation(
+            estimate.n_synapses, seconds)
+
+    def __get_synapses_args(
+            self, synapse_info, machine_edge, app_edge, post_slices,
+            post_slice_index, post_vertex_slice, weight_scales,
+            machine_time_step, graph_mapper):
+        """ Get the arguments to get the synapses of a block on host
+        """
+        return (
+            synapse_info, graph_mapper.get_slices(app_edge.pre_vertex),
+            graph_mapper.get_machine_vertex_index(machine_edge.pre_vertex),
+            post_slices, post_slice_index,
+            graph_mapper.get_slice(machine_edge.pre_vertex),
+            post_vertex_slice, app_edge.n_delay_stages, self._poptable_type,
+            self._n_synapse_types, weight_scales, machine_time_step,
+            app_edge, machine_edge)
+
     def __generate_on_chip_data(
             self, spec, synapse_info, pre_slices,
             pre_slice_index, post_slices, post_slice_index, pre_vertex_slice,
@@ -772,14 +977,21 @@ class SynapticManager(object):
             post_vertex_slice, app_edge, n_synapse_types, single_synapses,
             master_pop_table_region, weight_scales, machine_time_step,
             rinfo, all_syn_block_sz, block_addr, single_addr,
-            machine_edge):
+            machine_edge, synapses=None):
+        if synapses is None:
+            start = time.time()
+            synapses = self._synapse_io.get_synapses(
+                synapse_info, pre_slices, pre_slice_idx, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                app_edge.n_delay_stages, self._poptable_type,
+                n_synapse_types, weight_scales, machine_time_step,
+                app_edge=app_edge, machine_edge=machine_edge)
+            self.__record_host_generation(
+                synapse_info, app_edge, pre_vertex_slice, post_vertex_slice,
+                machine_time_step, time.time() - start)
         (row_data, row_length, delayed_row_data, delayed_row_length,
-         delayed_source_ids, delay_stages) = self._synapse_io.get_synapses(
-             synapse_info, pre_slices, pre_slice_idx, post_slices,
-             post_slice_index, pre_vertex_slice, post_vertex_slice,
-             app_edge.n_delay_stages, self._poptable_type, n_synapse_types,
-             weight_scales, machine_time_step,
-             app_edge=app_edge, machine_edge=machine_edge)
+         delayed_source_ids, delay_stages) = synapses
+        del synapses
 
         if app_edge.delay_edge is not None:
             app_edge.delay_edge.pre_vertex.add_delays(
@@ -866,6 +1078,8 @@ class SynapticManager(object):
                 spec, single_addr, 1, rinfo.first_key_and_mask,
                 master_pop_table_region, is_single=True)
             single_addr += len(single_rows) * 4
+            self.__add_generation_totals(
+                post_vertex_slice, n_bytes=len(single_rows) * 4)
         else:
             block_addr = self._write_padding(
                 spec, synaptic_matrix_region, block_addr)
@@ -875,6 +1089,8 @@ class SynapticManager(object):
                 spec, block_addr, row_length,
                 rinfo.first_key_and_mask, master_pop_table_region)
             block_addr += len(row_data) * 4
+            self.__add_generation_totals(
+                post_vertex_slice, n_bytes=len(row_data) * 4)
         return block_addr, single_addr
 
     def _get_ring_buffer_shifts(
@@ -906,6 +1122,8 @@ class SynapticManager(object):
 
         post_slices = graph_mapper.get_slices(application_vertex)
         post_slice_idx = graph_mapper.get_machine_vertex_index(machine_vertex)
+        self._generation_totals.pop(
+            (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom), None)
 
         # Reserve the memory
         in_edges = application_graph.get_edges_ending_at_vertex(
@@ -952,6 +1170,9 @@ class SynapticManager(object):
         self._write_on_machine_data_spec(
             spec, post_vertex_slice, weight_scales, gen_data)
 
+        # Keep the timings of generation on host for future runs
+        self._generation_policy.save_timings()
+
     def clear_connection_cache(self):
         self._retrieved_blocks = dict()
 
@@ -1144,28 +1365,59 @@ class SynapticManager(object):
             (self._n_synapse_types * 4))
         for data in generator_data:
             n_bytes += data.size
+        self.__add_generation_totals(post_vertex_slice, n_bytes=n_bytes)
 
         spec.reserve_memory_region(
             region=POPULATION_BASED_REGIONS.CONNECTOR_BUILDER.value,
             size=n_bytes, label="ConnectorBuilderRegion")
         spec.switch_write_focus(
             region=POPULATION_BASED_REGIONS.CONNECTOR_BUILDER.value)
+        spec.write_array(self.get_connector_builder_data(
+            post_vertex_slice, weight_scales, generator_data))
 
-        spec.write_value(len(generator_data))
-        spec.write_value(post_vertex_slice.lo_atom)
-        spec.write_value(post_vertex_slice.n_atoms)
-        spec.write_value(self._n_synapse_types)
-        spec.write_value(get_n_bits(self._n_synapse_types))
-        n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
-        spec.write_value(n_neuron_id_bits)
-        for w in weight_scales:
-            spec.write_value(int(w), data_type=DataType.INT32)
+    def get_connector_builder_data(
+            self, post_vertex_slice, weight_scales, generator_data):
+        """ Get the data of the connector builder region, which is read by\
+            the synapse expander
 
+        :param post_vertex_slice: The slice of the vertex being written
+        :param weight_scales: scaling of weights on each synapse
+        :param generator_data: The data of each connection to be generated
+        :rtype: numpy array of uint32
+        """
+        items = list()
+        items.append(numpy.array([
+            len(generator_data),
+            post_vertex_slice.lo_atom,
+            post_vertex_slice.n_atoms,
+            self._n_synapse_types,
+            get_n_bits(self._n_synapse_types),
+            get_n_bits(post_vertex_slice.n_atoms)], dtype="uint32"))
+        items.append(numpy.array(
+            [int(w) for w in weight_scales], dtype="int32").view("uint32"))
         for data in generator_data:
-            spec.write_array(data.gen_data)
+            items.append(data.gen_data)
+        return numpy.concatenate(items)
 
     def gen_on_machine(self, vertex_slice):
         """ True if the synapses should be generated on the machine
         """
         key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
         return self._gen_on_machine.get(key, False)
+
+    def __add_generation_totals(self, vertex_slice, n_synapses=0, n_bytes=0):
+        key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
+        total_synapses, total_bytes = self._generation_totals.get(key, (0, 0))
+        self._generation_totals[key] = (
+            total_synapses + n_synapses, total_bytes + n_bytes)
+
+    def get_generation_totals(self, vertex_slice):
+        """ Get the estimated number of synapses chosen to be generated on\
+            the machine, and the number of bytes of synaptic matrix and\
+            generator data written to be loaded, when the data of a slice\
+            was last written
+
+        :rtype: tuple(int, int)
+        """
+        key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
+        return self._generation_totals.get(key, (0, 0))
@@ -10,6 +10,8 @@ from spynnaker.pyNN.models.abstract_models \
     import AbstractReadParametersBeforeSet, AbstractContainsUnits
 from spynnaker.pyNN.models.abstract_models \
     import AbstractPopulationInitializable, AbstractPopulationSettable
+from spynnaker.pyNN.models.common import AbstractSpikeRecordable
+from spynnaker.pyNN.utilities.spike_statistics import SpikeStatistics
 from .abstract_pynn_model import AbstractPyNNModel
 
 from spinn_front_end_common.utilities import globals_variables
@@ -164,6 +166,13 @@ class PyNNPopulationCommon(object):
         self._change_requires_mapping = False
         self._has_read_neuron_parameters_this_run = False
 
+    def _reset_extraction_cursors(self):
+        """ Forget the recorded data decoded so far, as the data is no\
+            longer stored once the simulation is reset
+        """
+        if isinstance(self._vertex, AbstractSpikeRecordable):
+            self._vertex.reset_extraction_cursors()
+
     def __add__(self, other):
         """ Merges populations
         """
@@ -440,13 +449,19 @@ class PyNNPopulationCommon(object):
 
     def get_spike_counts(self, spikes, gather=True):
         """ Return the number of spikes for each neuron.
+
+        :param spikes: the spikes, or the\
+            :py:class:`~spynnaker.pyNN.utilities.spike_statistics.SpikeStatistics`\
+            of the spikes, which counts them without holding them in memory
         """
-        n_spikes = {}
-        counts = numpy.bincount(spikes[:, 0].astype(dtype=numpy.int32),
-                                minlength=self._vertex.n_atoms)
-        for i in range(self._vertex.n_atoms):
-            n_spikes[i] = counts[i]
-        return n_spikes
+        if isinstance(spikes, SpikeStatistics):
+            counts = spikes.spike_counts
+        else:
+            counts = numpy.bincount(
+                spikes[:, 0].astype(dtype=numpy.int32),
+                minlength=self._vertex.n_atoms)
+        n_atoms = self._vertex.n_atoms
+        return dict(zip(range(n_atoms), counts[:n_atoms].tolist()))
 
     @property
     def positions(self):
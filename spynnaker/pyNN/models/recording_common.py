@@ -6,6 +6,9 @@ from spinn_front_end_common.utilities.globals_variables import get_simulator
 
 from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from spynnaker.pyNN.models.common import AbstractNeuronRecordable
+from spynnaker.pyNN.utilities.columnar_recording import \
+    write_columnar_recording
+from spynnaker.pyNN.utilities.spike_statistics import SpikeStatistics
 
 from collections import defaultdict
 import numpy
@@ -143,6 +146,51 @@ class RecordingCommon(object):
         data = None
         sim = get_simulator()
 
+        if not self._can_get_recorded_matrix(variable):
+            data = numpy.zeros((0, 3))
+            indexes = []
+            sampling_interval = self._population._vertex.\
+                get_neuron_sampling_interval(variable)
+        else:
+            # assuming we got here, everything is ok, so we should go get the
+            # data
+            results = self._population._vertex.get_data(
+                variable, sim.no_machine_time_steps, sim.placements,
+                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step)
+            (data, indexes, sampling_interval) = results
+
+        get_simulator().add_extraction_timing(
+            timer.take_sample())
+        return (data, indexes, sampling_interval)
+
+    def _iter_recorded_matrix(self, variable, n_rows_per_chunk):
+        """ Perform safety checks and get the recorded data from the vertex\
+            in matrix format, a chunk of rows at a time so that the whole of\
+            a long run is never held in memory.
+
+        :param variable: the variable name to read. supported variable names
+            are :'gsyn_exc', 'gsyn_inh', 'v'
+        :param n_rows_per_chunk: the most rows of data in each chunk
+        :return: an iterable of the chunks of data, the indexes of the\
+            neurons of the columns and the sampling interval
+        """
+        sim = get_simulator()
+        if not self._can_get_recorded_matrix(variable):
+            return ([], [], self._population._vertex.
+                    get_neuron_sampling_interval(variable))
+        return self._population._vertex.iter_data(
+            variable, sim.no_machine_time_steps, sim.placements,
+            sim.graph_mapper, sim.buffer_manager, sim.machine_time_step,
+            n_rows_per_chunk)
+
+    def _can_get_recorded_matrix(self, variable):
+        """ Check that the recorded data of a variable can be read, warning\
+            if there is no data because the simulation has not truly run
+
+        :return: True if there is data to read, False otherwise
+        """
+        sim = get_simulator()
+
         get_simulator().verify_not_running()
 
         # check that we're in a state to get voltages
@@ -162,29 +210,13 @@ class RecordingCommon(object):
                 "The simulation has not yet run, therefore {} cannot"
                 " be retrieved, hence the list will be empty".format(
                     variable))
-            data = numpy.zeros((0, 3))
-            indexes = []
-            sampling_interval = self._population._vertex.\
-                get_neuron_sampling_interval(variable)
-        elif sim.use_virtual_board:
+            return False
+        if sim.use_virtual_board:
             logger.warning(
                 "The simulation is using a virtual machine and so has not"
                 " truly ran, hence the list will be empty")
-            data = numpy.zeros((0, 3))
-            indexes = []
-            sampling_interval = self._population._vertex.\
-                get_neuron_sampling_interval(variable)
-        else:
-            # assuming we got here, everything is ok, so we should go get the
-            # data
-            results = self._population._vertex.get_data(
-                variable, sim.no_machine_time_steps, sim.placements,
-                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step)
-            (data, indexes, sampling_interval) = results
-
-        get_simulator().add_extraction_timing(
-            timer.take_sample())
-        return (data, indexes, sampling_interval)
+            return False
+        return True
 
     def _get_spikes(self):
         """ How to get spikes from a vertex.
@@ -192,6 +224,79 @@ class RecordingCommon(object):
         :return: the spikes from a vertex
         """
 
+        if not self._can_get_spikes():
+            return numpy.zeros((0, 2))
+
+        # assuming we got here, everything is OK, so we should go get the
+        # spikes
+        sim = get_simulator()
+        return self._population._vertex.get_spikes(
+            sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step)
+
+    def _get_spike_ticks(self):
+        """ How to get spikes from a vertex as the neuron ID and timestep of\
+            each, so that large numbers of spikes are held as compactly as\
+            possible and times are never compared as floating point.
+
+        :return: the spikes from a vertex, as a uint32 array
+        """
+        if not self._can_get_spikes():
+            return numpy.zeros((0, 2), dtype="uint32")
+        sim = get_simulator()
+        return self._population._vertex.get_spike_ticks(
+            sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step)
+
+    def _iter_spikes(self, n_timesteps_per_chunk):
+        """ How to get spikes from a vertex a window of timesteps at a time,\
+            so that the spikes of a long run are never all held in memory.
+
+        :param n_timesteps_per_chunk: the number of timesteps in each window
+        :return: an iterable of the spikes of each window
+        """
+        if not self._can_get_spikes():
+            return iter([])
+        sim = get_simulator()
+        return self._population._vertex.iter_spikes(
+            sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step, n_timesteps_per_chunk)
+
+    def _get_spike_statistics(
+            self, bin_width=None, isi_bin_width=None, max_isi=None):
+        """ How to get statistics of the spikes of a vertex, counted as the\
+            spikes of each core are decoded so that the spikes of the\
+            population are never all held in memory.
+
+        :param bin_width: the width in milliseconds of the bins of the\
+            histogram of spike times, or None for one timestep
+        :param isi_bin_width: the width in milliseconds of the bins of the\
+            histogram of inter-spike intervals, or None for one timestep
+        :param max_isi: the longest inter-spike interval in milliseconds to\
+            give a bin of its own, or None for all possible intervals
+        :rtype: :py:class:`SpikeStatistics`
+        """
+        sim = get_simulator()
+        vertex = self._population._vertex
+        can_get_spikes = self._can_get_spikes()
+        n_timesteps = sim.no_machine_time_steps if can_get_spikes else 0
+        statistics = SpikeStatistics(
+            vertex.n_atoms, n_timesteps or 0, sim.machine_time_step,
+            bin_width, isi_bin_width, max_isi)
+        if can_get_spikes:
+            for spike_ids, spike_ticks in vertex.iter_spike_columns(
+                    sim.placements, sim.graph_mapper, sim.buffer_manager,
+                    sim.machine_time_step):
+                statistics.add_spikes(spike_ids, spike_ticks)
+        return statistics
+
+    def _can_get_spikes(self):
+        """ Check that spikes can be read, warning if there are none because\
+            the simulation has not truly run
+
+        :return: True if there are spikes to read, False otherwise
+        """
+
         # check we're in a state where we can get spikes
         if not isinstance(self._population._vertex, AbstractSpikeRecordable):
             raise ConfigurationException(
@@ -205,19 +310,55 @@ class RecordingCommon(object):
             logger.warning(
                 "The simulation has not yet run, therefore spikes cannot "
                 "be retrieved, hence the list will be empty")
-            return numpy.zeros((0, 2))
+            return False
 
         if sim.use_virtual_board:
             logger.warning(
                 "The simulation is using a virtual machine and so has not "
                 "truly ran, hence the list will be empty")
-            return numpy.zeros((0, 2))
+            return False
+        return True
+
+    def _write_columnar(
+            self, directory, variables=None, n_rows_per_chunk=1000):
+        """ Write the recorded data to a directory of binary columns that\
+            can be mapped into memory by numpy, reading and writing the data\
+            of a chunk at a time; see\
+            :py:mod:`spynnaker.pyNN.utilities.columnar_recording`
+
+        :param directory: the directory to write to
+        :param variables: the variables to write, or None for all those\
+            being recorded
+        :param n_rows_per_chunk: the most rows of each variable other than\
+            spikes to read at a time
+        :rtype: None
+        """
+        vertex = self._population._vertex
+        if variables is None:
+            variables = list()
+            if isinstance(vertex, AbstractSpikeRecordable) and \
+                    vertex.is_recording_spikes():
+                variables.append("spikes")
+            if isinstance(vertex, AbstractNeuronRecordable):
+                variables.extend(
+                    variable
+                    for variable in vertex.get_recordable_variables()
+                    if variable != "spikes" and vertex.is_recording(variable))
 
-        # assuming we got here, everything is OK, so we should go get the
-        # spikes
-        return self._population._vertex.get_spikes(
-            sim.placements, sim.graph_mapper, sim.buffer_manager,
-            sim.machine_time_step)
+        sim = get_simulator()
+        spike_columns = None
+        if "spikes" in variables:
+            spike_columns = []
+            if self._can_get_spikes():
+                spike_columns = vertex.iter_spike_columns(
+                    sim.placements, sim.graph_mapper, sim.buffer_manager,
+                    sim.machine_time_step)
+        signals = dict(
+            (variable, self._iter_recorded_matrix(variable, n_rows_per_chunk))
+            for variable in variables if variable != "spikes")
+        write_columnar_recording(
+            directory, self._population.label, sim.machine_time_step,
+            spike_columns, signals)
 
     def _turn_off_all_recording(self, indexes=None):
         """ Turns off recording, is used by a pop saying `.record()`
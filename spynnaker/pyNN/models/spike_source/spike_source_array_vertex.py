@@ -147,18 +147,27 @@ class SpikeSourceArrayVertex(
     @overrides(AbstractSpikeRecordable.get_spikes)
     def get_spikes(
             self, placements, graph_mapper, buffer_manager, machine_time_step):
-
         return self._spike_recorder.get_spikes(
             self.label, buffer_manager, 0,
-            placements, graph_mapper, self,
-            lambda vertex:
-                vertex.virtual_key
-                if vertex.virtual_key is not None
-                else 0,
+            placements, graph_mapper, self, self._virtual_key_of,
             machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.get_spike_ticks)
+    def get_spike_ticks(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._spike_recorder.get_spike_ticks(
+            self.label, buffer_manager, 0,
+            placements, graph_mapper, self, self._virtual_key_of)
+
+    @staticmethod
+    def _virtual_key_of(vertex):
+        if vertex.virtual_key is not None:
+            return vertex.virtual_key
+        return 0
+
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        self._spike_recorder.reset_extraction_cursors()
         machine_vertices = graph_mapper.get_machine_vertices(self)
         for machine_vertex in machine_vertices:
             placement = placements.get_placement_of_vertex(machine_vertex)
@@ -166,6 +175,10 @@ class SpikeSourceArrayVertex(
                 placement.x, placement.y, placement.p,
                 SpikeSourceArrayVertex.SPIKE_RECORDING_REGION_ID)
 
+    @overrides(AbstractSpikeRecordable.reset_extraction_cursors)
+    def reset_extraction_cursors(self):
+        self._spike_recorder.reset_extraction_cursors()
+
     @staticmethod
     def set_model_max_atoms_per_core(new_value=sys.maxsize):
         SpikeSourceArrayVertex._model_based_max_atoms_per_core = new_value
@@ -691,6 +691,14 @@ class SpikeSourcePoissonVertex(
             SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID,
             placements, graph_mapper, self, machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.get_spike_ticks)
+    def get_spike_ticks(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._spike_recorder.get_spike_ticks(
+            self.label, buffer_manager,
+            SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID,
+            placements, graph_mapper, self)
+
     @overrides(AbstractProvidesOutgoingPartitionConstraints.
                get_outgoing_partition_constraints)
     def get_outgoing_partition_constraints(self, partition):
@@ -698,6 +706,7 @@ class SpikeSourcePoissonVertex(
 
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        self._spike_recorder.reset_extraction_cursors()
         machine_vertices = graph_mapper.get_machine_vertices(self)
         for machine_vertex in machine_vertices:
             placement = placements.get_placement_of_vertex(machine_vertex)
@@ -705,6 +714,10 @@ class SpikeSourcePoissonVertex(
                 placement.x, placement.y, placement.p,
                 SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID)
 
+    @overrides(AbstractSpikeRecordable.reset_extraction_cursors)
+    def reset_extraction_cursors(self):
+        self._spike_recorder.reset_extraction_cursors()
+
     def describe(self):
         """
         Returns a human-readable description of the cell or synapse type.
@@ -118,15 +118,26 @@ class SpikeInjectorVertex(
         return self._spike_recorder.get_spikes(
             self.label, buffer_manager,
             SpikeInjectorVertex.SPIKE_RECORDING_REGION_ID,
-            placements, graph_mapper, self,
-            lambda vertex:
-                vertex.virtual_key
-                if vertex.virtual_key is not None
-                else 0,
+            placements, graph_mapper, self, self._virtual_key_of,
             machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.get_spike_ticks)
+    def get_spike_ticks(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._spike_recorder.get_spike_ticks(
+            self.label, buffer_manager,
+            SpikeInjectorVertex.SPIKE_RECORDING_REGION_ID,
+            placements, graph_mapper, self, self._virtual_key_of)
+
+    @staticmethod
+    def _virtual_key_of(vertex):
+        if vertex.virtual_key is not None:
+            return vertex.virtual_key
+        return 0
+
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        self._spike_recorder.reset_extraction_cursors()
         machine_vertices = graph_mapper.get_machine_vertices(self)
         for machine_vertex in machine_vertices:
             placement = placements.get_placement_of_vertex(machine_vertex)
@@ -134,6 +145,10 @@ class SpikeInjectorVertex(
                 placement.x, placement.y, placement.p,
                 SpikeInjectorVertex.SPIKE_RECORDING_REGION_ID)
 
+    @overrides(AbstractSpikeRecordable.reset_extraction_cursors)
+    def reset_extraction_cursors(self):
+        self._spike_recorder.reset_extraction_cursors()
+
     @overrides(AbstractProvidesOutgoingPartitionConstraints.
                get_outgoing_partition_constraints)
     def get_outgoing_partition_constraints(self, partition):
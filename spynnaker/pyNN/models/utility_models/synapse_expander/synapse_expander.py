@@ -6,6 +6,7 @@ import logging
 from spynnaker.pyNN.exceptions import SpynnakerException
 from spinn_utilities.progress_bar import ProgressBar
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,12 @@ def synapse_expander(
         app_graph, graph_mapper, placements, transceiver,
         provenance_file_path, executable_finder):
     """ Run the synapse expander - needs to be done after data has been loaded
+
+    :return: \
+        The estimated number of synapses generated, the number of cores run\
+        on and the time taken in seconds, to calibrate the costs of\
+        generating synapses on the machine
+    :rtype: tuple(int, int, float)
     """
 
     synapse_expander = executable_finder.get_executable_path(SYNAPSE_EXPANDER)
@@ -26,6 +33,7 @@ def synapse_expander(
 
     # Find the places where the synapse expander and delay receivers should run
     expander_cores = ExecutableTargets()
+    n_synapses = 0
     for vertex in progress.over(app_graph.vertices, finish_at_end=False):
 
         # Find population vertices
@@ -40,12 +48,15 @@ def synapse_expander(
                     placement = placements.get_placement_of_vertex(m_vertex)
                     if isinstance(vertex, AbstractPopulationVertex):
                         binary = synapse_expander
+                        n_synapses += vertex.get_synapse_generation_totals(
+                            vertex_slice)[0]
                     else:
                         binary = delay_expander
                     expander_cores.add_processor(
                         binary, placement.x, placement.y, placement.p)
 
     # Launch the delay receivers
+    start = time.time()
     expander_app_id = transceiver.app_id_tracker.get_new_id()
     transceiver.execute_application(expander_cores, expander_app_id)
     progress.update()
@@ -56,6 +67,7 @@ def synapse_expander(
         transceiver.wait_for_cores_to_be_in_state(
             expander_cores.all_core_subsets, expander_app_id,
             [CPUState.FINISHED])
+        seconds = time.time() - start
         progress.update()
         finished = True
         _extract_iobuf(expander_cores, transceiver, provenance_file_path)
@@ -72,6 +84,9 @@ def synapse_expander(
             raise SpynnakerException(
                 "The synapse expander failed to complete")
 
+    # The one result is itself a tuple, so is wrapped in another
+    return ((n_synapses, expander_cores.total_processors, seconds), )
+
 
 def _extract_iobuf(expander_cores, transceiver, provenance_file_path):
     """ Extract IOBuf from the cores
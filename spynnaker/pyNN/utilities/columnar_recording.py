@@ -0,0 +1,150 @@
+""" Writing and reading of recorded data as a directory of binary columns,\
+    described by a JSON metadata file, that can be mapped into memory with\
+    numpy without reading or converting the data.
+
+The directory holds:
+
+* ``metadata.json``, giving for each array its file, numpy dtype and shape
+* ``spikes_neuron_id.bin`` and ``spikes_tick.bin``, the neuron IDs and\
+  timesteps of the spikes as little-endian uint32 columns, sorted by neuron\
+  ID and then timestep
+* for each recorded variable, ``<variable>.bin``, the values as a\
+  little-endian float64 array of one row per sample and one column per\
+  neuron recording, and ``<variable>_indexes.bin``, the uint32 neuron IDs\
+  of the columns
+"""
+import io
+import json
+import os
+import numpy
+from spynnaker.pyNN.exceptions import SpynnakerException
+
+FORMAT = "spynnaker_columnar_recording"
+VERSION = 1
+METADATA_FILE = "metadata.json"
+
+_ID_DTYPE = numpy.dtype("<u4")
+_VALUE_DTYPE = numpy.dtype("<f8")
+
+
+def _write_spikes(directory, spike_columns):
+    n_spikes = 0
+
+    # Each chunk of spikes is split between the two files as it is read
+    with io.open(os.path.join(directory, "spikes_neuron_id.bin"), "wb") as \
+            ids_file, \
+            io.open(os.path.join(directory, "spikes_tick.bin"), "wb") as \
+            ticks_file:
+        for ids, ticks in spike_columns:
+            if len(ids) != len(ticks):
+                raise SpynnakerException(
+                    "Spike neuron IDs and timesteps differ in length")
+            ids_file.write(numpy.asarray(ids).astype(_ID_DTYPE).tobytes())
+            ticks_file.write(numpy.asarray(ticks).astype(_ID_DTYPE).tobytes())
+            n_spikes += len(ids)
+    return {
+        "neuron_id": {
+            "file": "spikes_neuron_id.bin", "dtype": _ID_DTYPE.str,
+            "shape": [n_spikes]},
+        "tick": {
+            "file": "spikes_tick.bin", "dtype": _ID_DTYPE.str,
+            "shape": [n_spikes]}}
+
+
+def _write_signal(directory, variable, chunks, indexes, sampling_interval):
+    n_rows = 0
+    n_columns = len(indexes)
+    with io.open(os.path.join(directory, variable + ".bin"), "wb") as f:
+        for chunk in chunks:
+            chunk = numpy.asarray(chunk, dtype=_VALUE_DTYPE)
+            if chunk.ndim != 2 or chunk.shape[1] != n_columns:
+                raise SpynnakerException(
+                    "Chunk of {} has shape {} but there are {} indexes".format(
+                        variable, chunk.shape, n_columns))
+            f.write(chunk.tobytes())
+            n_rows += len(chunk)
+    with io.open(os.path.join(directory, variable + "_indexes.bin"),
+                 "wb") as f:
+        f.write(numpy.asarray(indexes).astype(_ID_DTYPE).tobytes())
+    return {
+        "data": {
+            "file": variable + ".bin", "dtype": _VALUE_DTYPE.str,
+            "shape": [n_rows, n_columns]},
+        "indexes": {
+            "file": variable + "_indexes.bin", "dtype": _ID_DTYPE.str,
+            "shape": [n_columns]},
+        "sampling_interval": sampling_interval}
+
+
+def write_columnar_recording(
+        directory, label, machine_time_step, spike_columns=None,
+        signals=None):
+    """ Write recorded data to a directory as binary columns, a chunk at a\
+        time, so that the data is never all held in memory
+
+    :param directory: The directory to write to, which is made if needed
+    :param label: The label of the population that recorded the data
+    :param machine_time_step: The timestep of the simulation in microseconds
+    :param spike_columns: \
+        The neuron IDs and timesteps of chunks of spikes, with the spikes of\
+        all the chunks together sorted by neuron ID and then timestep, or\
+        None if spikes were not recorded
+    :type spike_columns: iterable(tuple(numpy.array, numpy.array)) or None
+    :param signals: \
+        A dictionary of variable name to the consecutive chunks of rows of\
+        its data, the neuron IDs of the columns and the sampling interval
+    :type signals: dict(str, tuple(iterable(numpy.array), list(int), float))
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    metadata = {
+        "format": FORMAT, "version": VERSION, "label": label,
+        "machine_time_step": machine_time_step, "signals": {}}
+    if spike_columns is not None:
+        metadata["spikes"] = _write_spikes(directory, spike_columns)
+    if signals is not None:
+        for variable, (chunks, indexes, sampling_interval) in \
+                signals.items():
+            metadata["signals"][variable] = _write_signal(
+                directory, variable, chunks, indexes, sampling_interval)
+
+    # The metadata is written last, so a directory with metadata is complete
+    with io.open(os.path.join(directory, METADATA_FILE), "w") as f:
+        f.write(u"" + json.dumps(metadata, indent=2, sort_keys=True))
+
+
+def _map_array(directory, description):
+    shape = tuple(description["shape"])
+    dtype = numpy.dtype(str(description["dtype"]))
+
+    # numpy can't map an empty file, so empty arrays are made instead
+    if any(size == 0 for size in shape):
+        return numpy.zeros(shape, dtype=dtype)
+    return numpy.memmap(
+        os.path.join(directory, description["file"]), dtype=dtype,
+        mode="r", shape=shape)
+
+
+def read_columnar_recording(directory):
+    """ Map the recorded data written by :py:func:`write_columnar_recording`\
+        into memory
+
+    :param directory: The directory the data was written to
+    :return: The metadata, with each array description replaced by the\
+        array mapped from its file
+    :rtype: dict
+    """
+    with io.open(os.path.join(directory, METADATA_FILE), "r") as f:
+        metadata = json.load(f)
+    if metadata.get("format") != FORMAT or metadata.get("version") != VERSION:
+        raise SpynnakerException(
+            "{} is not a version {} {} directory".format(
+                directory, VERSION, FORMAT))
+    if "spikes" in metadata:
+        for column in ("neuron_id", "tick"):
+            metadata["spikes"][column] = _map_array(
+                directory, metadata["spikes"][column])
+    for signal in metadata["signals"].values():
+        for array in ("data", "indexes"):
+            signal[array] = _map_array(directory, signal[array])
+    return metadata
@@ -0,0 +1,38 @@
+from enum import Enum
+import numpy
+
+
+class RNGStream(Enum):
+    """ The independent streams of random numbers used by a projection
+    """
+    CONNECTIONS = 0
+    WEIGHTS = 1
+    DELAYS = 2
+    REWIRING = 3
+    CONNECTOR_SEED = 4
+    WEIGHT_SEED = 5
+    DELAY_SEED = 6
+
+
+class KeyedRNG(object):
+    """ A random number generator whose values depend only on a key, such\
+        as (projection seed, pre-slice lo_atom, post-slice lo_atom, stream).
+
+    Each key gives an independent stream, so a block of synapses drawn from\
+    it is the same whichever order, and whichever process, it is generated\
+    in, and however many times it is regenerated.
+    """
+
+    __slots__ = ["_random_state"]
+
+    def __init__(self, *key):
+        """
+        :param key: unsigned 32-bit integers that select the stream
+        """
+        self._random_state = numpy.random.RandomState(
+            [int(value) & 0xFFFFFFFF for value in key])
+
+    def next(self, n=1):
+        """ Get an array of n uniform random values in [0, 1)
+        """
+        return self._random_state.random_sample(n)
@@ -1,3 +1,4 @@
+import numpy
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ranged.ranged_list import RangedList
 from spinn_front_end_common.utilities import globals_variables
@@ -18,7 +19,32 @@ class SpynnakerRangedList(RangedList):
     @overrides(RangedList.as_list)
     def as_list(value, size, ids=None):
 
+        # Draw all the values at once, and keep them as an array so that
+        # they are only drawn again if the value is set again
         if globals_variables.get_simulator().is_a_pynn_random(value):
-            return value.next(n=size)
+            return numpy.asarray(
+                value.next(n=size), dtype="float64").reshape(size)
 
         return RangedList.as_list(value, size, ids)
+
+    def get_array_by_slice(self, slice_start, slice_stop):
+        """ Get the values of a slice of the list as a numpy array of floats.\
+            If the values were drawn from a random distribution, this is a\
+            view of the values rather than a copy.
+
+        :param slice_start: Start of the slice
+        :type slice_start: int
+        :param slice_stop: Exclusive end of the slice
+        :type slice_stop: int
+        :rtype: numpy.array(dtype="float64")
+        """
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if not self.range_based():
+            return numpy.asarray(
+                self._ranges[slice_start:slice_stop], dtype="float64")
+        values = numpy.empty(slice_stop - slice_start, dtype="float64")
+        for start, stop, value in self.iter_ranges_by_slice(
+                slice_start, slice_stop):
+            values[start - slice_start:stop - slice_start] = value
+        return values
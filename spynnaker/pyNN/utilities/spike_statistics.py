@@ -0,0 +1,180 @@
+""" Statistics of recorded spikes, counted from chunks of spikes as they are\
+    decoded so that only the counts, and not the spikes, are kept.
+"""
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+
+def _ticks_of(width, machine_time_step, name):
+    """ Convert a width in milliseconds into a whole number of timesteps
+
+    :param width: The width in milliseconds, or None for one timestep
+    :param machine_time_step: The timestep of the simulation in microseconds
+    """
+    if width is None:
+        return 1
+    step = machine_time_step / 1000.0
+    ticks = int(round(width / step))
+    if ticks < 1 or abs(width - ticks * step) > 1e-9 * step:
+        raise ConfigurationException(
+            "{} {} is not a positive integer multiple of the simulation "
+            "timestep {}".format(name, width, step))
+    return ticks
+
+
+def _add_bin_counts(totals, bins):
+    """ Add the number of each bin in bins to totals, ignoring bins past the\
+        end of totals
+    """
+    counts = numpy.bincount(bins, minlength=len(totals))
+    totals += counts[:len(totals)]
+
+
+class SpikeStatistics(object):
+    """ Spike counts of each neuron, a post-stimulus time histogram of the\
+        spikes of the population, and a histogram of the inter-spike\
+        intervals of the neurons, accumulated from chunks of the neuron IDs\
+        and timesteps of spikes, so that memory is needed only for the\
+        neurons and the bins and not for the spikes.
+    """
+
+    __slots__ = [
+        "_bin_ticks",
+        "_isi_bin_ticks",
+        "_isi_counts",
+        "_last_spike",
+        "_machine_time_step",
+        "_n_timesteps",
+        "_psth_counts",
+        "_spike_counts"]
+
+    def __init__(self, n_neurons, n_timesteps, machine_time_step,
+                 bin_width=None, isi_bin_width=None, max_isi=None):
+        """
+        :param n_neurons: The number of neurons of the population
+        :param n_timesteps: The number of timesteps simulated
+        :param machine_time_step: \
+            The timestep of the simulation in microseconds
+        :param bin_width: \
+            The width in milliseconds of the bins of the histogram of the\
+            times of the spikes, or None for one timestep
+        :param isi_bin_width: \
+            The width in milliseconds of the bins of the histogram of the\
+            inter-spike intervals, or None for one timestep
+        :param max_isi: \
+            The longest inter-spike interval in milliseconds to give a bin\
+            of its own; longer intervals are counted in the last bin.  None\
+            gives bins for all the intervals the simulation could have.
+        :raise ConfigurationException: \
+            If a width is not a whole number of timesteps
+        """
+        self._machine_time_step = machine_time_step
+        self._n_timesteps = n_timesteps
+        self._bin_ticks = _ticks_of(bin_width, machine_time_step, "bin_width")
+        self._isi_bin_ticks = _ticks_of(
+            isi_bin_width, machine_time_step, "isi_bin_width")
+        if max_isi is None:
+            max_isi_ticks = max(n_timesteps - 1, 1)
+        else:
+            max_isi_ticks = _ticks_of(max_isi, machine_time_step, "max_isi")
+        self._spike_counts = numpy.zeros(n_neurons, dtype="int64")
+        self._psth_counts = numpy.zeros(
+            -(-n_timesteps // self._bin_ticks), dtype="int64")
+        self._isi_counts = numpy.zeros(
+            max_isi_ticks // self._isi_bin_ticks + 1, dtype="int64")
+        self._last_spike = None
+
+    def add_spikes(self, spike_ids, spike_ticks):
+        """ Count a chunk of spikes.  The chunks must be added in order, so\
+            that the spikes of all of them together are sorted by neuron ID\
+            and then timestep, as :py:meth:`iter_spike_columns` gives them.
+
+        :param spike_ids: The neuron IDs of the spikes
+        :param spike_ticks: The timesteps of the spikes
+        """
+        if not len(spike_ids):
+            return
+        spike_ids = numpy.asarray(spike_ids, dtype="int64")
+        spike_ticks = numpy.asarray(spike_ticks, dtype="int64")
+        _add_bin_counts(self._spike_counts, spike_ids)
+        _add_bin_counts(self._psth_counts, spike_ticks // self._bin_ticks)
+
+        # An interval is between consecutive spikes of the same neuron, which
+        # might be the last spike of the previous chunk
+        same_neuron = spike_ids[1:] == spike_ids[:-1]
+        isis = (spike_ticks[1:] - spike_ticks[:-1])[same_neuron]
+        if self._last_spike is not None and \
+                self._last_spike[0] == spike_ids[0]:
+            isis = numpy.append(isis, spike_ticks[0] - self._last_spike[1])
+        self._last_spike = (spike_ids[-1], spike_ticks[-1])
+        self._isi_counts += numpy.bincount(
+            numpy.minimum(isis // self._isi_bin_ticks,
+                          len(self._isi_counts) - 1),
+            minlength=len(self._isi_counts))
+
+    def _bin_edges(self, n_bins, bin_ticks):
+        return numpy.arange(n_bins + 1) * (
+            bin_ticks * self._machine_time_step / 1000.0)
+
+    @property
+    def n_spikes(self):
+        """ The number of spikes counted
+        """
+        return int(self._spike_counts.sum())
+
+    @property
+    def spike_counts(self):
+        """ The number of spikes of each neuron
+
+        :rtype: numpy.array(int64)
+        """
+        return self._spike_counts
+
+    @property
+    def mean_rates(self):
+        """ The mean firing rate of each neuron over the simulation, in Hz
+
+        :rtype: numpy.array(float)
+        """
+        duration = self._n_timesteps * self._machine_time_step / 1000000.0
+        if duration == 0:
+            return numpy.zeros(len(self._spike_counts))
+        return self._spike_counts / duration
+
+    @property
+    def psth(self):
+        """ The number of spikes of the population in each bin of time
+
+        :return: The edges of the bins in milliseconds, and the counts
+        :rtype: tuple(numpy.array(float), numpy.array(int64))
+        """
+        return (self._bin_edges(len(self._psth_counts), self._bin_ticks),
+                self._psth_counts)
+
+    @property
+    def windowed_rates(self):
+        """ The mean firing rate of the neurons of the population in each\
+            bin of time, in Hz; the last bin is only as long as the time\
+            simulated in it
+
+        :return: The edges of the bins in milliseconds, and the rates
+        :rtype: tuple(numpy.array(float), numpy.array(float))
+        """
+        edges, counts = self.psth
+        ticks = numpy.minimum(
+            numpy.arange(1, len(counts) + 1) * self._bin_ticks,
+            self._n_timesteps) - numpy.arange(len(counts)) * self._bin_ticks
+        seconds = ticks * self._machine_time_step / 1000000.0
+        n_neurons = max(len(self._spike_counts), 1)
+        return (edges, counts / (seconds * n_neurons))
+
+    @property
+    def isi_histogram(self):
+        """ The number of inter-spike intervals of the neurons in each bin\
+            of interval; the last bin also counts all longer intervals
+
+        :return: The edges of the bins in milliseconds, and the counts
+        :rtype: tuple(numpy.array(float), numpy.array(int64))
+        """
+        return (self._bin_edges(len(self._isi_counts), self._isi_bin_ticks),
+                self._isi_counts)
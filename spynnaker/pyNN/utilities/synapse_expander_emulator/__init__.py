@@ -0,0 +1,4 @@
+from .kiss64_rng import KISS64RNG
+from .synapse_expander_emulator import emulate_synapse_expander
+
+__all__ = ["KISS64RNG", "emulate_synapse_expander"]
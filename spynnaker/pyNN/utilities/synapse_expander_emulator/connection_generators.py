@@ -0,0 +1,204 @@
+""" Emulation of the connection generators of the synapse expander.
+
+Each generator makes the connections of all the rows of a sub-matrix at\
+once, returning the pre-neuron index and core-relative post-neuron index of\
+each connection in the order the machine would make them.
+"""
+import numpy
+from .kiss64_rng import KISS64RNG
+
+# The number of words in the seed of a random number generator
+_SEED_WORDS = 4
+
+_MASK_32 = 0xFFFFFFFF
+
+
+def _empty():
+    return numpy.zeros(0, dtype="uint32"), numpy.zeros(0, dtype="uint16")
+
+
+def _all_pairs(pre_slice_start, pre_slice_count, post_slice_start,
+               post_slice_count, allow_self_connections):
+    """ Get the pre- and post-neuron of each possible pair in row order
+    """
+    pre_neurons = numpy.repeat(numpy.arange(
+        pre_slice_start, pre_slice_start + pre_slice_count, dtype="uint32"),
+        post_slice_count)
+    post_indices = numpy.tile(
+        numpy.arange(post_slice_count, dtype="uint32"), pre_slice_count)
+    if not allow_self_connections:
+        keep = pre_neurons != post_indices + post_slice_start
+        pre_neurons = pre_neurons[keep]
+        post_indices = post_indices[keep]
+    return pre_neurons, post_indices
+
+
+class ConnectionGeneratorOneToOne(object):
+    __slots__ = []
+
+    def __init__(self, reader):
+        pass
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        # pylint: disable=too-many-arguments
+        if max_row_length < 1:
+            return _empty()
+        pre_neurons = numpy.arange(
+            max(pre_slice_start, post_slice_start),
+            min(pre_slice_start + pre_slice_count,
+                post_slice_start + post_slice_count), dtype="uint32")
+        return pre_neurons, (pre_neurons - post_slice_start).astype("uint16")
+
+
+class ConnectionGeneratorAllToAll(object):
+    __slots__ = ["_allow_self_connections"]
+
+    def __init__(self, reader):
+        self._allow_self_connections = reader.read_word()
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        # pylint: disable=too-many-arguments
+        if max_row_length < 1:
+            return _empty()
+        pre_neurons, post_indices = _all_pairs(
+            pre_slice_start, pre_slice_count, post_slice_start,
+            post_slice_count, self._allow_self_connections)
+        return pre_neurons, post_indices.astype("uint16")
+
+
+class ConnectionGeneratorFixedProbability(object):
+    __slots__ = ["_allow_self_connections", "_probability", "_rng"]
+
+    def __init__(self, reader):
+        self._allow_self_connections = reader.read_word()
+        self._probability = reader.read_word()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        # pylint: disable=too-many-arguments
+        if max_row_length < 1:
+            return _empty()
+
+        # A value is drawn for every pair that is allowed, connecting if
+        # the value is small enough and the row has space
+        pre_neurons, post_indices = _all_pairs(
+            pre_slice_start, pre_slice_count, post_slice_start,
+            post_slice_count, self._allow_self_connections)
+        connect = (
+            self._rng.next_uint32(len(pre_neurons)) <= self._probability)
+        pre_neurons = pre_neurons[connect]
+        post_indices = post_indices[connect]
+
+        # Only the first max_row_length of each row fit
+        _, row_starts, row_lengths = numpy.unique(
+            pre_neurons, return_index=True, return_counts=True)
+        position = numpy.arange(len(pre_neurons)) - numpy.repeat(
+            row_starts, row_lengths)
+        fits = position < max_row_length
+        return pre_neurons[fits], post_indices[fits].astype("uint16")
+
+
+class ConnectionGeneratorFixedTotal(object):
+    __slots__ = [
+        "_allow_self_connections", "_with_replacement", "_n_connections",
+        "_n_potential_synapses", "_rng"]
+
+    def __init__(self, reader):
+        self._allow_self_connections = reader.read_word()
+        self._with_replacement = reader.read_word()
+        self._n_connections = reader.read_word()
+        self._n_potential_synapses = reader.read_word()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def _binomial(self, n, N, K):
+        # pylint: disable=invalid-name
+        values = self._rng.next_uint32(n).astype("uint64")
+        positions = (values * numpy.uint64(N)) >> numpy.uint64(32)
+        return int(numpy.count_nonzero(positions < K))
+
+    def _hypergeometric(self, n, N, K):
+        # pylint: disable=invalid-name
+        count = 0
+        k_remaining = K
+        not_k_remaining = (N - K) & _MASK_32
+        for value in self._rng.next_uint32(n):
+            total = (k_remaining + not_k_remaining) & _MASK_32
+            if (int(value) * total) >> 32 < k_remaining:
+                count += 1
+                k_remaining -= 1
+            else:
+                not_k_remaining = (not_k_remaining - 1) & _MASK_32
+        return count
+
+    def _sample(self, n_conns, post_slice_count):
+        if self._with_replacement:
+            values = self._rng.next_uint32(n_conns) & 0x7FFF
+            return (values * post_slice_count) >> 15
+
+        # Reservoir sampling; the last item placed in each slot stays there
+        items = numpy.arange(n_conns, post_slice_count, dtype="uint32")
+        slots = ((self._rng.next_uint32(len(items)) & 0x7FFF) *
+                 (items + 1)) >> 15
+        indices = numpy.arange(n_conns, dtype="uint32")
+        placed = slots < n_conns
+        slots = slots[placed][::-1]
+        items = items[placed][::-1]
+        slots, last = numpy.unique(slots, return_index=True)
+        indices[slots] = items[last]
+        return indices
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        # pylint: disable=too-many-arguments
+        all_pre_neurons = list()
+        all_post_indices = list()
+        last_row = pre_slice_start + pre_slice_count - 1
+        for pre_neuron in range(pre_slice_start, last_row + 1):
+            if max_row_length == 0 or self._n_connections == 0:
+                continue
+
+            # Work out how many values can be sampled from
+            n_values = post_slice_count
+            if (not self._allow_self_connections and
+                    post_slice_start <= pre_neuron <
+                    post_slice_start + post_slice_count):
+                n_values -= 1
+
+            # The last row gets all the remaining connections
+            if pre_neuron == last_row:
+                n_conns = self._n_connections
+            elif self._with_replacement:
+                n_conns = self._binomial(
+                    self._n_connections, self._n_potential_synapses,
+                    n_values)
+            else:
+                n_conns = self._hypergeometric(
+                    self._n_connections, self._n_potential_synapses,
+                    n_values)
+            n_conns = min(n_conns, max_row_length)
+
+            post_indices = self._sample(n_conns, post_slice_count)
+            all_pre_neurons.append(
+                numpy.full(len(post_indices), pre_neuron, dtype="uint32"))
+            all_post_indices.append(post_indices.astype("uint16"))
+
+            self._n_connections = (self._n_connections - n_conns) & _MASK_32
+            self._n_potential_synapses = (
+                self._n_potential_synapses - post_slice_count) & _MASK_32
+
+        if not all_pre_neurons:
+            return _empty()
+        return (numpy.concatenate(all_pre_neurons),
+                numpy.concatenate(all_post_indices))
+
+
+# The connection generators by the hash used by the machine
+CONNECTION_GENERATORS = {
+    0: ConnectionGeneratorOneToOne,
+    1: ConnectionGeneratorAllToAll,
+    2: ConnectionGeneratorFixedProbability,
+    3: ConnectionGeneratorFixedTotal
+}
@@ -0,0 +1,54 @@
+import numpy
+
+_MASK_32 = 0xFFFFFFFF
+
+# The multiplier of the multiply-with-carry part of the generator
+_MWC_MULTIPLIER = 4294584393
+
+
+class KISS64RNG(object):
+    """ The Marsaglia KISS 64 random number generator used by the synapse\
+        expander (mars_kiss64_seed in spinn_common), producing the same\
+        sequence of 32-bit values from the same four word seed
+    """
+
+    __slots__ = [
+        "_seed"]
+
+    def __init__(self, seed):
+        """
+        :param seed: The four 32-bit words of the seed
+        """
+        self._seed = [int(value) & _MASK_32 for value in seed]
+
+    @property
+    def seed(self):
+        """ The current state of the generator
+        """
+        return list(self._seed)
+
+    def next_uint32(self, n):
+        """ Get the next n 32-bit values.
+
+        .. note::
+            Each value depends on the state left by the one before, so the\
+            values are made one at a time in Python, which takes about a\
+            microsecond each; this dominates the time taken to emulate\
+            connectors with random connections or values, as every\
+            random value the machine would draw is drawn here too.
+
+        :rtype: numpy array of uint32
+        """
+        x, y, z, c = self._seed
+        values = numpy.empty(n, dtype="uint32")
+        for i in range(n):
+            x = ((314527869 * x) + 1234567) & _MASK_32
+            y ^= (y << 5) & _MASK_32
+            y ^= y >> 7
+            y ^= (y << 22) & _MASK_32
+            t = (_MWC_MULTIPLIER * z) + c
+            c = t >> 32
+            z = t & _MASK_32
+            values[i] = (x + y + z) & _MASK_32
+        self._seed = [x, y, z, c]
+        return values
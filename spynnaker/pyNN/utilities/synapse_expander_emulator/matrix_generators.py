@@ -0,0 +1,213 @@
+""" Emulation of the matrix generators of the synapse expander.
+
+Each generator writes the rows of all the pre-neurons of a sub-matrix at\
+once into the words of the synaptic matrix region.
+"""
+import numpy
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+
+# The maximum delay of a single delay stage
+_MAX_DELAY = 16
+
+# The number of header words of each row
+_N_ROW_HEADER_WORDS = 3
+
+_SYNAPSE_DELAY_MASK = 0xFF
+
+
+def _get_delays(delays, max_stage):
+    """ Get the delay within the stage and the delay stage of each delay
+    """
+    delays = numpy.maximum(delays.astype("int64"), 1)
+    stages = (delays - 1) // _MAX_DELAY
+    clipped = stages >= max_stage
+    stages[clipped] = max_stage - 1
+    delays[clipped] = stages[clipped] * _MAX_DELAY
+
+    # C-style remainder, as the delay can be 0 here
+    delays = (numpy.fmod(delays - 1, _MAX_DELAY) + 1) & 0xFFFF
+    return delays, stages
+
+
+def _get_row_addresses(
+        synaptic_matrix_offset, delayed_synaptic_matrix_offset,
+        n_pre_neurons, max_row_n_words, max_delayed_row_n_words, max_stage):
+    """ Get the word address of the row of each pre-neuron (rows) in each\
+        delay stage (columns), or -1 where there is no row
+    """
+    rows = numpy.arange(n_pre_neurons, dtype="int64")
+    addresses = numpy.full((n_pre_neurons, max_stage), -1, dtype="int64")
+    if synaptic_matrix_offset is not None:
+        addresses[:, 0] = synaptic_matrix_offset + (
+            rows * (max_row_n_words + _N_ROW_HEADER_WORDS))
+    if delayed_synaptic_matrix_offset is not None and max_stage > 1:
+        n_delayed_row_words = max_delayed_row_n_words + _N_ROW_HEADER_WORDS
+        stages = numpy.arange(1, max_stage, dtype="int64")
+        addresses[:, 1:] = (
+            delayed_synaptic_matrix_offset +
+            (rows * n_delayed_row_words)[:, None] +
+            ((stages - 1) * n_pre_neurons * n_delayed_row_words)[None, :])
+    return addresses
+
+
+def _get_row_positions(rows, stages, max_stage):
+    """ Get the position of each synapse within its row of its stage
+    """
+    keys = rows * max_stage + stages
+    order = numpy.argsort(keys, kind="mergesort")
+    sorted_keys = keys[order]
+    first = numpy.searchsorted(sorted_keys, sorted_keys, side="left")
+    positions = numpy.empty(len(keys), dtype="int64")
+    positions[order] = numpy.arange(len(keys)) - first
+    return positions
+
+
+def _check_rows_exist(row_addresses, stages):
+    missing = row_addresses < 0
+    if numpy.any(missing):
+        raise SynapticConfigurationException(
+            "Delay stage {} has not been initialised".format(
+                stages[missing][0]))
+
+
+class MatrixGeneratorStatic(object):
+    __slots__ = []
+
+    def __init__(self, reader):
+        pass
+
+    def write_rows(
+            self, synaptic_matrix, synaptic_matrix_offset,
+            delayed_synaptic_matrix_offset, n_pre_neurons, max_row_n_words,
+            max_delayed_row_n_words, synapse_type_bits, synapse_index_bits,
+            synapse_type, rows, indices, delays, weights, max_stage):
+        # pylint: disable=too-many-arguments, too-many-locals
+        addresses = _get_row_addresses(
+            synaptic_matrix_offset, delayed_synaptic_matrix_offset,
+            n_pre_neurons, max_row_n_words, max_delayed_row_n_words,
+            max_stage)
+        space = numpy.full(max_stage, max_delayed_row_n_words, dtype="int64")
+        space[0] = max_row_n_words
+
+        # Each row starts empty
+        for header in range(_N_ROW_HEADER_WORDS):
+            synaptic_matrix[addresses[addresses >= 0] + header] = 0
+
+        delays, stages = _get_delays(delays, max_stage)
+        row_addresses = addresses[rows, stages]
+        _check_rows_exist(row_addresses, stages)
+
+        # Synapses that don't fit in their rows are dropped
+        positions = _get_row_positions(rows, stages, max_stage)
+        fits = positions < space[stages]
+        index_mask = (1 << synapse_index_bits) - 1
+        type_mask = (1 << synapse_type_bits) - 1
+        words = (
+            (indices[fits].astype("uint32") & index_mask) |
+            ((synapse_type & type_mask) << synapse_index_bits) |
+            ((delays[fits].astype("uint32") & _SYNAPSE_DELAY_MASK) <<
+             (synapse_index_bits + synapse_type_bits)) |
+            ((weights[fits].astype("uint32") & 0xFFFF) << 16))
+        synaptic_matrix[
+            row_addresses[fits] + _N_ROW_HEADER_WORDS + positions[fits]] = \
+            words
+
+        # The fixed-fixed size of each row is the number of synapses in it
+        used = numpy.bincount(
+            rows[fits] * max_stage + stages[fits],
+            minlength=n_pre_neurons * max_stage).reshape(addresses.shape)
+        synaptic_matrix[addresses[addresses >= 0] + 1] = \
+            used[addresses >= 0]
+
+
+class MatrixGeneratorSTDP(object):
+    __slots__ = [
+        "_n_half_words_per_pp_row_header", "_n_half_words_per_pp_synapse",
+        "_weight_half_word"]
+
+    def __init__(self, reader):
+        self._n_half_words_per_pp_row_header = reader.read_word()
+        self._n_half_words_per_pp_synapse = reader.read_word()
+        self._weight_half_word = reader.read_word()
+
+    def write_rows(
+            self, synaptic_matrix, synaptic_matrix_offset,
+            delayed_synaptic_matrix_offset, n_pre_neurons, max_row_n_words,
+            max_delayed_row_n_words, synapse_type_bits, synapse_index_bits,
+            synapse_type, rows, indices, delays, weights, max_stage):
+        # pylint: disable=too-many-arguments, too-many-locals
+        half_words = synaptic_matrix.view("<u2")
+        header = self._n_half_words_per_pp_row_header
+        per_synapse = self._n_half_words_per_pp_synapse
+        addresses = _get_row_addresses(
+            synaptic_matrix_offset, delayed_synaptic_matrix_offset,
+            n_pre_neurons, max_row_n_words, max_delayed_row_n_words,
+            max_stage)
+        exists = addresses >= 0
+        row_addresses = addresses[exists]
+
+        # The space is held in 16 bits on the machine, so can wrap
+        space = numpy.full(
+            max_stage, max_delayed_row_n_words * 2, dtype="int64")
+        space[0] = max_row_n_words * 2
+        space = (space - header) & 0xFFFF
+
+        # Write the row headers
+        synaptic_matrix[row_addresses] = header >> 1
+        header_starts = (row_addresses + 1) * 2
+        for i in range(header):
+            half_words[header_starts + i] = 0
+
+        delays, stages = _get_delays(delays, max_stage)
+        synapse_addresses = addresses[rows, stages]
+        _check_rows_exist(synapse_addresses, stages)
+        positions = _get_row_positions(rows, stages, max_stage)
+        pp_starts = (synapse_addresses + 1 + (header >> 1)) * 2
+
+        # Write the plastic-plastic part of synapses that fit
+        fits = positions < space[stages] // per_synapse if per_synapse \
+            else numpy.ones(len(positions), dtype="bool")
+        synapse_starts = pp_starts[fits] + positions[fits] * per_synapse
+        for i in range(per_synapse):
+            half_words[synapse_starts + i] = 0
+        half_words[synapse_starts + self._weight_half_word] = \
+            weights[fits] & 0xFFFF
+
+        # Pad each row to a whole number of words and add to the size
+        used = numpy.bincount(
+            rows[fits] * max_stage + stages[fits],
+            minlength=n_pre_neurons * max_stage).reshape(addresses.shape)
+        n_pp_half_words = used[exists] * per_synapse
+        row_pp_starts = (row_addresses + 1 + (header >> 1)) * 2
+        odd = (n_pp_half_words & 0x1) == 1
+        half_words[(row_pp_starts + n_pp_half_words)[odd]] = 0
+        n_pp_half_words[odd] += 1
+        synaptic_matrix[row_addresses] += (
+            n_pp_half_words >> 1).astype("uint32")
+
+        # Write the fixed region after the plastic-plastic region, with all
+        # the synapses in the fixed-plastic part
+        fixed_addresses = numpy.full(addresses.shape, -1, dtype="int64")
+        fixed_addresses[exists] = (row_pp_starts + n_pp_half_words) // 2
+        synaptic_matrix[fixed_addresses[exists]] = 0
+        counts = numpy.bincount(
+            rows * max_stage + stages,
+            minlength=n_pre_neurons * max_stage).reshape(addresses.shape)
+        synaptic_matrix[fixed_addresses[exists] + 1] = counts[exists]
+        index_mask = (1 << synapse_index_bits) - 1
+        type_mask = (1 << synapse_type_bits) - 1
+        fixed_plastic = (
+            (indices.astype("uint32") & index_mask) |
+            ((synapse_type & type_mask) << synapse_index_bits) |
+            ((delays.astype("uint32") & _SYNAPSE_DELAY_MASK) <<
+             (synapse_index_bits + synapse_type_bits))) & 0xFFFF
+        half_words[
+            (fixed_addresses[rows, stages] + 2) * 2 + positions] = \
+            fixed_plastic
+
+
+# The matrix generators by the hash used by the machine
+MATRIX_GENERATORS = {
+    0: MatrixGeneratorStatic,
+    1: MatrixGeneratorSTDP
+}
@@ -0,0 +1,179 @@
+""" Emulation of the parameter generators of the synapse expander.
+
+Values are the raw values of S16.15 accums, held as int64.
+"""
+import numpy
+from scipy import special  # @UnresolvedImport
+from .kiss64_rng import KISS64RNG
+
+# The number of words in the seed of a random number generator
+_SEED_WORDS = 4
+
+# The number of values a 32-bit random value can take
+_TWO_TO_32 = float(1 << 32)
+
+
+def _multiply_ulr(random_values, value):
+    """ Multiply 32-bit random values taken as unsigned long fracts by an\
+        S16.15 raw value, without losing precision
+    """
+    random_values = random_values.astype("int64")
+    high = (random_values >> 16) * value
+    low = (random_values & 0xFFFF) * value
+    return (high + (low >> 16)) >> 16
+
+
+def _multiply_accum(values, value):
+    """ Multiply S16.15 raw values by an S16.15 raw value, as accum * accum\
+        does
+    """
+    return (values * value) >> 15
+
+
+def _norminv_urt(random_values):
+    """ Transform 32-bit random values into normally distributed S16.15 raw\
+        values as norminv_urt does, by taking the inverse of the normal\
+        cumulative distribution at the middle of the range of probabilities\
+        each random value stands for, to the nearest accum
+    """
+    uniform = (random_values.astype("float64") + 0.5) / _TWO_TO_32
+    return numpy.rint(special.ndtri(uniform) * 32768.0).astype("int64")
+
+
+def _exponential_dist_variate(rng, n):
+    """ Get exponentially distributed S16.15 raw values as\
+        exponential_dist_variate does, by von Neumann's method, which draws\
+        a varying number of random values for each value.  The random values\
+        are drawn a few at a time, but never more than the machine would\
+        draw, so that the generator is left in the same state.
+    """
+    values = numpy.empty(n, dtype="int64")
+    pending = list()
+
+    def draw(n_needed):
+        # At least n_needed more random values will be drawn
+        if not pending:
+            pending.extend(reversed(rng.next_uint32(n_needed).tolist()))
+        return pending.pop()
+
+    for i in range(n):
+        # Each value needs at least two random values
+        n_needed = 2 * (n - i)
+        a = 0
+        while True:
+            u = draw(n_needed)
+            u0 = u
+            while True:
+                u_star = draw(n_needed - 1)
+                if u < u_star:
+                    break
+                u = draw(n_needed)
+                if not u < u_star:
+                    break
+
+            # A falling run of odd length gives a value, of even length
+            # adds one to it and starts again
+            if u < u_star:
+                break
+            a += 1
+        values[i] = (a << 15) + (u0 >> 17)
+    return values
+
+
+class ParamGeneratorConstant(object):
+    __slots__ = ["_value"]
+
+    def __init__(self, reader):
+        self._value = reader.read_accum()
+
+    def generate(self, n):
+        return numpy.full(n, self._value, dtype="int64")
+
+
+class ParamGeneratorUniform(object):
+    __slots__ = ["_low", "_high", "_rng"]
+
+    def __init__(self, reader):
+        self._low = reader.read_accum()
+        self._high = reader.read_accum()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def generate(self, n):
+        return self._low + _multiply_ulr(
+            self._rng.next_uint32(n), self._high - self._low)
+
+
+class ParamGeneratorNormal(object):
+    __slots__ = ["_mu", "_sigma", "_rng"]
+
+    def __init__(self, reader):
+        self._mu = reader.read_accum()
+        self._sigma = reader.read_accum()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def generate(self, n):
+        return self._mu + _multiply_accum(
+            _norminv_urt(self._rng.next_uint32(n)), self._sigma)
+
+
+class ParamGeneratorNormalClipped(object):
+    __slots__ = ["_mu", "_sigma", "_low", "_high", "_rng"]
+
+    def __init__(self, reader):
+        self._mu = reader.read_accum()
+        self._sigma = reader.read_accum()
+        self._low = reader.read_accum()
+        self._high = reader.read_accum()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def generate(self, n):
+        # Values out of range are redrawn, so the values generated are the
+        # in-range values of the sequence in order; each value still to be
+        # made needs at least one more random value
+        values = numpy.zeros(0, dtype="int64")
+        while values.size < n:
+            drawn = self._mu + _multiply_accum(
+                _norminv_urt(self._rng.next_uint32(n - values.size)),
+                self._sigma)
+            values = numpy.concatenate((values, drawn[
+                (drawn >= self._low) & (drawn <= self._high)]))
+        return values
+
+
+class ParamGeneratorNormalClippedToBoundary(object):
+    __slots__ = ["_mu", "_sigma", "_low", "_high", "_rng"]
+
+    def __init__(self, reader):
+        self._mu = reader.read_accum()
+        self._sigma = reader.read_accum()
+        self._low = reader.read_accum()
+        self._high = reader.read_accum()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def generate(self, n):
+        return numpy.clip(self._mu + _multiply_accum(
+            _norminv_urt(self._rng.next_uint32(n)), self._sigma),
+            self._low, self._high)
+
+
+class ParamGeneratorExponential(object):
+    __slots__ = ["_beta", "_rng"]
+
+    def __init__(self, reader):
+        self._beta = reader.read_accum()
+        self._rng = KISS64RNG(reader.read_words(_SEED_WORDS))
+
+    def generate(self, n):
+        return _multiply_accum(
+            _exponential_dist_variate(self._rng, n), self._beta)
+
+
+# The parameter generators by the hash used by the machine
+PARAM_GENERATORS = {
+    0: ParamGeneratorConstant,
+    1: ParamGeneratorUniform,
+    2: ParamGeneratorNormal,
+    3: ParamGeneratorNormalClipped,
+    4: ParamGeneratorNormalClippedToBoundary,
+    5: ParamGeneratorExponential
+}
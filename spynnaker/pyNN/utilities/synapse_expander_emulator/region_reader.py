@@ -0,0 +1,47 @@
+import numpy
+
+
+class RegionReader(object):
+    """ Reads words in turn from the data of a region, as the synapse\
+        expander does
+    """
+
+    __slots__ = [
+        "_data",
+        "_position"]
+
+    def __init__(self, data, position=0):
+        """
+        :param data: The data of the region
+        :type data: numpy array of uint32
+        :param position: The index of the first word to read
+        """
+        self._data = numpy.asarray(data, dtype="uint32")
+        self._position = position
+
+    @property
+    def position(self):
+        """ The index of the next word to be read
+        """
+        return self._position
+
+    def read_words(self, n):
+        """ Read the next n words
+
+        :rtype: numpy array of uint32
+        """
+        if self._position + n > len(self._data):
+            raise ValueError("Read past the end of the region data")
+        words = self._data[self._position:self._position + n]
+        self._position += n
+        return words
+
+    def read_word(self):
+        """ Read the next word as an unsigned integer
+        """
+        return int(self.read_words(1)[0])
+
+    def read_accum(self):
+        """ Read the next word as the raw value of a signed S16.15 accum
+        """
+        return int(self.read_words(1).view("int32")[0])
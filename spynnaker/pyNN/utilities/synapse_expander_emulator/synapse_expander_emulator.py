@@ -0,0 +1,121 @@
+import numpy
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from .connection_generators import CONNECTION_GENERATORS
+from .matrix_generators import MATRIX_GENERATORS
+from .param_generators import PARAM_GENERATORS
+from .region_reader import RegionReader
+
+# The value of a synaptic matrix offset when there is no matrix
+_NO_MATRIX = 0xFFFFFFFF
+
+
+def _get_generator(generators, hash_value, kind, reader):
+    if hash_value not in generators:
+        raise SynapticConfigurationException(
+            "{} generator with hash {} not found".format(kind, hash_value))
+    return generators[hash_value](reader)
+
+
+def _get_delays(delay_params, timestep_per_delay):
+    """ Convert delay values to whole timesteps as the machine does
+    """
+    delays = (delay_params * timestep_per_delay) >> 15
+    delays[delays < 0] = 1 << 15
+    return (delays >> 15) & 0xFFFF
+
+
+def _get_weights(weight_params, weight_scale):
+    """ Convert weight values to scaled integers as the machine does
+    """
+    return ((numpy.abs(weight_params) * weight_scale) >> 15) & 0xFFFF
+
+
+def _expand_connection(
+        reader, synaptic_matrix, post_slice_start, post_slice_count,
+        n_synapse_type_bits, n_synapse_index_bits, weight_scales):
+    """ Expand the synapses of one connection, as\
+        read_connection_builder_region does
+    """
+    # pylint: disable=too-many-arguments, too-many-locals
+    synaptic_matrix_offset = reader.read_word()
+    delayed_synaptic_matrix_offset = reader.read_word()
+    max_row_n_words = reader.read_word()
+    max_delayed_row_n_words = reader.read_word()
+    max_row_n_synapses = reader.read_word()
+    max_delayed_row_n_synapses = reader.read_word()
+    pre_slice_start = reader.read_word()
+    pre_slice_count = reader.read_word()
+    max_stage = reader.read_word()
+    timestep_per_delay = reader.read_accum()
+    synapse_type = reader.read_word()
+    matrix_type_hash = reader.read_word()
+    connector_type_hash = reader.read_word()
+    weight_type_hash = reader.read_word()
+    delay_type_hash = reader.read_word()
+
+    matrix_generator = _get_generator(
+        MATRIX_GENERATORS, matrix_type_hash, "Matrix", reader)
+    connection_generator = _get_generator(
+        CONNECTION_GENERATORS, connector_type_hash, "Connection", reader)
+    weight_generator = _get_generator(
+        PARAM_GENERATORS, weight_type_hash, "Param", reader)
+    delay_generator = _get_generator(
+        PARAM_GENERATORS, delay_type_hash, "Param", reader)
+
+    # Each generator has its own random numbers, and each makes its values
+    # for the synapses in order, so they can all be made at once
+    pre_neurons, indices = connection_generator.generate(
+        pre_slice_start, pre_slice_count, post_slice_start, post_slice_count,
+        max_row_n_synapses + max_delayed_row_n_synapses)
+    n_synapses = len(indices)
+    delays = _get_delays(
+        delay_generator.generate(n_synapses), timestep_per_delay)
+    weights = _get_weights(
+        weight_generator.generate(n_synapses), weight_scales[synapse_type])
+
+    matrix_generator.write_rows(
+        synaptic_matrix,
+        None if synaptic_matrix_offset == _NO_MATRIX
+        else synaptic_matrix_offset,
+        None if delayed_synaptic_matrix_offset == _NO_MATRIX
+        else delayed_synaptic_matrix_offset,
+        pre_slice_count, max_row_n_words, max_delayed_row_n_words,
+        n_synapse_type_bits, n_synapse_index_bits, synapse_type,
+        (pre_neurons - pre_slice_start).astype("int64"), indices, delays,
+        weights, max_stage)
+
+
+def emulate_synapse_expander(connector_builder_data, synaptic_matrix):
+    """ Do the work of the synapse expander on host, writing the synapses\
+        described by the connector builder region of a vertex into its\
+        synaptic matrix region.
+
+    The connection generators, the parameter generators and the matrix\
+    generators draw the same random values as the machine, and transform\
+    them in the same way.  The normal parameter generators take the inverse\
+    of the normal distribution to the nearest accum, so they can differ in\
+    the last bit from norminv_urt of spinn_common, which approximates it.
+
+    :param connector_builder_data: \
+        The data of the connector builder region, as written by the\
+        synaptic manager
+    :type connector_builder_data: numpy array of uint32
+    :param synaptic_matrix: \
+        The words of the synaptic matrix region, updated in place
+    :type synaptic_matrix: numpy array of uint32
+    :raise SynapticConfigurationException: \
+        If a connection uses a generator that is not known
+    """
+    reader = RegionReader(connector_builder_data)
+    n_in_edges = reader.read_word()
+    post_slice_start = reader.read_word()
+    post_slice_count = reader.read_word()
+    n_synapse_types = reader.read_word()
+    n_synapse_type_bits = reader.read_word()
+    n_synapse_index_bits = reader.read_word()
+    weight_scales = [int(scale) for scale in reader.read_words(
+        n_synapse_types).view("int32")]
+    for _ in range(n_in_edges):
+        _expand_connection(
+            reader, synaptic_matrix, post_slice_start, post_slice_count,
+            n_synapse_type_bits, n_synapse_index_bits, weight_scales)
@@ -5,7 +5,12 @@ import numpy
 import os
 import logging
 import math
+import multiprocessing
+import shutil
+import sys
+import tempfile
 
+from spinn_utilities import logger_utils
 from spinn_utilities.safe_eval import SafeEval
 
 from scipy.stats import binom
@@ -17,6 +22,17 @@ MAX_RATE = 2 ** 32 - 1  # To allow a unit32_t to be used to store the rate
 
 logger = logging.getLogger(__name__)
 
+# The jobs being run by the current forked pool, and the directory the
+# workers return arrays through; these are inherited by the worker processes
+# when they are forked, so the jobs never have to be pickled
+_forked_jobs = None
+_forked_directory = None
+
+# Arrays returned by workers are written to files in memory rather than
+# being pickled, unless they are small enough that the file costs more
+_SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+_MIN_SHARED_ARRAY_BYTES = 64 * 1024
+
 
 def check_directory_exists_and_create_if_not(filename):
     """ Create a parent directory for a file if it doesn't exist
@@ -72,6 +88,39 @@ def convert_to(value, data_type):
             numpy.dtype(data_type.struct_encoding))
 
 
+def convert_to_array(values, data_type):
+    """ Convert an array of values to a given data type, rounding the exact\
+        scaled value of each to the nearest (half to even) and saturating at\
+        the limits of the data type rather than overflowing.  This can\
+        differ from :py:func:`convert_to`, which overflows, and which scales\
+        the decimal string of the value, so that on Python 2.7, where\
+        that string has only 12 significant digits, it can round differently.
+
+    :param values: The values to convert
+    :param data_type: The data type to convert to
+    :return: The converted data as a numpy array of the data type
+    """
+    dtype = numpy.dtype(data_type.struct_encoding)
+
+    # The scales are powers of two, so scaling in floating point is exact;
+    # values too big to scale become infinite, and so saturate below
+    with numpy.errstate(over="ignore"):
+        scaled = numpy.asarray(values, dtype="float64") * float(
+            data_type.scale)
+    if dtype.kind == "f":
+        return scaled.astype(dtype)
+    scaled = numpy.round(scaled)
+
+    # The largest 64-bit integers can't be represented as floats, so clip to
+    # the largest float that can be and then saturate anything above it
+    info = numpy.iinfo(dtype)
+    upper = float(info.max)
+    if upper > info.max:
+        upper = numpy.nextafter(upper, 0)
+    converted = numpy.clip(scaled, float(info.min), upper).astype(dtype)
+    return numpy.where(scaled > upper, info.max, converted).astype(dtype)
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time, extra=False):
     """ Read in a file of data values where the values are in a format of:
@@ -203,6 +252,16 @@ def get_minimum_probable_value(dist, n_items, chance=(1.0 / 100.0)):
     return stats.ppf(dist, prob)
 
 
+def get_percent_point_values(dist, probabilities):
+    """ Get the values of a RandomDistribution at each of the given\
+        probabilities; given uniform random probabilities, this draws values\
+        from the distribution using only the source of the probabilities
+    """
+    simulator = globals_variables.get_simulator()
+    stats = simulator.get_distribution_to_stats()[dist.name]
+    return stats.ppf(dist, probabilities)
+
+
 def get_mean(dist):
     """ Get the mean of a RandomDistribution
     """
@@ -275,6 +334,135 @@ def check_sampling_interval(sampling_interval):
     return sampling_interval
 
 
+def can_fork():
+    """ Determine if worker processes can be forked, and so can inherit the\
+        jobs to run rather than needing them to be pickled
+    """
+    if sys.platform.startswith("win"):
+        return False
+    get_all_start_methods = getattr(
+        multiprocessing, "get_all_start_methods", None)
+    return get_all_start_methods is None or "fork" in get_all_start_methods()
+
+
+class _SharedArray(object):
+    """ An array returned by a worker process in a file in shared memory
+    """
+
+    __slots__ = [
+        "_dtype",
+        "_filename",
+        "_shape"]
+
+    def __init__(self, array, directory):
+        fd, self._filename = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            array.tofile(f)
+        self._dtype = array.dtype
+        self._shape = array.shape
+
+    def get(self):
+        """ Map the array into memory, removing its file, which is freed\
+            when the array is
+        """
+        try:
+            return numpy.memmap(
+                self._filename, dtype=self._dtype, mode="c",
+                shape=self._shape).view(numpy.ndarray)
+        finally:
+            os.remove(self._filename)
+
+
+def _to_shared_memory(value, directory):
+    """ Replace the large arrays in a result with shared arrays
+    """
+    if isinstance(value, numpy.ndarray) and (
+            value.nbytes >= _MIN_SHARED_ARRAY_BYTES):
+        return _SharedArray(value, directory)
+    if type(value) in (tuple, list):
+        return type(value)(
+            _to_shared_memory(item, directory) for item in value)
+    return value
+
+
+def _from_shared_memory(value):
+    """ Replace the shared arrays in a result with the arrays
+    """
+    if isinstance(value, _SharedArray):
+        return value.get()
+    if type(value) in (tuple, list):
+        return type(value)(_from_shared_memory(item) for item in value)
+    return value
+
+
+def _run_forked_job(index):
+    # Messages only warned of once that the job warns of are sent back too,
+    # as the record of them is otherwise lost with the worker
+    # pylint: disable=protected-access
+    warned = set(logger_utils._already_issued)
+    function, args = _forked_jobs[index]
+    result = _to_shared_memory(function(*args), _forked_directory)
+    return result, logger_utils._already_issued - warned
+
+
+def run_in_forked_pool(jobs, n_processes, description):
+    """ Run jobs in a pool of forked worker processes, which inherit the\
+        jobs so that they never have to be pickled; the large numpy arrays\
+        in the results, at the top level or in tuples or lists, are\
+        returned through files in shared memory rather than being pickled.\
+        The jobs are run in this process instead if there is only one\
+        process or job, if processes can't be forked or the pool can't be\
+        started, or if this is already a worker of a pool.
+
+    :param jobs: A list of (function, args) tuples
+    :param n_processes: The most worker processes to use
+    :param description: What the jobs do, for any warning about the pool
+    :return: An iterator of function(*args) for each job, in order
+    """
+    # pylint: disable=global-statement
+    global _forked_jobs, _forked_directory
+    n_processes = min(n_processes, len(jobs))
+    if n_processes <= 1 or _forked_jobs is not None or not can_fork():
+        for function, args in jobs:
+            yield function(*args)
+        return
+
+    _forked_jobs = jobs
+    _forked_directory = tempfile.mkdtemp(dir=_SHARED_MEMORY_DIR)
+    try:
+        if hasattr(multiprocessing, "get_context"):
+            pool = multiprocessing.get_context("fork").Pool(n_processes)
+        else:
+            pool = multiprocessing.Pool(n_processes)
+    except (OSError, ValueError):
+        logger.warning(
+            "Could not start processes for %s; running in serial",
+            description)
+        _forked_jobs = None
+        shutil.rmtree(_forked_directory, ignore_errors=True)
+        _forked_directory = None
+        for function, args in jobs:
+            yield function(*args)
+        return
+
+    # The jobs are inherited on fork, so can be released here
+    _forked_jobs = None
+    directory = _forked_directory
+    _forked_directory = None
+    try:
+        for result, warned in pool.imap(_run_forked_job, range(len(jobs))):
+            # pylint: disable=protected-access
+            logger_utils._already_issued.update(warned)
+            yield _from_shared_memory(result)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+        # Remove the files of any results that were not taken
+        shutil.rmtree(directory, ignore_errors=True)
+
+
 def get_n_bits(n_values):
     """ Determine how many bits are required for the given number of values
     """
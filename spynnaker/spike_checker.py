@@ -1,19 +1,41 @@
 import numpy
 
 
+def _neuron_ids(spikes):
+    """ Get the neuron IDs of spikes as integers, whether the spikes are\
+        times in milliseconds or timesteps
+    """
+    if numpy.issubdtype(spikes.dtype, numpy.integer):
+        return spikes[:, 0]
+    return numpy.rint(spikes[:, 0]).astype("int64")
+
+
+def _sort_by_time(spikes):
+    """ Sort spikes by time, keeping the order of spikes at the same time
+    """
+    return spikes[spikes[:, 1].argsort(kind="mergesort")]
+
+
 def synfire_spike_checker(spikes, nNeurons):
+    """
+    Checks that the neurons spike one after the other, wrapping around to
+    the first neuron after the last
+
+    :param spikes: The spikes, as (neuron ID, time in milliseconds) or
+        (neuron ID, timestep) of each
+    :param nNeurons: Number of neurons
+    """
     if isinstance(spikes, numpy.ndarray):
-        sorted_spikes = spikes[spikes[:, 1].argsort()]
+        sorted_spikes = _sort_by_time(spikes)
         print(len(sorted_spikes))
-        num = 0
-        for row in sorted_spikes:
-            if num != round(row[0]):
-                numpy.savetxt("spikes.csv", sorted_spikes, fmt=['%d', '%d'],
-                              delimiter=',')
-                raise Exception("Unexpected spike at time " + str(row[1]))
-            num += 1
-            if num >= nNeurons:
-                num = 0
+        expected = numpy.arange(len(sorted_spikes)) % nNeurons
+        unexpected = numpy.flatnonzero(
+            _neuron_ids(sorted_spikes) != expected)
+        if len(unexpected):
+            numpy.savetxt("spikes.csv", sorted_spikes, fmt=['%d', '%d'],
+                          delimiter=',')
+            raise Exception("Unexpected spike at time " + str(
+                sorted_spikes[unexpected[0], 1]))
     else:
         for single in spikes:
             synfire_spike_checker(single, nNeurons)
@@ -24,17 +46,17 @@ def synfire_multiple_lines_spike_checker(spikes, nNeurons, lines,
     """
     Checks that there are the expected number of spike lines
 
-    :param spikes: The spikes
+    :param spikes: The spikes, as (neuron ID, time in milliseconds) or
+        (neuron ID, timestep) of each
     :param nNeurons: Number of neurons
     :param lines: Expected number of lines
     :param wrap_around: If True the lines will wrap around when reaching the
         last neuron
     """
-    sorted_spikes = spikes[spikes[:, 1].argsort()]
+    sorted_spikes = _sort_by_time(spikes)
     nums = [0] * lines
     used = [False] * lines
-    for row in sorted_spikes:
-        node = round(row[0])
+    for row, node in zip(sorted_spikes, _neuron_ids(sorted_spikes)):
         found = False
         for i in range(lines):
             if nums[i] == node:
@@ -1,6 +1,8 @@
 import configparser
 import numpy
+import scipy.stats
 from spinn_front_end_common.utilities import globals_variables
+from spynnaker.pyNN.utilities.random_stats import AbstractRandomStats
 from spynnaker.pyNN.utilities.spynnaker_failed_state \
     import SpynnakerFailedState
 
@@ -17,18 +19,77 @@ class MockPopulation(object):
 
     @property
     def label(self):
-        return self.label
+        return self._label
+
+    @property
+    def positions(self):
+        """ The neurons are in a line along x, one unit apart
+        """
+        positions = numpy.zeros((3, self._size))
+        positions[0] = numpy.arange(self._size)
+        return positions
 
     def __repr__(self):
         return "Population {}".format(self._label)
 
 
+class MockSpace(object):
+
+    def distances(self, A, B, expand=False):
+        d = A[:, :, None] - B[:, None, :]
+        if expand:
+            return numpy.abs(d)
+        return numpy.sqrt(numpy.sum(d ** 2, axis=0))
+
+
 class MockRNG(object):
 
     def next(self, n):
         return numpy.random.uniform(size=n)
 
 
+class MockRandomDistribution(object):
+    """ A uniform RandomDistribution
+    """
+
+    def __init__(self, low, high):
+        self.name = "uniform"
+        self.parameters = {"low": low, "high": high}
+        self._rng = numpy.random.RandomState(1)
+
+    def next(self, n=1):
+        return self._rng.uniform(
+            self.parameters["low"], self.parameters["high"], n)
+
+
+class MockUniformStats(AbstractRandomStats):
+
+    def _get_dist(self, dist):
+        low = dist.parameters["low"]
+        return scipy.stats.uniform(low, dist.parameters["high"] - low)
+
+    def cdf(self, dist, v):
+        return self._get_dist(dist).cdf(v)
+
+    def ppf(self, dist, p):
+        return self._get_dist(dist).ppf(p)
+
+    def mean(self, dist):
+        return self._get_dist(dist).mean()
+
+    def std(self, dist):
+        return self._get_dist(dist).std()
+
+    def var(self, dist):
+        return self._get_dist(dist).var()
+
+    def high(self, dist):
+        return dist.parameters["high"]
+
+    def low(self, dist):
+        return dist.parameters["low"]
+
+
 class MockSimulator(object):
 
     def __init__(self):
@@ -37,7 +98,12 @@ class MockSimulator(object):
             {"spikes_per_second": "30",
              "incoming_spike_buffer_size": "256",
              "ring_buffer_sigma": "5",
-             "one_to_one_connection_dtcm_max_bytes": "0"}
+             "one_to_one_connection_dtcm_max_bytes": "0",
+             "n_synapse_generation_processes": "1",
+             "synapse_generation_policy": "OnMachine",
+             "synapse_generation_policy_per_vertex": "False",
+             "synapse_generation_costs_file": "None",
+             "compact_synaptic_blocks": "False"}
         self.config["Buffers"] = {"time_between_requests": "10",
                                   "minimum_buffer_sdram": "10",
                                   "use_auto_pause_and_resume": "True",
@@ -46,9 +112,18 @@ class MockSimulator(object):
                                   "enable_buffered_recording": "False"}
         self.config["MasterPopTable"] = {"generator": "BinarySearch"}
         self.config["Reports"] = {"n_profile_samples": 0}
+        self.config["Recording"] = {"n_extraction_processes": "1",
+                                    "extraction_bytes_in_flight": "None"}
+
+    @property
+    def machine_time_step(self):
+        return 1000
 
     def is_a_pynn_random(self, values):
-        return isinstance(values, MockRNG)
+        return isinstance(values, (MockRNG, MockRandomDistribution))
+
+    def get_distribution_to_stats(self):
+        return {"uniform": MockUniformStats()}
 
     def get_pynn_NumpyRNG(self):
         return MockRNG()
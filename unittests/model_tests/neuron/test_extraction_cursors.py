@@ -0,0 +1,57 @@
+from spinn_storage_handlers import BufferedBytearrayDataStorage
+from spynnaker.pyNN.models.common import ExtractionCursors
+
+
+class _MockPlacement(object):
+    def __init__(self, p):
+        self.x = 0
+        self.y = 0
+        self.p = p
+
+
+def test_cursor_reads_only_new_data():
+    cursors = ExtractionCursors()
+    placement = _MockPlacement(1)
+    storage = BufferedBytearrayDataStorage()
+    storage.write(bytearray(b"abcde"))
+
+    # Only the bytes decoded are skipped next time
+    cursor = cursors.get_cursor(placement, 0, storage)
+    assert cursor.read_new() == b"abcde"
+    cursor.advance(4, ["abcd"])
+    storage.write(bytearray(b"fgh"))
+    cursor = cursors.get_cursor(placement, 0, storage)
+    assert cursor.n_bytes_decoded == 4
+    assert cursor.read_new() == b"efgh"
+    cursor.advance(4, ["efgh"])
+    assert cursor.decoded == ["abcd", "efgh"]
+    assert cursor.read_new() == b""
+
+    # Each region of each core has its own cursor
+    assert cursors.get_cursor(placement, 1, storage).n_bytes_decoded == 0
+    assert cursors.get_cursor(
+        _MockPlacement(2), 0, storage).n_bytes_decoded == 0
+
+
+def test_cursor_restarts():
+    cursors = ExtractionCursors()
+    placement = _MockPlacement(1)
+    storage = BufferedBytearrayDataStorage()
+    storage.write(bytearray(b"abcd"))
+    for region in (0, 1):
+        cursors.get_cursor(placement, region, storage).advance(4, ["abcd"])
+
+    # Clearing a region only forgets the data of that region
+    cursors.clear(0)
+    assert cursors.get_cursor(placement, 0, storage).decoded == []
+    assert cursors.get_cursor(placement, 1, storage).decoded == ["abcd"]
+
+    # New storage for a region, as after a reset, starts the cursor again
+    new_storage = BufferedBytearrayDataStorage()
+    new_storage.write(bytearray(b"wxyz"))
+    cursor = cursors.get_cursor(placement, 1, new_storage)
+    assert cursor.decoded == []
+    assert cursor.read_new() == b"wxyz"
+
+    cursors.clear()
+    assert cursors.get_cursor(placement, 1, new_storage).decoded == []
@@ -0,0 +1,115 @@
+import numpy
+from data_specification.enums import DataType
+from pacman.model.graphs.common import Slice
+from spinn_utilities.ranged import RangedList
+from spynnaker.pyNN.models.neuron.implementations import (
+    AbstractStandardNeuronComponent, NeuronImplStandard, Struct)
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from unittests.mocks import MockSimulator
+
+
+class _CountingStruct(Struct):
+    """ A struct that counts the structs it packs
+    """
+
+    __slots__ = ["n_packed"]
+
+    def __init__(self, field_types):
+        super(_CountingStruct, self).__init__(field_types)
+        self.n_packed = 0
+
+    def get_array(self, values, offset=0, array_size=1):
+        self.n_packed += array_size
+        return super(_CountingStruct, self).get_array(
+            values, offset, array_size)
+
+
+class _Component(AbstractStandardNeuronComponent):
+    """ A component with a single parameter
+    """
+
+    __slots__ = ["_variable"]
+
+    def __init__(self, variable):
+        super(_Component, self).__init__([DataType.S1615])
+        self._struct = _CountingStruct([DataType.S1615])
+        self._variable = variable
+
+    def get_n_cpu_cycles(self, n_neurons):
+        return n_neurons
+
+    def add_parameters(self, parameters):
+        parameters[self._variable] = 1.0
+
+    def add_state_variables(self, state_variables):
+        pass
+
+    def get_values(self, parameters, state_variables, vertex_slice):
+        return [parameters[self._variable]]
+
+    def update_values(self, values, parameters, state_variables):
+        pass
+
+    def has_variable(self, variable):
+        return variable == self._variable
+
+    def get_units(self, variable):
+        return "mV"
+
+
+def _values(data):
+    return list(data.view("int32") / 32768.0)
+
+
+def test_cached_data():
+    MockSimulator.setup()
+    components = [_Component(name) for name in ("a", "b", "c", "d")]
+    impl = NeuronImplStandard("test", "test.aplx", *components)
+    parameters = SpynnakerRangeDictionary(20)
+    state_variables = SpynnakerRangeDictionary(20)
+    impl.add_parameters(parameters)
+    first = Slice(0, 9)
+    second = Slice(10, 19)
+
+    data = impl.get_data(parameters, state_variables, first)
+    assert _values(data) == [1.0] * 40
+    impl.get_data(parameters, state_variables, second)
+    assert [c.struct.n_packed for c in components] == [20, 20, 20, 20]
+
+    # Nothing has changed, so nothing is packed again
+    assert numpy.array_equal(
+        data, impl.get_data(parameters, state_variables, first))
+    assert [c.struct.n_packed for c in components] == [20, 20, 20, 20]
+
+    # Only the changed atoms of the component with the variable are packed
+    parameters["b"][3:5] = 2.0
+    impl.mark_values_changed("b", 3, 4)
+    data = impl.get_data(parameters, state_variables, first)
+    impl.get_data(parameters, state_variables, second)
+    assert [c.struct.n_packed for c in components] == [20, 22, 20, 20]
+    assert _values(data)[10:20] == [1.0] * 3 + [2.0] * 2 + [1.0] * 5
+
+    # A change to all atoms packs all of both slices again
+    parameters["c"] = 3.0
+    impl.mark_values_changed("c")
+    data = impl.get_data(parameters, state_variables, first)
+    impl.get_data(parameters, state_variables, second)
+    assert [c.struct.n_packed for c in components] == [20, 22, 40, 20]
+
+    # The synapse type "c" comes after the threshold type "d" in the data
+    assert _values(data)[30:40] == [3.0] * 10
+
+
+def test_struct_saturates():
+    MockSimulator.setup()
+    struct = Struct([DataType.S1615, DataType.S1615])
+    ranged = RangedList(3, 1e6)
+    ranged[2] = -1e6
+
+    # Single values, lists and ranges all saturate in the same way
+    data = struct.get_array([1e6, [1e6, -1e6, 1.5]], array_size=3)
+    assert list(data["f0"]) == [0x7FFFFFFF] * 3
+    assert list(data["f1"]) == [0x7FFFFFFF, -0x80000000, 49152]
+    data = struct.get_array([ranged, -1e6], array_size=3)
+    assert list(data["f0"]) == [0x7FFFFFFF] * 2 + [-0x80000000]
+    assert list(data["f1"]) == [-0x80000000] * 3
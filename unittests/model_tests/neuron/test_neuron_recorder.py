@@ -1,6 +1,9 @@
+import numpy
 from pacman.model.graphs.common import Slice
 from spinn_front_end_common.utilities import globals_variables
-from spynnaker.pyNN.models.common import NeuronRecorder
+from spinn_storage_handlers import BufferedBytearrayDataStorage
+from spynnaker.pyNN.models.common import (
+    NeuronRecorder, RecordingExtractionScheduler, recording_utils)
 from spynnaker.pyNN.utilities.spynnaker_failed_state \
     import SpynnakerFailedState
 
@@ -28,3 +31,297 @@ def test_simple_record():
     assert (gps[1].get_value() == 1)
     # 4 n_neurons second (index "5") is v
     assert (gps[5].get_value() == _slice.n_atoms)
+
+
+def _local_indexes(indexes, lo_atom, n_atoms, n_recording):
+    """ The local indexes as a list membership scan finds them
+    """
+    local_index = 0
+    local_indexes = list()
+    for index in range(lo_atom, lo_atom + n_atoms):
+        if index in indexes:
+            local_indexes.append(local_index)
+            local_index += 1
+        else:
+            local_indexes.append(n_recording)
+    return local_indexes
+
+
+def test_record_indexes():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+
+    nr = NeuronRecorder(["spikes", "v"], 100)
+    nr.set_recording("v", True, indexes=[70, 3, 5, 3, 40, 41, 150])
+    nr.set_recording("v", True, indexes=range(60, 65))
+    indexes = [3, 5, 40, 41, 60, 61, 62, 63, 64, 70]
+    first = Slice(0, 49)
+    second = Slice(50, 99)
+    assert nr._count_recording_per_slice("v", first) == 4
+    assert nr._count_recording_per_slice("v", second) == 6
+    assert list(nr._neurons_recording("v", second)) == indexes[4:]
+
+    # The index parameters give each neuron its place among those recording
+    params = nr.get_index_parameters(first)
+    assert params[1].get_value() == _local_indexes(indexes, 0, 50, 4)
+
+    # Turning off some neurons leaves the others recording
+    nr.set_recording("v", False, indexes=[5, 60, 99])
+    assert list(nr._neurons_recording("v", first)) == [3, 40, 41]
+    assert list(nr._neurons_recording("v", second)) == [61, 62, 63, 64, 70]
+
+    # Turning off all the neurons that are left stops the recording
+    nr.set_recording("v", False, indexes=range(100))
+    assert not nr.is_recording("v")
+    assert nr._count_recording_per_slice("v", first) == 0
+
+
+def test_record_half_of_neurons():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+
+    nr = NeuronRecorder(["spikes", "v"], 1000)
+    nr.set_recording("spikes", True, indexes=range(0, 1000, 2))
+    nr.set_recording("spikes", False, indexes=range(0, 1000, 4))
+    indexes = list(range(2, 1000, 4))
+    vertex_slice = Slice(256, 511)
+    n_recording = nr._count_recording_per_slice("spikes", vertex_slice)
+    assert n_recording == 64
+    assert list(nr._neurons_recording("spikes", vertex_slice)) == [
+        index for index in indexes if 256 <= index <= 511]
+    params = nr.get_index_parameters(vertex_slice)
+    assert params[0].get_value() == _local_indexes(
+        indexes, 256, 256, n_recording)
+
+
+class _MockPlacement(object):
+    def __init__(self, vertex):
+        self.x = 0
+        self.y = 0
+        self.p = vertex
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return _MockPlacement(vertex)
+
+
+class _MockGraphMapper(object):
+    def __init__(self, slices):
+        self._slices = slices
+
+    def get_machine_vertices(self, application_vertex):
+        return list(range(len(self._slices)))
+
+    def get_slice(self, vertex):
+        return self._slices[vertex]
+
+
+class _MockData(object):
+    def __init__(self, data):
+        self._data = bytearray(data.astype("<i4").tobytes())
+        self._read_pointer = 0
+
+    def read_all(self):
+        return self._data
+
+    def seek_read(self, offset):
+        self._read_pointer = offset
+
+    def read(self, data_size):
+        start = self._read_pointer
+        self._read_pointer = min(start + data_size, len(self._data))
+        return self._data[start:self._read_pointer]
+
+
+class _MockBufferManager(object):
+    def __init__(self, records, missing):
+        self._records = records
+        self._missing = missing
+
+    def get_data_for_vertex(self, placement, region):
+        return (_MockData(self._records[placement.p]),
+                placement.p in self._missing)
+
+
+def _record(times, values):
+    return numpy.column_stack((times, values * 32768))
+
+
+def test_get_matrix_data():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+
+    nr = NeuronRecorder(["spikes", "v"], 30)
+    nr.set_recording("v", True, sampling_interval=2.0,
+                     indexes=[0, 5, 9, 12, 25, 26, 27])
+    slices = [Slice(0, 9), Slice(10, 19), Slice(20, 29)]
+
+    # The second vertex is missing the timesteps 2 and 6 of 0 to 8
+    times = numpy.arange(0, 10, 2)
+    first = numpy.arange(15).reshape(5, 3)
+    second = numpy.arange(5).reshape(5, 1) + 100
+    third = numpy.arange(15).reshape(5, 3) + 200
+    records = [
+        _record(times, first),
+        _record(times[[0, 2, 4]], second[[0, 2, 4]]),
+        _record(times, third)]
+    data, indexes, interval = nr.get_matrix_data(
+        "test", _MockBufferManager(records, [1]), 0, _MockPlacements(),
+        _MockGraphMapper(slices), None, "v", 10)
+
+    assert list(indexes) == [0, 5, 9, 12, 25, 26, 27]
+    assert interval == 2.0
+    assert data.shape == (5, 7)
+    assert numpy.array_equal(data[:, 0:3], first)
+    assert numpy.array_equal(data[[0, 2, 4], 3], [100, 102, 104])
+    assert numpy.all(numpy.isnan(data[[1, 3], 3]))
+    assert numpy.array_equal(data[:, 4:7], third)
+
+    # Reading a few rows at a time gives the same data in chunks
+    chunks, chunk_indexes, interval = nr.iter_matrix_data(
+        "test", _MockBufferManager(records, [1]), 0, _MockPlacements(),
+        _MockGraphMapper(slices), None, "v", 10, 2)
+    chunks = list(chunks)
+    assert list(chunk_indexes) == list(indexes)
+    assert interval == 2.0
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    numpy.testing.assert_array_equal(numpy.concatenate(chunks), data)
+
+
+def _unpack_spikes(words):
+    """ The set bits as unpacking all the bits finds them
+    """
+    bits = numpy.fliplr(numpy.unpackbits(
+        words.astype(">u4").view("uint8")).reshape((-1, 32))).reshape(
+            (len(words), -1))
+    return numpy.nonzero(bits)
+
+
+def test_find_set_bits():
+    words = numpy.random.RandomState(2).randint(
+        0, 2 ** 32, size=(50, 9), dtype="int64").astype("uint32")
+    words[words % 3 == 0] = 0
+    words[10] = 0
+    rows, items = recording_utils.find_set_bits(words)
+    expected_rows, expected_items = _unpack_spikes(words)
+    assert numpy.array_equal(rows, expected_rows)
+    assert numpy.array_equal(items, expected_items)
+
+    rows, items = recording_utils.find_set_bits(numpy.zeros((5, 3), "uint32"))
+    assert len(rows) == 0 and len(items) == 0
+
+
+def test_get_spikes():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+
+    nr = NeuronRecorder(["spikes", "v"], 100)
+    nr.set_recording("spikes", True, indexes=[1, 2, 40, 60, 61, 90])
+    slices = [Slice(0, 49), Slice(50, 99)]
+
+    # The last position of each record is the overflow, which is discarded
+    first = numpy.array([[0, 0b1011], [1, 0b10100], [2, 0]])
+    second = numpy.array([[0, 0b11], [1, 0b1100], [2, 0b101]])
+    spikes = nr.get_spikes(
+        "test", _MockBufferManager([first, second], []), 0,
+        _MockPlacements(), _MockGraphMapper(slices), None, 1000)
+    assert spikes.tolist() == [
+        [1, 0.0], [2, 0.0], [40, 1.0], [60, 0.0], [60, 2.0], [61, 0.0],
+        [90, 1.0], [90, 2.0]]
+
+    # The same spikes can be got as timesteps, as integers throughout
+    spike_ticks = nr.get_spike_ticks(
+        "test", _MockBufferManager([first, second], []), 0,
+        _MockPlacements(), _MockGraphMapper(slices), None)
+    assert spike_ticks.dtype == "uint32"
+    assert numpy.array_equal(spike_ticks, spikes)
+
+    # Decoding in worker processes gives the same spikes
+    parallel = NeuronRecorder(
+        ["spikes", "v"], 100, RecordingExtractionScheduler(2, 8))
+    parallel.set_recording("spikes", True, indexes=[1, 2, 40, 60, 61, 90])
+    assert numpy.array_equal(spikes, parallel.get_spikes(
+        "test", _MockBufferManager([first, second], []), 0,
+        _MockPlacements(), _MockGraphMapper(slices), None, 1000))
+
+    # The columns of each vertex together are sorted by neuron and timestep
+    columns = list(nr.iter_spike_columns(
+        "test", _MockBufferManager([first, second], []), 0,
+        _MockPlacements(), _MockGraphMapper(slices), None))
+    assert len(columns) == 2
+    ids = numpy.concatenate([vertex_ids for vertex_ids, _ in columns])
+    ticks = numpy.concatenate([vertex_ticks for _, vertex_ticks in columns])
+    assert ids.dtype == "uint32" and ticks.dtype == "uint32"
+    assert numpy.array_equal(numpy.column_stack((ids, ticks)), spikes)
+
+    # Windows of two timesteps give the spikes of each window
+    chunks = list(nr.iter_spikes(
+        "test", _MockBufferManager([first, second], []), 0,
+        _MockPlacements(), _MockGraphMapper(slices), None, 1000, 2))
+    assert [chunk.tolist() for chunk in chunks] == [
+        [[1, 0.0], [2, 0.0], [40, 1.0], [60, 0.0], [61, 0.0], [90, 1.0]],
+        [[60, 2.0], [90, 2.0]]]
+
+
+class _StoredBufferManager(object):
+    """ A buffer manager whose stored data of each core grows as it is\
+        added, as when a simulation is run again
+    """
+    def __init__(self, n_cores):
+        self.reset(n_cores)
+
+    def reset(self, n_cores):
+        self.storage = [BufferedBytearrayDataStorage() for _ in range(n_cores)]
+
+    def add(self, p, records):
+        self.storage[p].write(bytearray(records.astype("<u4").tobytes()))
+
+    def get_data_for_vertex(self, placement, region):
+        return (self.storage[placement.p], False)
+
+
+def test_get_spikes_incrementally(monkeypatch):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+
+    nr = NeuronRecorder(["spikes", "v"], 100)
+    nr.set_recording("spikes", True, indexes=[1, 2, 40, 60, 61, 90])
+    slices = [Slice(0, 49), Slice(50, 99)]
+    first = numpy.array([[0, 0b1011], [1, 0b10100], [2, 0]])
+    second = numpy.array([[0, 0b11], [1, 0b1100], [2, 0b101]])
+
+    n_decoded = list()
+    decode = NeuronRecorder._decode_spikes
+
+    def counting_decode(self, records, vertex_slice):
+        n_decoded.append(len(records))
+        return decode(self, records, vertex_slice)
+    monkeypatch.setattr(NeuronRecorder, "_decode_spikes", counting_decode)
+
+    def get_spikes():
+        return nr.get_spikes(
+            "test", buffer_manager, 0, _MockPlacements(),
+            _MockGraphMapper(slices), None, 1000).tolist()
+
+    # The second run adds the rest of the records, the last cut short
+    buffer_manager = _StoredBufferManager(2)
+    buffer_manager.add(0, first[:2])
+    buffer_manager.add(1, second[:1])
+    assert get_spikes() == [
+        [1, 0.0], [2, 0.0], [40, 1.0], [60, 0.0], [61, 0.0]]
+    buffer_manager.add(0, first[2:])
+    buffer_manager.add(1, second[1:])
+    buffer_manager.add(1, numpy.array([3]))
+    assert get_spikes() == [
+        [1, 0.0], [2, 0.0], [40, 1.0], [60, 0.0], [60, 2.0], [61, 0.0],
+        [90, 1.0], [90, 2.0]]
+
+    # Only the records added by each run were decoded
+    assert n_decoded == [2, 1, 1, 2]
+
+    # After a reset only the new data is read
+    nr.reset_extraction_cursors()
+    buffer_manager.reset(2)
+    buffer_manager.add(0, first[:1])
+    assert get_spikes() == [[1, 0.0], [2, 0.0]]
@@ -0,0 +1,59 @@
+import os
+import numpy
+import pytest
+
+from spynnaker.pyNN.models.common import RecordingExtractionScheduler
+
+
+class _Unpicklable(object):
+
+    def __init__(self, scale):
+        self._scale = scale
+
+    def __reduce__(self):
+        raise TypeError("Can't be pickled")
+
+    def decode(self, data):
+        values = numpy.frombuffer(data, dtype="uint8").astype("int")
+        return values * self._scale, os.getpid()
+
+
+def _jobs(n_jobs, read):
+    for i in range(n_jobs):
+        read.append(i)
+        data = bytearray(range(i + 1))
+        yield (len(data), _Unpicklable(i).decode, (data, ))
+
+
+@pytest.mark.parametrize("n_processes", [1, 2, 4, None])
+@pytest.mark.parametrize("max_bytes_in_flight", [None, 1, 50])
+def test_results_in_order(n_processes, max_bytes_in_flight):
+    # The jobs refer to objects that can't be pickled, as recorders might
+    scheduler = RecordingExtractionScheduler(
+        n_processes, max_bytes_in_flight)
+    read = list()
+    results = list(scheduler.run(_jobs(20, read)))
+    assert len(results) == 20
+    for i, (values, _) in enumerate(results):
+        assert numpy.array_equal(values, numpy.arange(i + 1) * i)
+    if n_processes == 1:
+        assert all(pid == os.getpid() for _, pid in results)
+
+
+def test_bytes_in_flight():
+    # No more jobs are read than fit in the bytes in flight, and the one that
+    # didn't fit, which is decoded next
+    scheduler = RecordingExtractionScheduler(2, 10)
+    read = list()
+    results = scheduler.run(_jobs(20, read))
+    next(results)
+    assert read == [0, 1, 2, 3, 4]
+    for _ in range(3):
+        next(results)
+    assert read == [0, 1, 2, 3, 4]
+    next(results)
+    assert read == [0, 1, 2, 3, 4, 5]
+
+
+def test_no_jobs():
+    assert list(RecordingExtractionScheduler(4).run(iter([]))) == []
@@ -0,0 +1,195 @@
+import struct
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spinn_storage_handlers import BufferedBytearrayDataStorage
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
+from spynnaker.pyNN.models.common import (
+    EIEIOSpikeRecorder, MultiSpikeRecorder, recording_utils)
+
+
+def test_offsets_in_groups():
+    assert list(recording_utils.offsets_in_groups([2, 0, 3])) == [
+        0, 1, 0, 1, 2]
+    assert len(recording_utils.offsets_in_groups([])) == 0
+
+
+def test_sort_spike_ticks():
+    spikes = recording_utils.sort_spike_ticks(
+        numpy.array([3, 1, 3, 2 ** 32 - 1], dtype="uint32"),
+        numpy.array([5, 9, 1, 2 ** 32 - 1], dtype="uint32"))
+    assert spikes.dtype == "uint32"
+    assert spikes.tolist() == [[1, 9], [3, 1], [3, 5], [2 ** 32 - 1] * 2]
+    assert recording_utils.sort_spike_ticks([], []).shape == (0, 2)
+
+    # Times in milliseconds are made only from the timesteps
+    assert recording_utils.spike_ticks_to_ms(spikes[:3], 100).tolist() == [
+        [1, 9 * 0.1], [3, 1 * 0.1], [3, 5 * 0.1]]
+
+
+def _multi_spike_data(rng, n_words, n_records):
+    """ Records of a time, a number of blocks and the blocks of spikes,\
+        with the spikes expected from them found bit by bit
+    """
+    data = bytearray()
+    expected = list()
+    for time in range(n_records):
+        n_blocks = rng.randint(0, 4)
+        blocks = rng.randint(0, 2 ** 32, size=(n_blocks, n_words),
+                             dtype="int64").astype("<u4")
+        blocks[rng.uniform(size=blocks.shape) < 0.5] = 0
+        data += struct.pack("<II", time, n_blocks) + blocks.tobytes()
+        for block in blocks:
+            for word, value in enumerate(block):
+                for bit in range(32):
+                    if value & (1 << bit):
+                        expected.append((word * 32 + bit + 10, time))
+    return data, expected
+
+
+def test_multi_spike_decode():
+    rng = numpy.random.RandomState(0)
+    data, expected = _multi_spike_data(rng, 3, 50)
+
+    # A record cut short at the end is ignored
+    data += struct.pack("<II", 50, 2) + bytearray(4)
+    spike_ids = list()
+    spike_ticks = list()
+    MultiSpikeRecorder._process_spike_data(
+        Slice(10, 100), 3, data, spike_ids, spike_ticks)
+    assert spike_ids[0].dtype == "uint32" and spike_ticks[0].dtype == "uint32"
+    spikes = list(zip(numpy.concatenate(spike_ids),
+                      numpy.concatenate(spike_ticks)))
+    assert sorted(spikes) == sorted(expected)
+
+    spike_ids = list()
+    MultiSpikeRecorder._process_spike_data(
+        Slice(10, 100), 3, bytearray(), spike_ids, [])
+    assert spike_ids == []
+
+
+def _eieio_packet(time, keys, eieio_type, prefix=None):
+    header = EIEIODataHeader(eieio_type, prefix=prefix, count=len(keys))
+    key_bytes = numpy.array(keys, dtype="<u{}".format(
+        eieio_type.key_bytes)).tobytes()
+    return struct.pack(
+        "<II", len(header.bytestring) + len(key_bytes), time) + \
+        header.bytestring + key_bytes
+
+
+@pytest.mark.parametrize("eieio_type, prefix", [
+    (EIEIOType.KEY_32_BIT, None), (EIEIOType.KEY_16_BIT, None),
+    (EIEIOType.KEY_16_BIT, 3)])
+def test_eieio_decode(eieio_type, prefix):
+    base_key = 0x100
+    data = bytearray()
+    expected = list()
+    for time, keys in enumerate([[1, 5, 2], [], [7], [0, 3, 4, 9, 8]]):
+        data += _eieio_packet(
+            time, [base_key + key for key in keys], eieio_type, prefix)
+        expected.extend((key + 20, time) for key in keys)
+
+    # A packet cut short at the end is ignored
+    data += _eieio_packet(9, [base_key], eieio_type, prefix)[:-1]
+    results = list()
+    EIEIOSpikeRecorder._process_spike_data(
+        Slice(20, 40), data, base_key, results)
+    assert len(results) == 1
+    assert results[0].dtype == "uint32"
+    assert sorted(map(tuple, results[0].tolist())) == sorted(expected)
+
+
+def test_eieio_payloads_rejected():
+    data = _eieio_packet(0, [1, 2], EIEIOType.KEY_PAYLOAD_32_BIT)
+    with pytest.raises(Exception):
+        EIEIOSpikeRecorder._process_spike_data(
+            Slice(0, 10), data, 0, [])
+
+
+class _MockPlacement(object):
+    def __init__(self, vertex):
+        self.x = 0
+        self.y = 0
+        self.p = vertex
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return _MockPlacement(vertex)
+
+
+class _MockGraphMapper(object):
+    def __init__(self, vertex_slice):
+        self._slice = vertex_slice
+
+    def get_machine_vertices(self, application_vertex):
+        return [0]
+
+    def get_slice(self, vertex):
+        return self._slice
+
+
+class _MockBufferManager(object):
+    def __init__(self):
+        self.storage = BufferedBytearrayDataStorage()
+
+    def get_data_for_vertex(self, placement, region):
+        return (self.storage, False)
+
+
+def _spike_list(spikes):
+    return sorted(map(tuple, spikes.tolist()))
+
+
+def test_get_spikes_incrementally():
+    rng = numpy.random.RandomState(1)
+    data, expected = _multi_spike_data(rng, 3, 20)
+    buffer_manager = _MockBufferManager()
+    recorder = MultiSpikeRecorder()
+
+    def get_multi_spikes():
+        return _spike_list(recorder.get_spikes(
+            "test", buffer_manager, 0, _MockPlacements(),
+            _MockGraphMapper(Slice(10, 100)), None, 100))
+
+    # Each run adds more records, the last of the first run cut short
+    buffer_manager.storage.write(data[:len(data) // 2])
+    first_spikes = get_multi_spikes()
+    assert len(first_spikes) < len(expected)
+    buffer_manager.storage.write(data[len(data) // 2:])
+    assert get_multi_spikes() == sorted(
+        (spike_id, tick * 0.1) for spike_id, tick in expected)
+
+    # Resetting decodes all the data again
+    recorder.reset_extraction_cursors()
+    assert recorder.get_spike_ticks(
+        "test", buffer_manager, 0, _MockPlacements(),
+        _MockGraphMapper(Slice(10, 100)), None).tolist() == sorted(
+            list(spike) for spike in expected)
+
+    buffer_manager = _MockBufferManager()
+    recorder = EIEIOSpikeRecorder()
+    packets = [
+        _eieio_packet(time, [0x100 + key for key in keys],
+                      EIEIOType.KEY_32_BIT)
+        for time, keys in enumerate([[1, 5], [2], [0, 3]])]
+
+    def get_eieio_spikes():
+        return _spike_list(recorder.get_spikes(
+            "test", buffer_manager, 0, _MockPlacements(),
+            _MockGraphMapper(Slice(20, 40)), None, lambda _: 0x100, 1000))
+
+    buffer_manager.storage.write(bytearray(packets[0] + packets[1][:-2]))
+    assert get_eieio_spikes() == [(21, 0.0), (25, 0.0)]
+    buffer_manager.storage.write(bytearray(packets[1][-2:] + packets[2]))
+    assert get_eieio_spikes() == [
+        (20, 2.0), (21, 0.0), (22, 1.0), (23, 2.0), (25, 0.0)]
+
+    # The spikes can be got as timesteps without converting to times
+    spike_ticks = recorder.get_spike_ticks(
+        "test", buffer_manager, 0, _MockPlacements(),
+        _MockGraphMapper(Slice(20, 40)), None, lambda _: 0x100)
+    assert spike_ticks.dtype == "uint32"
+    assert spike_ticks.tolist() == [
+        [20, 2], [21, 0], [22, 1], [23, 2], [25, 0]]
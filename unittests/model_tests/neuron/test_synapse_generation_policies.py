@@ -0,0 +1,126 @@
+import os
+import tempfile
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neuron.synapse_generation_policies import \
+    SynapseGenerationCosts, SynapseGenerationEstimate, \
+    SynapseGenerationPolicyCostModel, SynapseGenerationPolicyOnHost, \
+    SynapseGenerationPolicyOnMachine
+
+_SLICE = Slice(0, 99)
+
+_COSTS = SynapseGenerationCosts(
+    host_seconds_per_synapse=1e-6, load_seconds_per_byte=1e-6,
+    expander_seconds_per_synapse=1e-8, expander_seconds_per_core=0.01)
+
+
+def _estimate(n_synapses):
+    return SynapseGenerationEstimate(
+        "block of {}".format(n_synapses), n_synapses, n_synapses * 4, 100)
+
+
+def test_fixed_policies():
+    estimates = [_estimate(10), _estimate(100000)]
+    assert SynapseGenerationPolicyOnMachine().choose_on_machine(
+        _SLICE, estimates) == [True, True]
+    assert SynapseGenerationPolicyOnHost().choose_on_machine(
+        _SLICE, estimates) == [False, False]
+
+    # Only the cost model uses the time taken on host
+    assert not SynapseGenerationPolicyOnMachine().records_host_generation
+    assert not SynapseGenerationPolicyOnHost().records_host_generation
+    assert SynapseGenerationPolicyCostModel(
+        costs=_COSTS).records_host_generation
+
+
+def test_cost_model_per_block():
+    policy = SynapseGenerationPolicyCostModel(costs=_COSTS)
+
+    # A tiny block costs more to load than to make on host
+    assert policy.choose_on_machine(
+        _SLICE, [_estimate(10), _estimate(100000)]) == [False, True]
+
+    # Small blocks don't save enough to be worth running the expander
+    assert policy.choose_on_machine(
+        _SLICE, [_estimate(1000), _estimate(1000)]) == [False, False]
+
+
+def test_cost_model_per_vertex():
+    policy = SynapseGenerationPolicyCostModel(costs=_COSTS, per_vertex=True)
+    assert policy.choose_on_machine(
+        _SLICE, [_estimate(10), _estimate(100000)]) == [True, True]
+    assert policy.choose_on_machine(
+        _SLICE, [_estimate(10), _estimate(10)]) == [False, False]
+
+
+def test_host_processes():
+    estimate = _estimate(1000)
+    serial = SynapseGenerationPolicyCostModel(costs=_COSTS)
+    parallel = SynapseGenerationPolicyCostModel(
+        costs=_COSTS, n_host_processes=4)
+    assert parallel.host_seconds(estimate) < serial.host_seconds(estimate)
+
+
+def test_calibration_from_previous_runs():
+    costs_file = os.path.join(tempfile.mkdtemp(), "costs.json")
+
+    # With no file, the default costs are used
+    policy = SynapseGenerationPolicyCostModel(costs_file=costs_file)
+    default = SynapseGenerationCosts()
+    assert (policy.costs.host_seconds_per_synapse ==
+            default.host_seconds_per_synapse)
+    policy.record_host_generation(1000, 0.5)
+    policy.record_host_generation(3000, 1.5)
+    assert policy.costs.host_seconds_per_synapse == 0.5 / 1000
+    policy.save_timings()
+
+    # A later run starts from the timings of the earlier ones, and adds to
+    # them
+    policy = SynapseGenerationPolicyCostModel(costs_file=costs_file)
+    assert policy.costs.host_seconds_per_synapse == 0.5 / 1000
+    assert policy.costs.n_host_synapses_timed == 4000
+    policy.record_host_generation(4000, 0.0)
+    policy.save_timings()
+    costs = SynapseGenerationCosts.read(costs_file)
+    assert costs.n_host_synapses_timed == 8000
+    assert costs.host_seconds_per_synapse == 2.0 / 8000
+
+
+def test_calibration_of_machine_costs():
+    costs_file = os.path.join(tempfile.mkdtemp(), "costs.json")
+    _COSTS.write(costs_file)
+    estimates = [_estimate(100000)]
+    policy = SynapseGenerationPolicyCostModel(costs_file=costs_file)
+    assert policy.choose_on_machine(_SLICE, estimates) == [True]
+
+    # The expander turns out to be much slower than assumed; two runs are
+    # enough to tell the time per synapse from the time per core
+    costs = SynapseGenerationCosts.read(costs_file)
+    costs.add_expander_timings(200000, 10, 200000 * 2e-5 + 10 * 0.5)
+    costs.add_expander_timings(100000, 40, 100000 * 2e-5 + 40 * 0.5)
+    costs.write(costs_file)
+    policy = SynapseGenerationPolicyCostModel(costs_file=costs_file)
+    assert abs(policy.costs.expander_seconds_per_synapse - 2e-5) < 1e-12
+    assert abs(policy.costs.expander_seconds_per_core - 0.5) < 1e-9
+    assert policy.choose_on_machine(_SLICE, estimates) == [False]
+
+    # Loading turns out to be much slower than assumed too, so that loading
+    # the synapses generated on host costs more again
+    costs.add_load_timings(1000, 1.0)
+    costs.write(costs_file)
+    policy = SynapseGenerationPolicyCostModel(costs_file=costs_file)
+    assert policy.costs.load_seconds_per_byte == 1e-3
+    assert policy.choose_on_machine(_SLICE, estimates) == [True]
+
+
+def test_expander_timings_of_one_run():
+    costs = SynapseGenerationCosts(
+        expander_seconds_per_synapse=1e-8, expander_seconds_per_core=0.01)
+
+    # One run can't tell the two costs apart, so both are scaled to fit it
+    costs.add_expander_timings(1000000, 1, 0.04)
+    assert abs(costs.expander_seconds_per_synapse - 2e-8) < 1e-20
+    assert abs(costs.expander_seconds_per_core - 0.02) < 1e-14
+
+    # Runs on no cores are not timed
+    costs.add_expander_timings(0, 0, 1.0)
+    assert len(costs.expander_timings) == 1
@@ -0,0 +1,35 @@
+import os
+import numpy
+import pytest
+
+from spynnaker.pyNN.models.neuron.synapse_generation_scheduler \
+    import SynapseGenerationScheduler
+
+
+class _Unpicklable(object):
+
+    def __init__(self, scale):
+        self._scale = scale
+
+    def __reduce__(self):
+        raise TypeError("Can't be pickled")
+
+    def block(self, lo, hi):
+        return numpy.arange(lo, hi) * self._scale, os.getpid()
+
+
+@pytest.mark.parametrize("n_processes", [1, 2, 4, None])
+def test_results_in_order(n_processes):
+    # The jobs refer to objects that can't be pickled, as connectors might
+    scheduler = SynapseGenerationScheduler(n_processes)
+    jobs = [(_Unpicklable(i).block, (i, i * 2 + 1)) for i in range(20)]
+    results = list(scheduler.run(jobs))
+    assert len(results) == len(jobs)
+    for i, (block, _) in enumerate(results):
+        assert numpy.array_equal(block, numpy.arange(i, i * 2 + 1) * i)
+    if n_processes == 1:
+        assert all(pid == os.getpid() for _, pid in results)
+
+
+def test_no_jobs():
+    assert list(SynapseGenerationScheduler(4).run([])) == []
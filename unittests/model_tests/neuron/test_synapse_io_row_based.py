@@ -1,3 +1,5 @@
+import numpy
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.models.neuron.synapse_dynamics import SynapseDynamicsStatic
 from spynnaker.pyNN.models.neuron.master_pop_table_generators\
     import MasterPopTableAsBinarySearch
@@ -11,6 +13,9 @@ from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence \
 from spynnaker.pyNN.models.neuron.synapse_dynamics import SynapseDynamicsSTDP
 from spynnaker.pyNN.models.neural_projections.synapse_information \
     import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import \
+    FromListConnector
+from unittests.mocks import MockSimulator, MockPopulation
 
 import pytest
 
@@ -48,3 +53,42 @@ def test_get_max_row_length(dynamics, size, exception, max_size):
         actual_size = io._get_max_row_length(
             size, dynamics, population_table, in_edge, size)
         assert actual_size == max_size
+
+
+@pytest.mark.parametrize("dynamics", [
+    SynapseDynamicsStatic(),
+    SynapseDynamicsSTDP(
+        TimingDependenceSpikePair(), WeightDependenceAdditive())])
+def test_compact_synapses(dynamics):
+    MockSimulator.setup()
+    n_atoms = 40
+    sources = numpy.repeat(numpy.arange(n_atoms), n_atoms)
+    targets = numpy.tile(numpy.arange(n_atoms), n_atoms)
+    keep = (sources * 7 + targets * 3) % 5 == 0
+    conn_list = numpy.column_stack((sources[keep], targets[keep]))
+    n_connections = len(conn_list)
+    weights = (numpy.arange(n_connections) % 8) * 0.25
+    delays = (numpy.arange(n_connections) % 40) + 1.0
+
+    pre_vertex_slice = Slice(10, 29)
+    post_vertex_slice = Slice(20, 39)
+    results = list()
+    for compact in (False, True):
+        connector = FromListConnector(conn_list)
+        connector.set_projection_information(
+            MockPopulation(n_atoms, "Pre"), MockPopulation(n_atoms, "Post"),
+            None, 1000)
+        connector.set_weights_and_delays(weights, delays)
+        synapse_info = SynapseInformation(connector, dynamics, 0)
+        results.append(SynapseIORowBased(compact).get_synapses(
+            synapse_info, [pre_vertex_slice], 0, [post_vertex_slice], 0,
+            pre_vertex_slice, post_vertex_slice, 2,
+            MasterPopTableAsBinarySearch(), 2, [256.0, 256.0], 1000,
+            None, None))
+
+    # Both forms make the same rows, including delayed rows
+    standard, compact = results
+    assert len(standard[2]) > 0
+    assert standard[1] == compact[1] and standard[3] == compact[3]
+    for standard_item, compact_item in zip(standard, compact):
+        assert numpy.array_equal(standard_item, compact_item)
@@ -2,6 +2,7 @@ import unittest
 import struct
 import os
 import tempfile
+import numpy
 
 import spinn_utilities.conf_loader as conf_loader
 from spinn_utilities.overrides import overrides
@@ -16,6 +17,7 @@ from pacman.model.routing_info import PartitionRoutingInfo
 from pacman.model.routing_info import BaseKeyAndMask
 from pacman.model.graphs.machine import SimpleMachineVertex
 from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.application import ApplicationGraph
 
 from data_specification \
     import DataSpecificationGenerator, DataSpecificationExecutor
@@ -30,9 +32,10 @@ from spynnaker.pyNN.models.neural_projections \
 from spynnaker.pyNN.models.neural_projections \
     import SynapseInformation
 from spynnaker.pyNN.models.neural_projections.connectors \
-    import OneToOneConnector, AllToAllConnector
+    import OneToOneConnector, AllToAllConnector, FromListConnector
 from spynnaker.pyNN.models.neuron.synapse_dynamics \
     import SynapseDynamicsStatic
+from spynnaker.pyNN.utilities.constants import POPULATION_BASED_REGIONS
 
 from unittests.mocks import MockSimulator
 
@@ -375,6 +378,114 @@ class TestSynapticManager(unittest.TestCase):
         assert all([conn["weight"] == 4.5 for conn in connections_3])
         assert all([conn["delay"] == 4.0 for conn in connections_3])
 
+    def test_write_data_spec_from_list(self):
+        MockSimulator.setup()
+
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+
+        # A connector that can't be generated on the machine is generated
+        # on host whatever the policy
+        for policy in ("OnMachine", "CostModel"):
+            config = conf_loader.load_config(
+                AbstractSpiNNakerCommon.CONFIG_FILE_NAME,
+                default_config_paths)
+            config.set("Simulation", "synapse_generation_policy", policy)
+            self._check_write_data_spec_from_list(config)
+
+    def _check_write_data_spec_from_list(self, config):
+        machine_time_step = 1000.0
+        conn_list = [(0, 1, 1.5, 1.0), (3, 2, 2.5, 2.0), (3, 9, 0.5, 1.0)]
+
+        pre_app_vertex = SimpleApplicationVertex(10)
+        pre_vertex = SimpleMachineVertex(resources=None)
+        vertex_slice = Slice(0, 9)
+        post_app_vertex = SimpleApplicationVertex(10)
+        post_vertex = SimpleMachineVertex(resources=None)
+        connector = FromListConnector(
+            numpy.array([conn[:2] for conn in conn_list]))
+        connector.set_projection_information(
+            pre_app_vertex, post_app_vertex, None, machine_time_step)
+        connector.set_weights_and_delays(
+            [conn[2] for conn in conn_list], [conn[3] for conn in conn_list])
+        synapse_information = SynapseInformation(
+            connector, SynapseDynamicsStatic(), 0)
+        app_edge = ProjectionApplicationEdge(
+            pre_app_vertex, post_app_vertex, synapse_information)
+        machine_edge = ProjectionMachineEdge(
+            app_edge.synapse_information, pre_vertex, post_vertex)
+        partition_name = "TestPartition"
+
+        app_graph = ApplicationGraph("Test")
+        app_graph.add_vertex(pre_app_vertex)
+        app_graph.add_vertex(post_app_vertex)
+        app_graph.add_edge(app_edge, partition_name)
+        graph = MachineGraph("Test")
+        graph.add_vertex(pre_vertex)
+        graph.add_vertex(post_vertex)
+        graph.add_edge(machine_edge, partition_name)
+
+        graph_mapper = GraphMapper()
+        graph_mapper.add_vertex_mapping(
+            pre_vertex, vertex_slice, pre_app_vertex)
+        graph_mapper.add_vertex_mapping(
+            post_vertex, vertex_slice, post_app_vertex)
+        graph_mapper.add_edge_mapping(machine_edge, app_edge)
+
+        key = 0
+        routing_info = RoutingInfo()
+        routing_info.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(key, 0xFFFFFFF0)],
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                pre_vertex, partition_name)))
+        placement = Placement(post_vertex, 0, 0, 1)
+
+        temp_spec = tempfile.mktemp()
+        spec_writer = FileDataWriter(temp_spec)
+        spec = DataSpecificationGenerator(spec_writer, None)
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0,
+            spikes_per_second=100.0, config=config)
+        synaptic_manager.write_data_spec(
+            spec, post_app_vertex, vertex_slice, post_vertex, placement,
+            graph, app_graph, routing_info, graph_mapper, 1.0,
+            machine_time_step, None)
+        spec.end_specification()
+        spec_writer.close()
+
+        spec_reader = FileDataReader(temp_spec)
+        executor = DataSpecificationExecutor(spec_reader, 20000)
+        executor.execute()
+        master_pop_table = executor.get_region(
+            POPULATION_BASED_REGIONS.POPULATION_TABLE.value)
+        synaptic_matrix = executor.get_region(
+            POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX.value)
+        all_data = bytearray()
+        all_data.extend(master_pop_table.region_data[
+            :master_pop_table.max_write_pointer])
+        all_data.extend(synaptic_matrix.region_data[
+            :synaptic_matrix.max_write_pointer])
+        synaptic_matrix_address = master_pop_table.max_write_pointer
+        transceiver = MockTransceiverRawData(all_data)
+
+        data, row_len = synaptic_manager._retrieve_synaptic_block(
+            transceiver=transceiver, placement=placement,
+            master_pop_table_address=0,
+            indirect_synapses_address=synaptic_matrix_address,
+            direct_synapses_address=0, key=key,
+            n_rows=vertex_slice.n_atoms, index=0,
+            using_extra_monitor_cores=False)
+        connections = synaptic_manager._synapse_io.read_synapses(
+            synapse_information, vertex_slice, vertex_slice, row_len, 0, 2,
+            synaptic_manager._weight_scales[placement], data, None,
+            app_edge.n_delay_stages, machine_time_step)
+
+        # The connections in the list are the ones written
+        assert sorted(
+            (int(conn["source"]), int(conn["target"]), conn["weight"],
+             conn["delay"]) for conn in connections) == conn_list
+
 
 if __name__ == "__main__":
     unittest.main()
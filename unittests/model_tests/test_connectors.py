@@ -1,12 +1,19 @@
 from __future__ import print_function
 from pacman.model.graphs.common.slice import Slice
+import csa
 import numpy
+import os
 import pytest
 import functools
 from spynnaker.pyNN.models.neural_projections.connectors \
     import FixedNumberPreConnector, FixedNumberPostConnector, \
-    FixedProbabilityConnector, IndexBasedProbabilityConnector
-from unittests.mocks import MockSimulator, MockPopulation
+    FixedProbabilityConnector, IndexBasedProbabilityConnector, \
+    CSAConnector, AllToAllConnector, OneToOneConnector, MultapseConnector, \
+    DistanceDependentProbabilityConnector, SmallWorldConnector
+from spynnaker.pyNN.models.neural_projections.connectors import \
+    small_world_connector
+from spynnaker.pyNN.utilities.utility_calls import run_in_forked_pool
+from unittests.mocks import MockSimulator, MockPopulation, MockSpace
 
 
 @pytest.fixture(scope="module", params=[10, 100])
@@ -31,6 +38,8 @@ def n_in_slice(request):
         functools.partial(FixedNumberPostConnector, 1),
         functools.partial(FixedNumberPreConnector, 2),
         functools.partial(FixedNumberPostConnector, 2),
+        functools.partial(FixedNumberPreConnector, 8),
+        functools.partial(FixedNumberPostConnector, 8),
         functools.partial(FixedNumberPreConnector, 5, with_replacement=True),
         functools.partial(FixedNumberPostConnector, 5, with_replacement=True),
         functools.partial(FixedNumberPreConnector, 20, with_replacement=True),
@@ -38,19 +47,25 @@ def n_in_slice(request):
         functools.partial(FixedProbabilityConnector, 0.1),
         functools.partial(FixedProbabilityConnector, 0.5),
         functools.partial(IndexBasedProbabilityConnector,
-                          "1 / sqrt(((i + 1) ** 2) + ((j + 1) ** 2))")],
+                          "1 / sqrt(((i + 1) ** 2) + ((j + 1) ** 2))"),
+        functools.partial(IndexBasedProbabilityConnector,
+                          lambda i, j: 1 / numpy.sqrt(
+                              ((i + 1) ** 2) + ((j + 1) ** 2)))],
     ids=[
         "FixedNumberPreConnector1-",
         "FixedNumberPostConnector1-",
         "FixedNumberPreConnector2-",
         "FixedNumberPostConnector2-",
+        "FixedNumberPreConnector8-",
+        "FixedNumberPostConnector8-",
         "FixedNumberPreConnector5Replace-",
         "FixedNumberPostConnector5Replace-",
         "FixedNumberPreConnector20Replace-",
         "FixedNumberPostConnector20Replace-",
         "FixedProbabilityConnector0.1-",
         "FixedProbabilityConnector0.5-",
-        "IndexBasedProbabilityConnector"]
+        "IndexBasedProbabilityConnector",
+        "IndexBasedProbabilityConnectorCallable"]
     )
 def create_connector(request):
     return request.param
@@ -147,3 +162,203 @@ def test_connectors(
             raise
     print(connector, n_pre, n_post, n_in_slice, max_row_length,
           max_source, max_col_length, max_target)
+
+
+def test_connectors_block_order(n_pre, n_post, n_in_slice, create_connector):
+
+    MockSimulator.setup()
+
+    pre_slices = [
+        Slice(i, i + n_in_slice - 1) for i in range(0, n_pre, n_in_slice)]
+    post_slices = [
+        Slice(i, i + n_in_slice - 1) for i in range(0, n_post, n_in_slice)]
+    pairs = [(pre_slice_index, post_slice_index)
+             for pre_slice_index in range(len(pre_slices))
+             for post_slice_index in range(len(post_slices))]
+
+    # Blocks made in any order from the same seed should be the same
+    blocks = list()
+    for order in (pairs, list(reversed(pairs))):
+        numpy.random.seed(1)
+        connector = create_connector()
+        connector.set_projection_information(
+            pre_population=MockPopulation(n_pre, "Pre"),
+            post_population=MockPopulation(n_post, "Post"),
+            rng=None, machine_time_step=1000)
+        connector.set_weights_and_delays(5, 5)
+        blocks.append({
+            (pre_slice_index, post_slice_index):
+                connector.create_synaptic_block(
+                    pre_slices, pre_slice_index, post_slices,
+                    post_slice_index, pre_slices[pre_slice_index],
+                    post_slices[post_slice_index], 0)
+            for pre_slice_index, post_slice_index in order})
+
+    for pair in pairs:
+        assert numpy.array_equal(blocks[0][pair], blocks[1][pair])
+
+
+class _MultapseConnector(MultapseConnector):
+    __slots__ = []
+
+    def get_rng_next(self, num_synapses, prob_connect):
+        return numpy.random.multinomial(num_synapses, prob_connect)
+
+
+@pytest.mark.parametrize("create_connector", [
+    AllToAllConnector,
+    functools.partial(AllToAllConnector, allow_self_connections=False),
+    functools.partial(FixedProbabilityConnector, 0.5),
+    functools.partial(FixedNumberPreConnector, 3),
+    functools.partial(FixedNumberPostConnector, 3),
+    functools.partial(OneToOneConnector, None),
+    functools.partial(_MultapseConnector, 50, allow_self_connections=False)])
+def test_compact_blocks(create_connector):
+    MockSimulator.setup()
+    population = MockPopulation(20, "Pop")
+    slices = [Slice(0, 9), Slice(10, 19)]
+
+    # Blocks made compact directly are the same as compacted blocks
+    blocks = list()
+    for compact in (False, True):
+        numpy.random.seed(1)
+        connector = create_connector()
+        connector.set_projection_information(
+            pre_population=population, post_population=population,
+            rng=None, machine_time_step=1000)
+        connector.set_weights_and_delays(1.5, 2.6)
+        if compact:
+            blocks.append(connector.create_compact_synaptic_block(
+                slices, 1, slices, 1, slices[1], slices[1], 0, 1000))
+        else:
+            blocks.append(connector.compact_synaptic_block(
+                connector.create_synaptic_block(
+                    slices, 1, slices, 1, slices[1], slices[1], 0),
+                slices[1], 1000))
+    assert connector.is_compact_synaptic_block(blocks[1])
+    assert len(blocks[1]) > 0
+    assert numpy.array_equal(blocks[0], blocks[1])
+
+
+def _create_block(connector, slices, pre_slice_index, post_slice_index):
+    state = connector.get_generation_state()
+    connector.create_synaptic_block(
+        slices, pre_slice_index, slices, post_slice_index,
+        slices[pre_slice_index], slices[post_slice_index], 0)
+    return os.getpid(), connector.get_generation_state_added(state)
+
+
+@pytest.mark.parametrize("n_processes", [1, 4])
+def test_generation_state_of_blocks_in_processes(n_processes):
+    MockSimulator.setup()
+    connector = CSAConnector(csa.full, retain_connection_set=True)
+    connector.set_projection_information(
+        pre_population=MockPopulation(20, "Pre"),
+        post_population=MockPopulation(20, "Post"),
+        rng=None, machine_time_step=1000)
+    connector.set_weights_and_delays(1.0, 0.5)
+    slices = [Slice(i, i + 4) for i in range(0, 20, 5)]
+    jobs = [(_create_block, (connector, slices, i, j))
+            for i in range(len(slices)) for j in range(len(slices))]
+
+    # What blocks created in other processes add is added here, so the
+    # connector ends as if all the blocks were created here
+    for pid, added in run_in_forked_pool(jobs, n_processes, "testing"):
+        if pid != os.getpid():
+            connector.add_generation_state(added)
+    assert connector.get_provenance_data()[0].value == 400
+    assert sorted(connector._full_connection_set) == [
+        (i, j) for i in range(20) for j in range(20)]
+
+
+def _set_up(connector, n_neurons, weights, delays):
+    connector.set_space(MockSpace())
+    connector.set_projection_information(
+        pre_population=MockPopulation(n_neurons, "Pre"),
+        post_population=MockPopulation(n_neurons, "Post"),
+        rng=None, machine_time_step=1000)
+    connector.set_weights_and_delays(weights, delays)
+
+
+@pytest.mark.parametrize("create_connector", [
+    AllToAllConnector, functools.partial(OneToOneConnector, None)])
+def test_distance_values(create_connector):
+    MockSimulator.setup()
+    connector = create_connector()
+    _set_up(connector, 20, "0.5 + (d * 0.25)", "1.0 + d")
+    slices = [Slice(0, 9), Slice(10, 19)]
+    for pre_slice_index, post_slice_index in [(0, 0), (1, 0), (1, 1)]:
+        block = connector.create_synaptic_block(
+            slices, pre_slice_index, slices, post_slice_index,
+            slices[pre_slice_index], slices[post_slice_index], 0)
+
+        # The neurons are one unit apart in a line
+        d = numpy.abs(block["source"] - block["target"].astype("int64"))
+        assert numpy.allclose(block["weight"], 0.5 + d * 0.25)
+        assert numpy.allclose(block["delay"], 1.0 + d)
+
+
+def test_distance_dependent_probability():
+    MockSimulator.setup()
+
+    # The connector is made before the positions of the neurons are known
+    connector = DistanceDependentProbabilityConnector("d < 1.5")
+    _set_up(connector, 20, 1.0, 1.0)
+    slices = [Slice(0, 9), Slice(10, 19)]
+    connector.prepare_synaptic_blocks(slices, slices)
+    assert connector.get_n_connections_to_post_vertex_maximum() >= 3
+    pairs = list()
+    for pre_slice_index in range(2):
+        for post_slice_index in range(2):
+            block = connector.create_synaptic_block(
+                slices, pre_slice_index, slices, post_slice_index,
+                slices[pre_slice_index], slices[post_slice_index], 0)
+            pairs.extend(zip(block["source"], block["target"]))
+    assert sorted(pairs) == [
+        (i, j) for i in range(20) for j in range(20) if abs(i - j) <= 1]
+
+
+class _CountingSpace(MockSpace):
+
+    def __init__(self):
+        self.n_calls = 0
+
+    def distances(self, A, B, expand=False):
+        self.n_calls += 1
+        return super(_CountingSpace, self).distances(A, B, expand)
+
+
+def test_small_world_mask(monkeypatch):
+    MockSimulator.setup()
+
+    # Find the neighbours of three pre-neurons at a time
+    monkeypatch.setattr(small_world_connector, "_MAX_DISTANCES_SIZE", 60)
+    connector = SmallWorldConnector(degree=2.5, rewiring=0.0)
+    _set_up(connector, 20, 1.0, 1.0)
+    space = _CountingSpace()
+    connector.set_space(space)
+    positions = MockPopulation(20, "Pre").positions
+    expected = MockSpace().distances(positions, positions) < 2.5
+
+    mask = connector._get_mask()
+    assert space.n_calls == 7
+    assert list(mask) == list(numpy.flatnonzero(expected))
+
+    # The neurons at the ends have fewer neighbours
+    slices = [Slice(0, 9), Slice(10, 19)]
+    assert connector.get_n_connections_to_post_vertex_maximum() == 5
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        slices[0]) == 5
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        Slice(0, 1)) == 2
+    assert space.n_calls == 7
+
+    for pre_slice in slices:
+        for post_slice in slices:
+            sources, targets = connector._get_csr_block(
+                mask, 20, pre_slice.lo_atom, pre_slice.hi_atom,
+                post_slice.lo_atom, post_slice.hi_atom)
+            rows, columns = numpy.nonzero(
+                expected[pre_slice.as_slice, post_slice.as_slice])
+            assert list(sources) == list(rows + pre_slice.lo_atom)
+            assert list(targets) == list(columns + post_slice.lo_atom)
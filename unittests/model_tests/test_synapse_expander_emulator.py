@@ -0,0 +1,233 @@
+import numpy
+import pytest
+from spynnaker.pyNN.utilities.synapse_expander_emulator import \
+    KISS64RNG, emulate_synapse_expander
+from spynnaker.pyNN.utilities.synapse_expander_emulator import \
+    param_generators
+
+_SEED = [1234, 5678, 9012, 3456]
+
+# The number of words in the header of each row
+_HEADER = 3
+
+
+def _accum(value):
+    return int(round(value * 32768)) & 0xFFFFFFFF
+
+
+def _builder_data(
+        connector_id, connector_params, n_pre, n_post, max_row_n_synapses,
+        weight=(0, [_accum(1.5)]), delay=(0, [_accum(1.0)]), matrix_id=0,
+        matrix_params=(), max_stage=1, max_row_n_words=None):
+    # pylint: disable=too-many-arguments
+    if max_row_n_words is None:
+        max_row_n_words = max_row_n_synapses
+    return numpy.array(
+        [1, 0, n_post, 2, 1, 8, 16, 16] +
+        [0, 0xFFFFFFFF, max_row_n_words, 0, max_row_n_synapses, 0,
+         0, n_pre, max_stage, _accum(1.0), 1,
+         matrix_id, connector_id, weight[0], delay[0]] +
+        list(matrix_params) + list(connector_params) + list(weight[1]) +
+        list(delay[1]), dtype="uint32")
+
+
+def _read_static_rows(matrix, n_rows, max_row_n_words):
+    rows = list()
+    for row in range(n_rows):
+        address = row * (max_row_n_words + _HEADER)
+        n_synapses = matrix[address + 1]
+        rows.append(matrix[address + _HEADER:address + _HEADER + n_synapses])
+    return rows
+
+
+def test_kiss64_repeatable():
+    rng = KISS64RNG(_SEED)
+    first = rng.next_uint32(10)
+    second = rng.next_uint32(10)
+    assert not numpy.array_equal(first, second)
+    rng = KISS64RNG(_SEED)
+    assert numpy.array_equal(
+        rng.next_uint32(20), numpy.concatenate((first, second)))
+
+
+def test_all_to_all_static():
+    n_pre, n_post = 5, 4
+    matrix = numpy.zeros(n_pre * (n_post + _HEADER), dtype="uint32")
+    emulate_synapse_expander(
+        _builder_data(1, [0], n_pre, n_post, n_post), matrix)
+    for pre, row in enumerate(_read_static_rows(matrix, n_pre, n_post)):
+        targets = row & 0xFF
+        assert list(targets) == [i for i in range(n_post) if i != pre]
+        assert numpy.all((row >> 8) & 0x1 == 1)
+        assert numpy.all((row >> 9) & 0xFF == 1)
+        assert numpy.all(row >> 16 == 24)
+
+
+def test_one_to_one_static():
+    n_pre, n_post = 6, 4
+    matrix = numpy.zeros(n_pre * (1 + _HEADER), dtype="uint32")
+    emulate_synapse_expander(
+        _builder_data(0, [], n_pre, n_post, 1), matrix)
+    rows = _read_static_rows(matrix, n_pre, 1)
+    for pre, row in enumerate(rows):
+        assert list(row & 0xFF) == ([pre] if pre < n_post else [])
+
+
+@pytest.mark.parametrize("probability, expected", [(0, 0), (0xFFFFFFFF, 1)])
+def test_fixed_probability_extremes(probability, expected):
+    n_pre, n_post = 5, 5
+    matrix = numpy.zeros(n_pre * (n_post + _HEADER), dtype="uint32")
+    emulate_synapse_expander(_builder_data(
+        2, [1, probability] + _SEED, n_pre, n_post, n_post), matrix)
+    for row in _read_static_rows(matrix, n_pre, n_post):
+        assert len(row) == n_post * expected
+
+
+def test_fixed_probability_row_overflow():
+    n_pre, n_post = 4, 10
+    matrix = numpy.zeros(n_pre * (3 + _HEADER), dtype="uint32")
+    emulate_synapse_expander(_builder_data(
+        2, [1, 0xFFFFFFFF] + _SEED, n_pre, n_post, 3), matrix)
+    for row in _read_static_rows(matrix, n_pre, 3):
+        assert list(row & 0xFF) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("with_replacement", [0, 1])
+def test_fixed_total(with_replacement):
+    n_pre, n_post, n_connections = 10, 8, 30
+    matrix = numpy.zeros(n_pre * (n_post + _HEADER), dtype="uint32")
+    emulate_synapse_expander(_builder_data(
+        3, [1, with_replacement, n_connections, n_pre * n_post] + _SEED,
+        n_pre, n_post, n_post), matrix)
+    rows = _read_static_rows(matrix, n_pre, n_post)
+    assert sum(len(row) for row in rows) == n_connections
+    for row in rows:
+        targets = row & 0xFF
+        assert numpy.all(targets < n_post)
+        if not with_replacement:
+            assert len(numpy.unique(targets)) == len(targets)
+
+
+def test_uniform_weights():
+    n_pre, n_post = 20, 20
+    matrix = numpy.zeros(n_pre * (n_post + _HEADER), dtype="uint32")
+    emulate_synapse_expander(_builder_data(
+        1, [1], n_pre, n_post, n_post,
+        weight=(1, [_accum(1.0), _accum(3.0)] + _SEED)), matrix)
+    weights = numpy.concatenate(
+        _read_static_rows(matrix, n_pre, n_post)) >> 16
+
+    # Weights are scaled by 16 and truncated
+    assert numpy.all(weights >= 16) and numpy.all(weights < 48)
+    assert len(numpy.unique(weights)) > 1
+
+
+class _ListRNG(object):
+    """ Gives the values of a list, failing if more are asked for than the\
+        list has
+    """
+
+    def __init__(self, values):
+        self._values = list(values)
+
+    def next_uint32(self, n):
+        assert n <= len(self._values)
+        values, self._values = self._values[:n], self._values[n:]
+        return numpy.array(values, dtype="uint32")
+
+
+def test_exponential_dist_variate_draws():
+    rng = _ListRNG([
+        # A rising pair gives the first value
+        0x80000000, 0x90000000,
+        # A falling run of two starts again, adding one
+        0x40000000, 0x30000000, 0x38000000,
+        # A falling run of three gives the second value
+        0x20000000, 0x10000000, 0x08000000, 0x0C000000])
+    values = param_generators._exponential_dist_variate(rng, 2)
+    assert list(values) == [_accum(0.5), _accum(1.125)]
+
+    # Exactly the random values needed were drawn
+    assert rng.next_uint32(0).size == 0
+    with pytest.raises(AssertionError):
+        rng.next_uint32(1)
+
+
+def test_fixed_point_distributions_of_seed():
+    assert list(KISS64RNG(_SEED).next_uint32(4)) == [
+        584703662, 2872866130, 3720376759, 38524056]
+    assert list(param_generators._norminv_urt(
+        KISS64RNG(_SEED).next_uint32(4))) == [-35974, 14315, 36330, -77558]
+    assert list(param_generators._exponential_dist_variate(
+        KISS64RNG(_SEED), 4)) == [4460, 61984, 35390, 53420]
+
+
+def test_norminv_urt():
+    random_values = numpy.array(
+        [0, 1, 0x7FFFFFFF, 0x80000000, 0xFFFFFFFE, 0xFFFFFFFF],
+        dtype="uint32")
+    values = param_generators._norminv_urt(random_values)
+
+    # Values are symmetric about the middle of the range, and within the
+    # range of an accum
+    assert list(values) == list(-values[::-1])
+    assert values[3] == 0
+    assert values[0] == int(round(-6.337957754553790 * 32768))
+
+
+def _generated_weights(weight, n_pre=50, n_post=50):
+    matrix = numpy.zeros(n_pre * (n_post + _HEADER), dtype="uint32")
+    emulate_synapse_expander(_builder_data(
+        1, [1], n_pre, n_post, n_post, weight=weight), matrix)
+    return numpy.concatenate(
+        _read_static_rows(matrix, n_pre, n_post)) >> 16
+
+
+def test_normal_weights():
+    # Weights are scaled by 16 and truncated
+    weights = _generated_weights(
+        (2, [_accum(10.0), _accum(1.0)] + _SEED)) / 16.0
+    assert abs(numpy.mean(weights) - 10.0) < 0.1
+    assert abs(numpy.std(weights) - 1.0) < 0.1
+
+    weights = _generated_weights(
+        (3, [_accum(10.0), _accum(1.0), _accum(9.5), _accum(10.5)] + _SEED))
+    assert numpy.all(weights >= 9.5 * 16) and numpy.all(weights <= 10.5 * 16)
+    assert len(weights) == 50 * 50
+
+    # Values beyond the boundary are moved to it
+    weights = _generated_weights(
+        (4, [_accum(10.0), _accum(1.0), _accum(9.5), _accum(10.5)] + _SEED))
+    assert numpy.all(weights >= 9.5 * 16) and numpy.all(weights <= 10.5 * 16)
+    assert numpy.sum(weights == 9.5 * 16) > 100
+
+
+def test_exponential_weights():
+    weights = _generated_weights((5, [_accum(2.0)] + _SEED)) / 16.0
+    assert numpy.all(weights >= 0)
+    assert abs(numpy.mean(weights) - 2.0) < 0.15
+
+
+def test_stdp_rows():
+    n_pre, n_post = 3, 3
+    header_half_words, half_words_per_synapse = 2, 1
+
+    # plastic header (1 word) + 3 half-words padded to 2 words + 2 fixed
+    # sizes + 3 half-words in 2 words
+    max_row_n_words = 1 + 2 + 2 + 2
+    matrix = numpy.zeros(n_pre * (max_row_n_words + _HEADER), dtype="uint32")
+    emulate_synapse_expander(_builder_data(
+        1, [1], n_pre, n_post, n_post, matrix_id=1,
+        matrix_params=[header_half_words, half_words_per_synapse, 0],
+        max_row_n_words=max_row_n_words), matrix)
+    for pre in range(n_pre):
+        row = matrix[pre * (max_row_n_words + _HEADER):]
+        n_plastic_words = row[0]
+        assert n_plastic_words == 1 + 2
+        half_words = row.view("<u2")
+        assert list(half_words[4:7]) == [24, 24, 24]
+        fixed = row[1 + n_plastic_words:]
+        assert fixed[0] == 0
+        assert fixed[1] == n_post
+        assert list(fixed[2:].view("<u2")[:n_post] & 0xFF) == \
+            list(range(n_post))
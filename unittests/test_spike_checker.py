@@ -0,0 +1,51 @@
+import numpy
+import pytest
+from spynnaker.gsyn_tools import check_gsyn
+from spynnaker.spike_checker import (
+    synfire_multiple_lines_spike_checker, synfire_spike_checker)
+
+
+def test_synfire_spike_checker(tmpdir):
+    # Each of 3 neurons spiking in turn, as times and as timesteps
+    spike_ticks = numpy.array(
+        [[0, 0], [2, 2], [1, 1], [0, 3], [1, 4]], dtype="uint32")
+    spike_times = spike_ticks * [1.0, 0.1]
+    synfire_spike_checker(spike_ticks, 3)
+    synfire_spike_checker(spike_times, 3)
+    synfire_spike_checker([spike_ticks, spike_times], 3)
+
+    with tmpdir.as_cwd():
+        with pytest.raises(Exception):
+            synfire_spike_checker(spike_ticks, 2)
+
+
+def test_synfire_multiple_lines_spike_checker(tmpdir):
+    # Two lines from neuron 0, the second starting two timesteps later
+    spike_ticks = numpy.array(
+        [[0, 0], [1, 1], [0, 2], [2, 2], [1, 3], [3, 3]], dtype="uint32")
+    synfire_multiple_lines_spike_checker(spike_ticks, 4, 2, False)
+    synfire_multiple_lines_spike_checker(
+        spike_ticks * [1.0, 0.1], 4, 2, False)
+
+    with tmpdir.as_cwd():
+        with pytest.raises(Exception):
+            synfire_multiple_lines_spike_checker(spike_ticks, 4, 3, False)
+
+
+def test_check_gsyn():
+    gsyn = numpy.array([[0, 0.1, 1.02], [0, 0.2, 1.5], [1, 0.1, 2.0]])
+    check_gsyn(gsyn, gsyn + [0, 0, 0.01])
+    with pytest.raises(Exception):
+        check_gsyn(gsyn, gsyn[:2])
+    with pytest.raises(Exception):
+        check_gsyn(gsyn, gsyn + [0, 0, 0.1])
+
+    # Times in timesteps match the same times in milliseconds exactly
+    gsyn_ticks = numpy.array([[0, 1, 1], [0, 2, 2], [1, 1, 2]])
+    check_gsyn(gsyn_ticks, gsyn_ticks)
+    with pytest.raises(Exception):
+        check_gsyn(gsyn_ticks, gsyn_ticks + [0, 1, 0], 100)
+    times = numpy.array([[0, 0.1, 1], [0, 0.2, 2], [1, 0.1, 2]])
+    check_gsyn(gsyn_ticks, times, 100)
+    with pytest.raises(Exception):
+        check_gsyn(gsyn_ticks, times + [0, 0.1, 0], 100)
@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import numpy
+import pytest
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.utilities.columnar_recording import (
+    METADATA_FILE, read_columnar_recording, write_columnar_recording)
+
+
+def test_round_trip(tmpdir):
+    directory = str(tmpdir.join("recording"))
+    ids = numpy.array([0, 0, 3, 7, 7, 7, 9])
+    ticks = numpy.array([5, 9, 0, 1, 2, 200000, 4])
+    v = numpy.arange(35, dtype="float").reshape(7, 5) / 3.0
+    v[2, 1] = numpy.nan
+    write_columnar_recording(
+        directory, "pop", 1000,
+        spike_columns=iter([(ids[:3], ticks[:3]), (ids[3:3], ticks[3:3]),
+                            (ids[3:], ticks[3:])]),
+        signals={"v": (iter([v[:3], v[3:6], v[6:]]), [1, 2, 4, 8, 9], 0.5)})
+
+    recording = read_columnar_recording(directory)
+    assert recording["label"] == "pop"
+    assert recording["machine_time_step"] == 1000
+    assert recording["spikes"]["neuron_id"].dtype == "<u4"
+    assert numpy.array_equal(recording["spikes"]["neuron_id"], ids)
+    assert numpy.array_equal(recording["spikes"]["tick"], ticks)
+    signal = recording["signals"]["v"]
+    assert isinstance(signal["data"], numpy.memmap)
+    numpy.testing.assert_array_equal(signal["data"], v)
+    assert list(signal["indexes"]) == [1, 2, 4, 8, 9]
+    assert signal["sampling_interval"] == 0.5
+
+    # The files can be mapped using the metadata alone
+    with io.open(os.path.join(directory, METADATA_FILE)) as f:
+        metadata = json.load(f)
+    data = metadata["signals"]["v"]["data"]
+    mapped = numpy.memmap(
+        os.path.join(directory, data["file"]), dtype=data["dtype"],
+        mode="r", shape=tuple(data["shape"]))
+    numpy.testing.assert_array_equal(mapped, v)
+
+
+def test_empty(tmpdir):
+    directory = str(tmpdir)
+    write_columnar_recording(
+        directory, "pop", 1000, spike_columns=[],
+        signals={"v": ([], [], 1.0)})
+    recording = read_columnar_recording(directory)
+    assert len(recording["spikes"]["neuron_id"]) == 0
+    assert len(recording["spikes"]["tick"]) == 0
+    assert recording["signals"]["v"]["data"].shape == (0, 0)
+
+
+def test_no_spikes_recorded(tmpdir):
+    directory = str(tmpdir)
+    write_columnar_recording(directory, "pop", 1000)
+    recording = read_columnar_recording(directory)
+    assert "spikes" not in recording
+    assert recording["signals"] == {}
+
+
+def test_bad_chunk(tmpdir):
+    with pytest.raises(SpynnakerException):
+        write_columnar_recording(
+            str(tmpdir), "pop", 1000,
+            signals={"v": ([numpy.zeros((2, 3))], [1, 2], 1.0)})
+    with pytest.raises(SpynnakerException):
+        write_columnar_recording(
+            str(tmpdir), "pop", 1000,
+            spike_columns=[(numpy.zeros(2), numpy.zeros(3))])
+
+
+def test_not_columnar(tmpdir):
+    with io.open(str(tmpdir.join(METADATA_FILE)), "w") as f:
+        f.write(u"{}")
+    with pytest.raises(SpynnakerException):
+        read_columnar_recording(str(tmpdir))
@@ -0,0 +1,91 @@
+import numpy
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.common import recording_utils
+from spynnaker.pyNN.models.pynn_population_common import PyNNPopulationCommon
+from spynnaker.pyNN.utilities.spike_statistics import SpikeStatistics
+
+
+def _random_spikes(n_neurons, n_timesteps, n_spikes):
+    rng = numpy.random.RandomState(42)
+    keys = numpy.unique(rng.randint(0, n_neurons * n_timesteps, n_spikes))
+    return recording_utils.sort_spike_ticks(
+        keys // n_timesteps, keys % n_timesteps)
+
+
+def _isis(spikes):
+    """ The inter-spike intervals of each neuron, found one neuron at a time
+    """
+    isis = list()
+    for neuron in numpy.unique(spikes[:, 0]):
+        isis.extend(numpy.diff(spikes[spikes[:, 0] == neuron, 1]))
+    return numpy.array(isis, dtype="int64")
+
+
+def test_statistics_of_chunks():
+    spikes = _random_spikes(50, 200, 2000)
+    statistics = SpikeStatistics(
+        50, 200, 500, bin_width=5.0, isi_bin_width=1.0, max_isi=20.0)
+
+    # Chunks that split the spikes of neurons still give all the intervals
+    for chunk in numpy.array_split(spikes, 7):
+        statistics.add_spikes(chunk[:, 0], chunk[:, 1])
+
+    assert statistics.n_spikes == len(spikes)
+    assert list(statistics.spike_counts) == list(
+        numpy.bincount(spikes[:, 0], minlength=50))
+    assert numpy.allclose(
+        statistics.mean_rates, statistics.spike_counts / 0.1)
+
+    edges, counts = statistics.psth
+    expected, expected_edges = numpy.histogram(
+        spikes[:, 1] * 0.5, bins=numpy.arange(0, 100.5, 5.0))
+    assert numpy.allclose(edges, expected_edges)
+    assert list(counts) == list(expected)
+
+    edges, counts = statistics.isi_histogram
+    isi_bins = numpy.minimum(_isis(spikes) // 2, 20)
+    assert numpy.allclose(edges, numpy.arange(22))
+    assert list(counts) == list(numpy.bincount(isi_bins, minlength=21))
+
+
+def test_windowed_rates():
+    statistics = SpikeStatistics(2, 5, 1000, bin_width=2.0)
+    statistics.add_spikes([0, 0, 1, 1], [0, 4, 1, 3])
+    edges, rates = statistics.windowed_rates
+    assert list(edges) == [0.0, 2.0, 4.0, 6.0]
+
+    # The last window is only one timestep long
+    assert numpy.allclose(rates, [500.0, 250.0, 500.0])
+
+
+def test_no_spikes():
+    statistics = SpikeStatistics(3, 0, 1000)
+    statistics.add_spikes([], [])
+    assert statistics.n_spikes == 0
+    assert list(statistics.mean_rates) == [0, 0, 0]
+    assert len(statistics.psth[1]) == 0
+
+
+def test_bin_width_not_whole_timesteps():
+    with pytest.raises(ConfigurationException):
+        SpikeStatistics(3, 10, 1000, bin_width=1.5)
+    with pytest.raises(ConfigurationException):
+        SpikeStatistics(3, 10, 1000, isi_bin_width=0.0)
+
+
+class _MockVertex(object):
+    n_atoms = 4
+
+
+class _MockPopulation(object):
+    _vertex = _MockVertex()
+
+
+def test_get_spike_counts():
+    spikes = numpy.array([[0, 1.0], [2, 1.0], [2, 3.0]])
+    statistics = SpikeStatistics(4, 5, 1000)
+    statistics.add_spikes([0, 2, 2], [1, 1, 3])
+    for counted in (spikes, statistics):
+        assert PyNNPopulationCommon.get_spike_counts(
+            _MockPopulation(), counted) == {0: 1, 1: 0, 2: 2, 3: 0}
@@ -0,0 +1,63 @@
+import numpy
+from data_specification.enums import DataType
+from spynnaker.pyNN.models.neuron.implementations import Struct
+from spynnaker.pyNN.utilities.ranged import (
+    SpynnakerRangeDictionary, SpynnakerRangedList)
+from unittests.mocks import MockSimulator, MockRandomDistribution
+
+
+def test_random_values_drawn_once():
+    MockSimulator.setup()
+    ranged_list = SpynnakerRangedList(100, MockRandomDistribution(-70, -50))
+    values = ranged_list.get_array_by_slice(0, 100)
+    assert values.dtype == "float64"
+    assert numpy.all((values >= -70) & (values <= -50))
+
+    # Getting a slice again gives a view of the same values
+    first = ranged_list.get_array_by_slice(10, 20)
+    assert numpy.array_equal(first, values[10:20])
+    assert numpy.shares_memory(first, ranged_list.get_array_by_slice(10, 20))
+
+
+def test_set_redraws():
+    MockSimulator.setup()
+    ranged_dict = SpynnakerRangeDictionary(100)
+    distribution = MockRandomDistribution(-70, -50)
+    ranged_dict["v"] = distribution
+    before = ranged_dict["v"].get_array_by_slice(0, 100).copy()
+    ranged_dict["v"] = distribution
+    assert not numpy.array_equal(
+        before, ranged_dict["v"].get_array_by_slice(0, 100))
+
+    ranged_dict["v"] = -65.0
+    assert numpy.array_equal(
+        ranged_dict["v"].get_array_by_slice(5, 10), [-65.0] * 5)
+
+
+def test_range_based_array():
+    MockSimulator.setup()
+    ranged_list = SpynnakerRangedList(10, 1.0)
+    ranged_list[2:4] = 2.0
+    assert numpy.array_equal(
+        ranged_list.get_array_by_slice(1, 5), [1.0, 2.0, 2.0, 1.0])
+
+
+def test_struct_packing_is_reproducible():
+    MockSimulator.setup()
+    struct = Struct([DataType.S1615, DataType.UINT32])
+    ranged_dict = SpynnakerRangeDictionary(100)
+    ranged_dict["v"] = MockRandomDistribution(-70, -50)
+    ranged_dict["n"] = 3
+    values = [ranged_dict["v"], ranged_dict["n"]]
+
+    # Packing slices separately or together gives the same values each time
+    data = struct.get_data(values, 0, 100)
+    assert numpy.array_equal(data, struct.get_data(values, 0, 100))
+    words = struct.get_size_in_whole_words(50)
+    assert numpy.array_equal(data[:words], struct.get_data(values, 0, 50))
+    assert numpy.array_equal(data[words:], struct.get_data(values, 50, 50))
+
+    v, n = struct.read_data(bytearray(data.tobytes()), 0, 100)
+    assert numpy.allclose(
+        v, ranged_dict["v"].get_array_by_slice(0, 100), atol=1.0 / 32768)
+    assert numpy.array_equal(n, [3] * 100)
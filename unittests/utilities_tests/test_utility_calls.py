@@ -0,0 +1,143 @@
+from fractions import Fraction
+import logging
+import os
+import numpy
+import pytest
+from spinn_utilities import logger_utils
+from data_specification.enums import DataType
+from spynnaker.pyNN.utilities import utility_calls
+from spynnaker.pyNN.utilities.utility_calls import (
+    can_fork, convert_to_array, run_in_forked_pool)
+
+_FIXED_TYPES = [
+    data_type for data_type in DataType
+    if numpy.dtype(data_type.struct_encoding).kind != "f"]
+
+
+def _random_values(data_type, n_values, seed):
+    """ Values spread over the range of a type, including values exactly\
+        half way between the values the type can represent
+    """
+    rng = numpy.random.RandomState(seed)
+    low = float(data_type.min)
+    high = float(data_type.max)
+    values = rng.uniform(low, high, n_values)
+    halves = (numpy.floor(values * float(data_type.scale)) + 0.5) / float(
+        data_type.scale)
+    return numpy.concatenate([values, halves[halves <= high]])
+
+
+def _exact_conversion(value, data_type):
+    """ Scale a value exactly, round it half to even and saturate it at the\
+        limits of the type, one value at a time
+    """
+    scaled = Fraction(value) * Fraction(data_type.scale)
+    rounded = int(scaled)
+    if rounded > scaled:
+        rounded -= 1
+    if scaled - rounded > Fraction(1, 2) or (
+            scaled - rounded == Fraction(1, 2) and rounded % 2):
+        rounded += 1
+    info = numpy.iinfo(data_type.struct_encoding)
+    return min(max(rounded, info.min), info.max)
+
+
+@pytest.mark.parametrize("data_type", _FIXED_TYPES)
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_exact_conversion(data_type, seed):
+    values = _random_values(data_type, 200, seed)
+    expected = [_exact_conversion(value, data_type) for value in values]
+    converted = convert_to_array(values, data_type)
+    assert converted.dtype == numpy.dtype(data_type.struct_encoding)
+    assert converted.tolist() == expected
+
+
+@pytest.mark.parametrize("data_type", [
+    DataType.S1615, DataType.U032, DataType.INT32, DataType.UINT16,
+    DataType.S87, DataType.U88, DataType.S015])
+def test_boundaries(data_type):
+    scale = float(data_type.scale)
+    smallest = 1.0 / scale
+    values = [
+        float(data_type.min), float(data_type.max), 0.0, smallest,
+        smallest / 2, smallest * 1.5, -smallest / 2, -smallest * 1.5]
+    values = [value for value in values if data_type.min <= value]
+    assert convert_to_array(values, data_type).tolist() == [
+        _exact_conversion(value, data_type) for value in values]
+
+
+@pytest.mark.parametrize("data_type", _FIXED_TYPES)
+def test_saturation(data_type):
+    info = numpy.iinfo(numpy.dtype(data_type.struct_encoding))
+    low = float(data_type.min) - 1000.0
+    high = float(data_type.max) + 1000.0
+    converted = convert_to_array([low, high, -1e300, 1e300], data_type)
+    assert list(converted) == [info.min, info.max, info.min, info.max]
+
+
+def test_float_types():
+    values = numpy.array([0.25, -1.5, 1e10])
+    assert numpy.array_equal(
+        convert_to_array(values, DataType.FLOAT_64), values)
+    assert convert_to_array(values, DataType.FLOAT_32).dtype == "float32"
+
+
+def test_shapes():
+    assert convert_to_array([], DataType.S1615).shape == (0, )
+    assert convert_to_array(1.0, DataType.S1615) == 32768
+
+
+def _pids():
+    return os.getpid()
+
+
+def _inner_pids():
+    # A pool started by a worker runs its jobs in the worker
+    inner = list(run_in_forked_pool(
+        [(_pids, ()), (_pids, ())], 2, "testing"))
+    return os.getpid(), inner
+
+
+def test_forked_pool_in_worker():
+    results = list(run_in_forked_pool(
+        [(_inner_pids, ()) for _ in range(4)], 2, "testing"))
+    for pid, inner in results:
+        assert inner == [pid, pid]
+        if can_fork():
+            assert pid != os.getpid()
+
+
+def _arrays(n_values):
+    values = numpy.arange(n_values, dtype="uint32").reshape(-1, 4)
+    return values, [values[:1], (n_values, values.T)]
+
+
+def test_forked_pool_arrays(tmpdir, monkeypatch):
+    monkeypatch.setattr(utility_calls, "_SHARED_MEMORY_DIR", str(tmpdir))
+    sizes = [4, 100000, 400000]
+    results = list(run_in_forked_pool(
+        [(_arrays, (n_values, )) for n_values in sizes], 2, "testing"))
+    for n_values, (values, [first, (n, transposed)]) in zip(sizes, results):
+        expected = numpy.arange(n_values, dtype="uint32").reshape(-1, 4)
+        assert numpy.array_equal(values, expected)
+        assert numpy.array_equal(first, expected[:1])
+        assert numpy.array_equal(transposed, expected.T)
+        assert n == n_values
+
+    # The files the arrays were returned through are all removed
+    assert os.listdir(str(tmpdir)) == []
+
+
+def _warn(message):
+    logger_utils.warn_once(logging.getLogger(__name__), message)
+
+
+def test_forked_pool_warnings():
+    logger_utils.reset()
+    list(run_in_forked_pool(
+        [(_warn, ("warning {}".format(i), )) for i in range(4)], 2,
+        "testing"))
+
+    # Warnings given in the workers are not given again here
+    for i in range(4):
+        assert "warning {}".format(i) in logger_utils._already_issued